@@ -49,7 +49,9 @@ setup(
         "clover-energy >=5.3.0",
         "customtkinter>=5.2.0",
         "cx-Freeze >=6.15.5",
+        "numpy >=1.20.0",
         "pandas >=1.2.3",
+        "Pillow >=9.1.0",
         "PyYAML >=5.4.1",
         "RangeSlider>=2021.7.4",
         "seaborn >=0.11.1",
@@ -9,22 +9,25 @@
 # For more information, contact: benedict.winchester@gmail.com                         #
 ########################################################################################
 
+import copy
+import functools
+import multiprocessing
 import os
 import pkg_resources
+import sqlite3
 import ttkbootstrap as ttk
 
 from logging import Logger
 from subprocess import Popen
-
-import yaml
+from threading import Thread
+from typing import Any, Callable
 
 from clover import (
     get_locations_foldername,
     get_logger,
     INPUTS_DIRECTORY,
     Location,
-    parse_input_files,
-    read_yaml,
+    OperatingMode,
 )
 from clover.fileparser import (
     DEVICE_UTILISATIONS_INPUT_DIRECTORY,
@@ -35,6 +38,7 @@ from clover.fileparser import (
     OPTIMISATION_INPUTS_FILE,
     SCENARIOS,
 )
+from clover.__main__ import AUTO_GENERATED_FILES_DIRECTORY
 from clover.impact.finance import ImpactingComponent
 from clover.scripts.new_location import create_new_location
 from ttkbootstrap.constants import *
@@ -58,24 +62,65 @@ from .__utils__ import (
     IMAGES_DIRECTORY,
     MAIN_WINDOW_GEOMETRY,
     MENU_BAR_FONTSIZE,
-    parse_battery_inputs,
-    parse_diesel_inputs,
-    parse_solar_inputs,
     RENEWABLES_NINJA_TOKEN,
     START_YEAR,
     SYSTEM_LIFETIME,
     THEME,
     update_location_information,
 )
+from .autosave import Autosaver
+from .column_cache import cache_run_columns
 from .configuration import ConfigurationScreen
 from .details.details import DetailsWindow
-from .load_location import LoadLocationWindow
+from .input_writer import InputFileWriter
+from .load_location import (
+    LocationInputs,
+    LocationLoader,
+    LoadLocationWindow,
+    pregenerate_grid_profiles,
+)
+from .location_archive import ExportLocationWindow, ImportLocationWindow
+from .location_clone import CloneLocationWindow
 from .main_menu import MainMenuScreen
 from .new_location import NewLocationScreen
 from .splash_screen import SplashScreenWindow
 from .preferences import PreferencesWindow
 from .post_run import PostRunScreen
+from .result_cache import compute_input_hash
+from .run_history import location_run_history, RunHistoryWindow
+from .run_queue import RunJob, RunQueueWindow
+from .run_timings import RunTimings
 from .running import RunScreen
+from .worker_pool import CloverWorkerRun, get_worker_pool, shutdown_worker_pool
+from .yaml_io import read_yaml
+
+# Device utilisations:
+#   Keyword for saving the device-utilisation profile open for editing.
+DEVICE_UTILISATIONS: str = "device_utilisations"
+
+# Energy-system inputs:
+#   Keyword for saving energy-system inputs information.
+ENERGY_SYSTEM_INPUTS: str = os.path.basename(ENERGY_SYSTEM_INPUTS_FILE).split(".")[0]
+
+# Finance inputs:
+#   Keyword for saving finance inputs information.
+FINANCE_INPUTS: str = os.path.basename(FINANCE_INPUTS_FILE).split(".")[0]
+
+# GHG inputs:
+#   Keyword for saving GHG inputs information.
+GHG_INPUTS: str = os.path.basename(GHG_INPUTS_FILE).split(".")[0]
+
+# Grid times:
+#   Keyword for saving grid-times information.
+GRID_TIMES: str = os.path.basename(GRID_TIMES_FILE).split(".")[0]
+
+# Location inputs:
+#   Keyword for saving location inputs information.
+LOCATION_INPUTS: str = "location_inputs"
+
+# Optimisation inputs:
+#   Keyword for saving optimisation inputs information.
+OPTIMISATION_INPUTS: str = os.path.basename(OPTIMISATION_INPUTS_FILE).split(".")[0]
 
 # Solar inputs:
 #   Keyword for saving solar inputs information.
@@ -156,6 +201,22 @@ class App(ttk.Window):
             label="Save", command=self.save_configuration, font=("", MENU_BAR_FONTSIZE)
         )
         self.file_menu.add_separator()
+        self.file_menu.add_command(
+            label="Clone location",
+            command=self.save_and_open_clone_location_window,
+            font=("", MENU_BAR_FONTSIZE),
+        )
+        self.file_menu.add_command(
+            label="Export location",
+            command=self.save_and_open_export_location_window,
+            font=("", MENU_BAR_FONTSIZE),
+        )
+        self.file_menu.add_command(
+            label="Import location",
+            command=self.open_import_location_window,
+            font=("", MENU_BAR_FONTSIZE),
+        )
+        self.file_menu.add_separator()
         self.file_menu.add_command(
             label="Exit", command=self.quit, font=("", MENU_BAR_FONTSIZE)
         )
@@ -174,6 +235,22 @@ class App(ttk.Window):
             label="Edit", menu=self.edit_menu, font=("TkDefaultFont", MENU_BAR_FONTSIZE)
         )
 
+        # Runs menu
+        self.runs_menu = ttk.Menu(self.menu_bar, tearoff=0)
+        self.runs_menu.add_command(
+            label="Run queue",
+            command=self.open_run_queue_window,
+            font=("", MENU_BAR_FONTSIZE),
+        )
+        self.runs_menu.add_command(
+            label="Run history",
+            command=self.open_run_history_window,
+            font=("", MENU_BAR_FONTSIZE),
+        )
+        self.menu_bar.add_cascade(
+            label="Runs", menu=self.runs_menu, font=("TkDefaultFont", MENU_BAR_FONTSIZE)
+        )
+
         # Help menu
         self.help_menu = ttk.Menu(self.menu_bar, tearoff=0)
         self.help_menu.add_command(
@@ -205,6 +282,103 @@ class App(ttk.Window):
             ),
         )
 
+    def add_run_to_queue(
+        self,
+        clover_args: list[str],
+        location_name: str,
+        operating_mode: OperatingMode,
+        output_directory: str,
+        run_log_filepath: str,
+    ) -> RunJob:
+        """
+        Add a CLOVER run to the run queue and show the queue.
+
+        :param: clover_args
+            The arguments to pass to CLOVER.
+
+        :param: location_name
+            The name of the location being run.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: output_directory
+            The directory into which CLOVER will save the outputs from the run.
+
+        :param: run_log_filepath
+            The path to the file in which to save the stdout from the run.
+
+        :returns:
+            The job created.
+
+        """
+
+        if self.run_queue_window is None:
+            self.run_queue_window = RunQueueWindow(
+                self.record_queued_run, self.open_run_outputs
+            )
+
+        job = self.run_queue_window.add_run(
+            clover_args,
+            location_name,
+            operating_mode,
+            output_directory,
+            run_log_filepath,
+            self.input_hasher(clover_args),
+        )
+        self.run_queue_window.deiconify()
+
+        return job
+
+    def compute_input_hash(self, clover_args: list[str]) -> str:
+        """
+        Compute the hash of the inputs to a CLOVER run of the current location.
+
+        :param: clover_args
+            The arguments passed to CLOVER.
+
+        :returns:
+            The hash of the input files, auto-generated profiles and arguments.
+
+        """
+
+        return self.input_hasher(clover_args)()
+
+    def input_hasher(self, clover_args: list[str]) -> Callable[[], str]:
+        """
+        Return a function which hashes the inputs to a run of the current location.
+
+        The input files are those of the current location, even if another location is
+        loaded before the function is called, whilst their contents are read when the
+        function is called.
+
+        :param: clover_args
+            The arguments passed to CLOVER.
+
+        :returns:
+            A callable function which returns the hash of the input files,
+            auto-generated profiles and arguments.
+
+        """
+
+        location_directory = os.path.join(
+            get_locations_foldername(), self.location_name.get()
+        )
+
+        return functools.partial(
+            compute_input_hash,
+            list(clover_args),
+            list(self.input_file_info.values()),
+            [
+                os.path.join(
+                    location_directory,
+                    INPUTS_DIRECTORY,
+                    DEVICE_UTILISATIONS_INPUT_DIRECTORY,
+                ),
+                os.path.join(location_directory, AUTO_GENERATED_FILES_DIRECTORY),
+            ],
+        )
+
     def center_window(self) -> None:
         """
         Helper function to aid centering the window.
@@ -242,49 +416,110 @@ class App(ttk.Window):
             )
             return
 
+        try:
+            coordinates = [float(latitude), float(longitude), float(time_zone)]
+        except ValueError:
+            self.new_location_frame.warning_text_label.configure(
+                text="The latitude, longitude and time zone must be numbers.",
+            )
+            return
+
         self.new_location_progress_bar: ttk.Progressbar = ttk.Progressbar(
             self.new_location_frame, bootstyle=f"{SUCCESS}-striped", mode="determinate"
         )
         self.new_location_progress_bar.grid(
             row=6, column=1, columnspan=5, pady=5, padx=10, sticky="ew"
         )
-        self.new_location_progress_bar.start()
         self.new_location_progress_bar["value"] = 0
+        self.new_location_frame.create_location_button.configure(state=DISABLED)
 
-        # Create the new location.
-        try:
-            create_new_location(None, new_location_name, self.logger, False)
-        except SystemExit:
-            self.logger.error("New location name already used.")
+        def create_location(report_stage: Callable[[str, float], None]) -> None:
+            """
+            Create the new location from the template and set its coordinates.
+
+            This is run in the background thread of the location loader and so must
+            not make any calls to tkinter.
+
+            :param: report_stage
+                Reports each stage reached along with the progress at that stage.
+
+            """
+
+            report_stage(f"Creating {new_location_name}", 0)
+            try:
+                create_new_location(None, new_location_name, self.logger, False)
+            except SystemExit:
+                self.logger.error("New location name already used.")
+                raise FileExistsError(
+                    f"Failed to create '{new_location_name}'. Check that the location "
+                    "does not already exist."
+                ) from None
+
+            # Update the entries in the files wrt latitude, longitude and time zone.
+            report_stage("Setting the location's coordinates", 20)
+            update_location_information(
+                os.path.join(
+                    get_locations_foldername(), new_location_name, INPUTS_DIRECTORY
+                ),
+                coordinates[0],
+                self.logger,
+                coordinates[1],
+                coordinates[2],
+            )
+            report_stage(f"Parsing {new_location_name}", 30)
+
+        def location_failed(exception: Exception) -> None:
+            """
+            Called if the location could not be created or parsed.
+
+            :param: exception
+                The exception raised.
+
+            """
+
+            self.new_location_progress_bar.grid_forget()
+            self.new_location_frame.create_location_button.configure(state="enabled")
             self.new_location_frame.warning_text_label.configure(
-                text=f"Failed to create '{new_location_name}'. Check that the location "
-                "does not already exist.",
+                bootstyle=DANGER, text=str(exception)
             )
-            return
 
-        self.new_location_progress_bar["value"] = 50
+        def location_loaded() -> None:
+            """Move from the new-location screen once the location has loaded."""
 
-        self.inputs_directory_relative_path = os.path.join(
-            get_locations_foldername(),
-            new_location_name,
-            INPUTS_DIRECTORY,
-        )
+            self.new_location_progress_bar.grid_forget()
+            self.new_location_frame.create_location_button.configure(state="enabled")
+            self.new_location_frame.warning_text_label.configure(
+                bootstyle=DANGER, text=""
+            )
+            self.new_location_frame.pack_forget()
+            BaseScreen.add_screen_moving_forward(self.new_location_frame)
+            self.configuration_screen.pack(fill="both", expand=True)
 
-        # Update the entries in the files wrt latitude, longitude and time zone.
-        update_location_information(
-            self.inputs_directory_relative_path,
-            latitude,
-            self.logger,
-            longitude,
-            time_zone,
-        )
+        def set_status(status: str) -> None:
+            """
+            Display the stage reached in creating the location.
 
-        # Open the location being considered.
-        self.load_location(new_location_name, self.new_location_progress_bar)
+            :param: status
+                A description of the stage.
 
-        self.new_location_frame.pack_forget()
-        BaseScreen.add_screen_moving_forward(self.new_location_frame)
-        self.configuration_screen.pack(fill="both", expand=True)
+            """
+
+            self.new_location_frame.warning_text_label.configure(
+                bootstyle=SECONDARY, text=status
+            )
+
+        # Create, parse and open the location in the background.
+        self.load_location(
+            new_location_name,
+            self.new_location_progress_bar,
+            location_loaded,
+            prepare=create_location,
+            set_status=set_status,
+            follow_up=lambda inputs: pregenerate_grid_profiles(
+                new_location_name, inputs, self.logger
+            ),
+            load_failed_callback=location_failed,
+        )
 
     @property
     def data_directory(self) -> str:
@@ -302,14 +537,161 @@ class App(ttk.Window):
 
         return self._data_directory
 
+    def _location_population_steps(
+        self, location_name: str, inputs: LocationInputs
+    ) -> list[Callable]:
+        """
+        Return the steps with which to display the inputs of a location.
+
+        :param: location_name
+            The name of the location being loaded.
+
+        :param: inputs
+            The parsed inputs of the location.
+
+        :returns:
+            The steps, each of which is carried out in a separate callback.
+
+        """
+
+        def set_location() -> None:
+            """Save the location and update the max-years variable."""
+
+            self.input_file_info = inputs.input_file_info
+            self.inputs_directory_relative_path = os.path.join(
+                get_locations_foldername(), location_name, INPUTS_DIRECTORY
+            )
+            self.location = inputs.location
+            self.location.max_years = 30
+
+        def set_configuration() -> None:
+            """Set the scenarios and minigrid on the configuration screen."""
+
+            self.configuration_screen.configuration_frame.set_scenarios(
+                inputs.scenarios
+            )
+            self.configuration_screen.configuration_frame.set_minigrid(
+                inputs.batteries[0],
+                inputs.diesel_generators[0],
+                inputs.scenarios[0].grid_type,
+                inputs.minigrid,
+                inputs.pv_panels[0],
+            )
+
+        def set_generators() -> None:
+            """Set the diesel fuel and generators."""
+
+            self.details_window.diesel_frame.set_fuel_impact(
+                inputs.finance_inputs[ImpactingComponent.DIESEL_FUEL.value]
+            )
+            self.details_window.diesel_frame.generator_frame.set_generators(
+                inputs.minigrid.diesel_generator, *inputs.diesel_generators
+            )
+
+        return [
+            set_location,
+            set_configuration,
+            lambda: self.configuration_screen.simulation_frame.set_simulation(
+                inputs.simulations[0]
+            ),
+            lambda: self.configuration_screen.optimisation_frame.set_optimisation(
+                inputs.optimisations[0], inputs.optimisation_inputs
+            ),
+            lambda: self.details_window.solar_frame.set_solar(*inputs.pv_panels),
+            lambda: self.details_window.storage_frame.battery_frame.set_batteries(
+                *inputs.batteries
+            ),
+            lambda: self.details_window.load_frame.set_loads(
+                inputs.device_utilisations,
+                os.path.join(
+                    get_locations_foldername(),
+                    location_name,
+                    INPUTS_DIRECTORY,
+                    DEVICE_UTILISATIONS_INPUT_DIRECTORY,
+                ),
+            ),
+            set_generators,
+            lambda: self.details_window.grid_frame.set_profiles(
+                inputs.grid_times, inputs.finance_inputs
+            ),
+            lambda: self.details_window.finance_frame.set_finance_inputs(
+                inputs.finance_inputs, self.logger
+            ),
+            lambda: self.details_window.ghgs_frame.set_ghg_inputs(
+                inputs.ghg_inputs, self.logger
+            ),
+            lambda: self.details_window.system_frame.set_system(
+                inputs.location, inputs.minigrid
+            ),
+        ]
+
+    def cancel_load_location(self) -> None:
+        """Cancel the loading of a location."""
+
+        if (location_loader := self.location_loader) is None:
+            return
+
+        location_loader.cancel()
+        self.location_loader = None
+
+        if self.load_location_window is not None:
+            self.load_location_window.reset_progress_bar(
+                f"Cancelled loading {location_loader.location_name}"
+            )
+
+        if not location_loader.populating:
+            return
+
+        # The screens hold part of the cancelled location's inputs, which must not be
+        # saved over the inputs of the location previously loaded.
+        self.location_name.set("")
+        if self.configuration_screen.winfo_ismapped():
+            self.configuration_screen.pack_forget()
+            self.main_menu_frame.pack(fill="both", expand=True)
+
     def load_location(
         self,
         load_location_name: str | None = None,
         progress_bar: ttk.Progressbar | None = None,
+        location_loaded_callback: Callable | None = None,
+        *,
+        prepare: Callable[[Callable[[str, float], None]], None] | None = None,
+        set_status: Callable[[str], None] | None = None,
+        follow_up: Callable[[LocationInputs], None] | None = None,
+        load_failed_callback: Callable[[Exception], None] | None = None,
     ) -> None:
         """
         Called when the load-location button is deptressed in the load-location window.
 
+        The location's inputs are parsed in a background thread, after which they are
+        displayed step by step so that the window remains responsive throughout.
+
+        :param: load_location_name
+            The name of the location to load, defaults to the location selected in the
+            load-location window.
+
+        :param: progress_bar
+            The progress bar with which to display the progress of the load, defaults to
+            that of the load-location window.
+
+        :param: location_loaded_callback
+            A callable function to call once the location has been loaded.
+
+        :param: prepare
+            If specified, run in the background before the location is parsed, as
+            described in :class:`LocationLoader`.
+
+        :param: set_status
+            If specified, a callable function which displays each stage of the load.
+
+        :param: follow_up
+            If specified, run in the background once the location has been parsed, as
+            described in :class:`LocationLoader`.
+
+        :param: load_failed_callback
+            A callable function to call, with the exception raised, if the location
+            could not be loaded.
+
         """
 
         if load_location_name is None:
@@ -321,6 +703,10 @@ class App(ttk.Window):
             progress_bar = self.load_location_window.load_location_frame.progress_bar
             self.load_location_window.display_progress_bar()
 
+        # Only one location can be loaded at a time.
+        if self.location_loader is not None:
+            self.location_loader.cancel()
+
         def set_progress_bar_progress(value) -> None:
             """
             Sets the value of the progress bar.
@@ -330,153 +716,83 @@ class App(ttk.Window):
 
             """
 
+            progress_bar.stop()
             progress_bar["value"] = value
-            self.update()
-            if self.load_location_window is not None:
-                self.load_location_window.update()
-            self.new_location_frame.update()
-
-        # Parse input files
-        (
-            converters,
-            device_utilisations,
-            minigrid,
-            finance_inputs,
-            ghg_inputs,
-            global_settings_inputs,
-            grid_times,
-            location,
-            optimisation_inputs,
-            optimisations,
-            scenarios,
-            simulations,
-            total_clean_water_load_profile,
-            total_electric_load_profile,
-            water_source_times,
-            input_file_info,
-        ) = parse_input_files(
-            None,
-            False,
-            None,
-            load_location_name,
-            get_locations_foldername(),
-            self.logger,
-            None,
-        )
-        self.input_file_info = input_file_info
-        set_progress_bar_progress(100 * (percent_fraction := 1 / 12))
-
-        # Combine the inputs, to phase out.
-        finance_inputs[ImpactingComponent.GRID.value].update(
-            ghg_inputs[ImpactingComponent.GRID.value]
-        )
 
-        # Save the location and update the max-years variable
-        self.location = location
-        self.location.max_years = 30
-
-        # Load the PV and battery input files as these are not returned in CLOVER as a whole
-        self.inputs_directory_relative_path = os.path.join(
-            get_locations_foldername(),
-            load_location_name,
-            INPUTS_DIRECTORY,
-        )
-        pv_panels, pv_panel_costs, pv_panel_emissions = parse_solar_inputs(
-            self.inputs_directory_relative_path,
-            self.logger,
-        )
+        def load_failed(exception: Exception) -> None:
+            """
+            Called if the location's inputs could not be parsed.
 
-        batteries, battery_costs, battery_emissions = parse_battery_inputs(
-            self.inputs_directory_relative_path, self.logger
-        )
+            :param: exception
+                The exception raised whilst parsing the inputs.
 
-        diesel_generators, diesel_costs, diesel_emissions = parse_diesel_inputs(
-            self.inputs_directory_relative_path, self.logger
-        )
+            """
 
-        # Set all inputs accordingly
-        self.configuration_screen.configuration_frame.set_scenarios(scenarios)
-        self.configuration_screen.configuration_frame.set_minigrid(
-            batteries, diesel_generators, scenarios[0].grid_type, minigrid, pv_panels
-        )
-        set_progress_bar_progress(200 * percent_fraction)
+            self.location_loader = None
+            progress_bar.stop()
+            progress_bar["value"] = 0
+            if load_failed_callback is not None:
+                load_failed_callback(exception)
+            elif self.load_location_window is not None:
+                self.load_location_window.reset_progress_bar(
+                    f"Failed to load {load_location_name}: {exception}"
+                )
 
-        self.configuration_screen.simulation_frame.set_simulation(simulations[0])
-        set_progress_bar_progress(300 * percent_fraction)
+        def load_completed(
+            input_file_digests: dict[str, tuple[str, tuple[int, int] | None]]
+        ) -> None:
+            """
+            Called once the location has been loaded.
 
-        self.configuration_screen.optimisation_frame.set_optimisation(
-            optimisations[0], optimisation_inputs
-        )
-        set_progress_bar_progress(400 * percent_fraction)
+            :param: input_file_digests
+                The digests of the location's input files, computed as they were
+                parsed.
 
-        self.details_window.solar_frame.set_solar(
-            pv_panels, pv_panel_costs, pv_panel_emissions
-        )
-        set_progress_bar_progress(500 * percent_fraction)
+            """
 
-        # self.details_window.solar_frame.set_solar(
-        #     pv_panels, pv_panel_costs, pv_panel_emissions
-        # )
-        # set_progress_bar_progress(50 * percent_fraction)
+            self.location_loader = None
 
-        self.details_window.storage_frame.battery_frame.set_batteries(
-            batteries, battery_costs, battery_emissions
-        )
-        set_progress_bar_progress(600 * percent_fraction)
+            # Close the load-location window once completed
+            if self.load_location_window is not None:
+                self.load_location_window.reset_progress_bar()
+                self.load_location_window.withdraw()
+                BaseScreen.add_screen_moving_forward(self.main_menu_frame)
+            set_progress_bar_progress(0)
+
+            # Clear the main-menu screen.
+            self.main_menu_frame.pack_forget()
+
+            # Clear the CLOVER run screen.
+            self.run_screen.clover_progress_bar["value"] = 0
+            self.run_screen.clover_progress_bar.configure(
+                bootstyle=f"{SUCCESS}-striped"
+            )
+            self.run_screen.post_run_button.configure(state="disabled")
+            self.post_run_screen.pack_forget()
 
-        self.details_window.load_frame.set_loads(
-            device_utilisations,
-            os.path.join(
-                get_locations_foldername(),
-                load_location_name,
-                INPUTS_DIRECTORY,
-                DEVICE_UTILISATIONS_INPUT_DIRECTORY,
-            ),
-        )
-        set_progress_bar_progress(700 * percent_fraction)
+            self.configuration_screen.pack(fill="both", expand=True)
+            self.configuration_screen.set_location(load_location_name)
+            self.location_name.set(load_location_name)
 
-        self.details_window.diesel_frame.set_fuel_impact(
-            finance_inputs[ImpactingComponent.DIESEL_FUEL.value]
-        )
-        self.details_window.diesel_frame.generator_frame.set_generators(
-            minigrid.diesel_generator, diesel_generators, diesel_costs, diesel_emissions
-        )
-        # self.details_window.diesel_frame.heater_frame.set_water_heaters(minigrid.diesel_water_heater)
-        set_progress_bar_progress(800 * percent_fraction)
+            # Nothing needs saving until the loaded inputs are changed.
+            self.input_file_writer.mark_files_clean(input_file_digests)
+            self.autosaver.mark_clean()
 
-        self.details_window.grid_frame.set_profiles(grid_times, finance_inputs)
-        set_progress_bar_progress(900 * percent_fraction)
+            if location_loaded_callback is not None:
+                location_loaded_callback()
 
-        self.details_window.finance_frame.set_finance_inputs(
-            finance_inputs, self.logger
+        self.location_loader = LocationLoader(
+            self,
+            load_location_name,
+            self.logger,
+            lambda inputs: self._location_population_steps(load_location_name, inputs),
+            load_completed,
+            load_failed,
+            set_progress_bar_progress,
+            prepare,
+            set_status,
+            follow_up,
         )
-        set_progress_bar_progress(1000 * percent_fraction)
-
-        self.details_window.ghgs_frame.set_ghg_inputs(ghg_inputs, self.logger)
-        set_progress_bar_progress(1100 * percent_fraction)
-
-        self.details_window.system_frame.set_system(location, minigrid)
-        set_progress_bar_progress(1200 * percent_fraction)
-
-        # Close the load-location window once completed
-        if self.load_location_window is not None:
-            self.load_location_window.withdraw()
-            BaseScreen.add_screen_moving_forward(self.main_menu_frame)
-        set_progress_bar_progress(0)
-        progress_bar.stop()
-
-        # Clear the main-menu screen.
-        self.main_menu_frame.pack_forget()
-
-        # Clear the CLOVER run screen.
-        self.run_screen.clover_progress_bar["value"] = 0
-        self.run_screen.clover_progress_bar.configure(bootstyle=f"{SUCCESS}-striped")
-        self.run_screen.post_run_button.configure(state="disabled")
-        self.post_run_screen.pack_forget()
-
-        self.configuration_screen.pack(fill="both", expand=True)
-        self.configuration_screen.set_location(load_location_name)
-        self.location_name.set(load_location_name)
 
     def open_configuration(self) -> None:
         """
@@ -507,6 +823,7 @@ class App(ttk.Window):
                 self.configuration_screen.configuration_frame.add_grid_profile,
                 self.configuration_screen.configuration_frame.add_pv_panel,
                 self.data_directory,
+                self.input_file_writer,
                 self.renewables_ninja_token,
                 self.save_configuration,
                 self.configuration_screen.configuration_frame.set_batteries,
@@ -515,6 +832,7 @@ class App(ttk.Window):
                 self.configuration_screen.configuration_frame.set_pv_panels,
                 self.system_lifetime,
             )
+            self._watch_edits()
         else:
             self.details_window.deiconify()
         self.details_window.details_notebook.select(tab_id)
@@ -538,17 +856,41 @@ class App(ttk.Window):
         BaseScreen.add_screen_moving_forward(self.post_run_screen)
         self.new_location_frame.pack(fill="both", expand=True)
 
+    def open_import_location_window(self) -> None:
+        """Open the import-location window."""
+
+        ImportLocationWindow(self.logger)
+
     def open_load_location_window(self) -> None:
         """Open the load-location window."""
 
         if self.load_location_window is None:
             self.load_location_window: LoadLocationWindow | None = LoadLocationWindow(
-                self.load_location
+                self.cancel_load_location, self.load_location, self.logger
             )
         else:
             self.load_location_window.deiconify()
+            self.load_location_window.load_location_frame.refresh_location_index()
         self.load_location_window.mainloop()
 
+    def save_and_open_clone_location_window(self) -> None:
+        """Save the current location then open the clone-location window."""
+
+        if (location_name := self.location_name.get()) == "":
+            return
+
+        self.save_configuration()
+        CloneLocationWindow(location_name, self.logger)
+
+    def save_and_open_export_location_window(self) -> None:
+        """Save the current location then open the export-location window."""
+
+        if (location_name := self.location_name.get()) == "":
+            return
+
+        self.save_configuration()
+        ExportLocationWindow(location_name, self.logger)
+
     def save_and_open_load_location_window(self) -> None:
         """Save the current location then open the load-location window."""
 
@@ -583,8 +925,74 @@ class App(ttk.Window):
             self.preferences_window.deiconify()
         self.preferences_window.mainloop()
 
-    def open_run_screen(self, clover_thread: Popen) -> None:
-        """Moves to the run page"""
+    def open_run_outputs(self, output_directory: str) -> None:
+        """
+        Moves to the post-run screen to view the outputs of a queued run.
+
+        :param: output_directory
+            The directory containing the outputs of the run.
+
+        """
+
+        self.post_run_screen.update_output_directory_name(output_directory)
+
+        for screen in (
+            self.configuration_screen,
+            self.main_menu_frame,
+            self.new_location_frame,
+            self.run_screen,
+        ):
+            if screen.winfo_ismapped():
+                screen.pack_forget()
+                BaseScreen.add_screen_moving_forward(screen)
+
+        self.post_run_screen.pack(fill="both", expand=True)
+        self.post_run_screen.update_outputs_availability()
+
+    def open_run_history_window(self) -> None:
+        """Open the run-history window for the current location."""
+
+        if (location_name := self.location_name.get()) == "":
+            return
+
+        RunHistoryWindow(
+            location_name, self.open_run_outputs, location_run_history(location_name)
+        )
+
+    def open_run_queue_window(self) -> None:
+        """Open the run-queue window."""
+
+        if self.run_queue_window is None:
+            self.run_queue_window = RunQueueWindow(
+                self.record_queued_run, self.open_run_outputs
+            )
+        else:
+            self.run_queue_window.deiconify()
+
+    def open_run_screen(
+        self,
+        clover_thread: CloverWorkerRun | Popen,
+        output_directory: str,
+        run_log_filepath: str,
+        run_finished_callback: Callable | None = None,
+    ) -> None:
+        """
+        Moves to the run page
+
+        :param: clover_thread
+            The process in which CLOVER is running.
+
+        :param: output_directory
+            The directory into which CLOVER will save the outputs from the run.
+
+        :param: run_log_filepath
+            The path to the file in which to save the stdout from the run.
+
+        :param: run_finished_callback
+            A callable function to call, with the return code and timings of the run,
+            once the run has finished.
+
+        """
 
         self.configuration_screen.pack_forget()
         BaseScreen.add_screen_moving_forward(self.configuration_screen)
@@ -595,8 +1003,10 @@ class App(ttk.Window):
             text="Launching CLOVER", style="CourierSuccess.TLabel"
         )
         self.run_screen.post_run_button.configure(state=DISABLED)
-        self.run_screen.stdout_data = ""
-        self.run_screen.run_with_clover(clover_thread)
+        self.run_screen.clear_stdout()
+        self.run_screen.run_with_clover(
+            clover_thread, output_directory, run_log_filepath, run_finished_callback
+        )
 
     def read_global_settings(
         self, logger: Logger
@@ -643,148 +1053,242 @@ class App(ttk.Window):
             ttk.StringVar(self, global_settings_yaml.get(THEME, DEFAULT_GUI_THEME)),
         )
 
-    def save_configuration(self) -> None:
+    def _configuration_snapshot(
+        self, sources: set[str] | None = None
+    ) -> dict[str, Any] | None:
         """
-        Saves the current configuration.
+        Take a snapshot of the current configuration.
+
+        The snapshot holds copies of the data shown on the screens, so that it can be
+        serialised and saved in the background whilst the screens are edited further.
+
+        :param: sources
+            The names of the input files to include, or `None` to include them all.
+
+        :returns:
+            A mapping between the path to each input file and its contents, or `None`
+            if no location is open.
 
         """
 
         # Don't attempt to save the configuration if no location has been loaded before
-        # the user quits the application or proceeds to a subsequent step.
-        if self.location_name.get() == "":
-            return
-
-        # Save the location information
-        location_dict = self.location.as_dict
-        location_dict.update(self.details_window.system_frame.location_dict)
-
-        with open(
-            self.input_file_info["location_inputs"],
-            "w",
-            encoding=(_encoding := "utf-8"),
-        ) as location_inputs_file:
-            yaml.dump(location_dict, location_inputs_file)
-
-        # Save the battery information
-        with open(
-            self.input_file_info[BATTERIES], "w", encoding=_encoding
-        ) as battery_inputs_file:
-            yaml.dump(
-                self.details_window.storage_frame.battery_frame.batteries,
-                battery_inputs_file,
+        # the user quits the application or proceeds to a subsequent step, or whilst the
+        # screens are being populated with a location.
+        if self.location_name.get() == "" or self.location_loader is not None:
+            return None
+
+        def location_information() -> dict[str, Any]:
+            """Determine the location information."""
+
+            location_dict = self.location.as_dict
+            location_dict.update(self.details_window.system_frame.location_dict)
+            return location_dict
+
+        def energy_system_information() -> dict[str, Any]:
+            """Determine the energy_system information."""
+
+            # Update the energy-system information with component selection from the
+            # scenarios screen.
+            energy_system_dict = self.details_window.system_frame.minigrid_dict
+            energy_system_dict.update(
+                self.configuration_screen.configuration_frame.energy_system_dict
             )
+            return energy_system_dict
+
+        def impact_information(impact_frame: Any) -> dict[str, Any]:
+            """
+            Determine the finance_inputs or ghg_inputs information.
+
+            :param: impact_frame
+                The frame holding the impacts.
 
-        # Save the converters information
+            """
 
-        # Save the devices information
-        with open(
-            self.input_file_info[DEVICES], "w", encoding=_encoding
-        ) as devices_inputs_file:
-            yaml.dump(
-                [entry.as_dict for entry in self.details_window.load_frame.devices],
-                devices_inputs_file,
+            impact_dict = impact_frame.as_dict
+            impact_dict[ImpactingComponent.GRID.value] = (
+                self.details_window.grid_frame.impact_information
+            )
+            return impact_dict
+
+        # Currently, there is no converters, simulation or transmission information to
+        # save. Only the contents of the files requested are determined.
+        contents: dict[str, Callable[[], Any]] = {
+            LOCATION_INPUTS: location_information,
+            BATTERIES: lambda: (
+                self.details_window.storage_frame.battery_frame.batteries
+            ),
+            DEVICES: lambda: [
+                entry.as_dict for entry in self.details_window.load_frame.devices
+            ],
+            DIESEL: self.details_window.diesel_frame.to_dict,
+            ENERGY_SYSTEM_INPUTS: energy_system_information,
+            FINANCE_INPUTS: lambda: impact_information(
+                self.details_window.finance_frame
+            ),
+            GHG_INPUTS: lambda: impact_information(self.details_window.ghgs_frame),
+            GRID_TIMES: lambda: self.details_window.grid_frame.as_dataframe,
+            OPTIMISATION_INPUTS: lambda: (
+                self.configuration_screen.optimisation_frame.as_dict
+            ),
+            SCENARIOS: lambda: (
+                self.configuration_screen.configuration_frame.scenarios_dict
+            ),
+            SOLAR_INPUTS: lambda: self.details_window.solar_frame.pv_panels,
+        }
+        snapshot: dict[str, Any] = {
+            self.input_file_info[source]: content()
+            for source, content in contents.items()
+            if sources is None or source in sources
+        }
+
+        # Include the currently open device-utilisation profile
+        if sources is None or DEVICE_UTILISATIONS in sources:
+            snapshot.update(
+                self.details_window.load_frame.settings_frame.csv_entry_frame.snapshot()
             )
 
-        # Save the currently open device-utilisation profile
-        self.details_window.load_frame.settings_frame.csv_entry_frame.save_cells()
+        return copy.deepcopy(snapshot)
+
+    def save_configuration(self) -> None:
+        """
+        Saves the current configuration.
+
+        All of the input files are serialised, including those changed other than by
+        editing the screens, e.g., by loading or adding profiles, and only those whose
+        contents have changed are written. Any autosave which is due is carried out now.
+
+        """
+
+        self.autosaver.save_now(all_sources=True)
+
+    def _watch_edits(self) -> None:
+        """Autosave the input files which each configuration and details frame edits."""
+
+        # Frames which add or rename components also update the component selection.
+        component_sources: set[str] = {ENERGY_SYSTEM_INPUTS, SCENARIOS}
 
-        # Save the diesel_inputs information
-        with open(
-            self.input_file_info[DIESEL], "w", encoding=_encoding
-        ) as diesel_inputs_file:
-            yaml.dump(self.details_window.diesel_frame.to_dict(), diesel_inputs_file)
+        self.autosaver.watch(
+            self.configuration_screen, {OPTIMISATION_INPUTS}.union(component_sources)
+        )
+        self.autosaver.watch(
+            self.details_window.diesel_frame, {DIESEL}.union(component_sources)
+        )
+        self.autosaver.watch(self.details_window.finance_frame, {FINANCE_INPUTS})
+        self.autosaver.watch(self.details_window.ghgs_frame, {GHG_INPUTS})
+        self.autosaver.watch(
+            self.details_window.grid_frame,
+            {FINANCE_INPUTS, GHG_INPUTS, GRID_TIMES}.union(component_sources),
+        )
+        self.autosaver.watch(
+            self.details_window.load_frame, {DEVICES, DEVICE_UTILISATIONS}
+        )
+        self.autosaver.watch(
+            self.details_window.solar_frame, {SOLAR_INPUTS}.union(component_sources)
+        )
+        self.autosaver.watch(
+            self.details_window.storage_frame, {BATTERIES}.union(component_sources)
+        )
+        self.autosaver.watch(
+            self.details_window.system_frame, {ENERGY_SYSTEM_INPUTS, LOCATION_INPUTS}
+        )
+
+    def record_queued_run(self, job: RunJob, return_code: int) -> None:
+        """
+        Record a queued run which has finished in the location's run history.
+
+        :param: job
+            The job which has finished.
 
-        # Save the energy_system information
-        energy_system_information = self.details_window.system_frame.minigrid_dict
+        :param: return_code
+            The return code of the run.
 
-        # Update the energy-system information with component selection from the
-        # scenarios screen.
-        energy_system_information.update(
-            self.configuration_screen.configuration_frame.energy_system_dict
+        """
+
+        self.record_run(
+            job.clover_args,
+            job.input_hash,
+            job.location_name,
+            job.operating_mode,
+            job.output_directory,
+            return_code,
+            job.timings,
         )
 
-        # Save to-file
-        with open(
-            self.input_file_info[
-                os.path.basename(ENERGY_SYSTEM_INPUTS_FILE).split(".")[0]
-            ],
-            "w",
-            encoding=_encoding,
-        ) as energy_system_inputs_file:
-            yaml.dump(energy_system_information, energy_system_inputs_file)
-
-        # Save the finance_inputs information
-        finance_outputs = self.details_window.finance_frame.as_dict
-        finance_outputs[ImpactingComponent.GRID.value] = (
-            self.details_window.grid_frame.impact_information
-        )
-        with open(
-            self.input_file_info[os.path.basename(FINANCE_INPUTS_FILE).split(".")[0]],
-            "w",
-            encoding=_encoding,
-        ) as finance_inputs_file:
-            yaml.dump(finance_outputs, finance_inputs_file)
-
-        # Save the ghg_inputs information
-        ghg_outputs = self.details_window.ghgs_frame.as_dict
-        ghg_outputs[ImpactingComponent.GRID.value] = (
-            self.details_window.grid_frame.impact_information
-        )
-        with open(
-            self.input_file_info[os.path.basename(GHG_INPUTS_FILE).split(".")[0]],
-            "w",
-            encoding=_encoding,
-        ) as ghg_inputs_file:
-            yaml.dump(ghg_outputs, ghg_inputs_file)
-
-        # Save the grid_times information
-        with open(
-            self.input_file_info[os.path.basename(GRID_TIMES_FILE).split(".")[0]],
-            "w",
-            encoding=_encoding,
-        ) as grid_times_file:
-            self.details_window.grid_frame.as_dataframe.to_csv(grid_times_file)
-
-        # Save the optimisation_inputs information
-        with open(
-            self.input_file_info[
-                os.path.basename(OPTIMISATION_INPUTS_FILE).split(".")[0]
-            ],
-            "w",
-            encoding=_encoding,
-        ) as optimisation_inputs_file:
-            yaml.dump(
-                self.configuration_screen.optimisation_frame.as_dict,
-                optimisation_inputs_file,
-            )
+    def record_run(
+        self,
+        clover_args: list[str],
+        input_hash: str | None,
+        location_name: str,
+        operating_mode: OperatingMode,
+        output_directory: str,
+        return_code: int,
+        run_timings: RunTimings,
+    ) -> None:
+        """
+        Record a run which has finished in the location's run history.
 
-        # Save the scenarios information
-        with open(
-            self.input_file_info[SCENARIOS], "w", encoding=_encoding
-        ) as scenarios_inputs_file:
-            yaml.dump(
-                self.configuration_screen.configuration_frame.scenarios_dict,
-                scenarios_inputs_file,
-            )
+        :param: clover_args
+            The arguments passed to CLOVER.
 
-        # Currently, there is no simulation information to save.
+        :param: input_hash
+            The hash of the inputs to the run, if computed.
 
-        # Save the solar_inputs information
-        with open(
-            self.input_file_info[SOLAR_INPUTS], "w", encoding="utf-8"
-        ) as solar_inputs_file:
-            yaml.dump(self.details_window.solar_frame.pv_panels, solar_inputs_file)
+        :param: location_name
+            The name of the location which was run.
 
-        # Save the transmission_inputs
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: output_directory
+            The directory into which CLOVER saved the outputs from the run.
+
+        :param: return_code
+            The return code of the run.
+
+        :param: run_timings
+            The timings of the run.
+
+        """
+
+        # A run history which cannot be written should not interrupt the GUI.
+        try:
+            location_run_history(location_name).record(
+                clover_args,
+                input_hash,
+                location_name,
+                operating_mode,
+                output_directory,
+                return_code,
+                run_timings,
+            )
+        except sqlite3.Error:
+            pass
+
+        # Convert the hourly outputs, and the profiles used, to columns for viewing.
+        if return_code == 0 and operating_mode == OperatingMode.SIMULATION:
+            Thread(
+                target=cache_run_columns,
+                args=(
+                    output_directory,
+                    os.path.join(get_locations_foldername(), location_name),
+                    self.logger,
+                ),
+                daemon=True,
+            ).start()
 
     def save_and_withdraw(self) -> None:
         """Save all user settings and close."""
 
         try:
-            self.save_configuration()
+            self.autosaver.stop()
         except Exception:
             pass
 
+        # Stop any queued runs which are still in progress.
+        if self.run_queue_window is not None:
+            self.run_queue_window.scheduler.cancel_all()
+
+        shutdown_worker_pool()
         self.destroy()
 
     def select_theme(self, theme: str) -> None:
@@ -825,6 +1329,16 @@ class App(ttk.Window):
 
         # Load-location
         self.load_location_window: LoadLocationWindow | None = None
+        self.location_loader: LocationLoader | None = None
+
+        # Input-file writer and autosave
+        self.input_file_writer: InputFileWriter = InputFileWriter()
+        self.autosaver = Autosaver(
+            self, self._configuration_snapshot, self.input_file_writer, self.logger
+        )
+
+        # Run queue
+        self.run_queue_window: RunQueueWindow | None = None
 
         # Post run
         self.post_run_screen = PostRunScreen(
@@ -837,11 +1351,15 @@ class App(ttk.Window):
 
         # Configuration
         self.configuration_screen = ConfigurationScreen(
+            self.add_run_to_queue,
+            self.compute_input_hash,
             self.data_directory,
             self.location_name,
             self.open_details_window,
+            self.open_run_outputs,
             self.open_run_screen,
             self.output_directory_name,
+            self.record_run,
             self.save_configuration,
             self.system_lifetime,
             self.post_run_screen.update_output_directory_name,
@@ -855,6 +1373,7 @@ class App(ttk.Window):
             self.configuration_screen.configuration_frame.add_grid_profile,
             self.configuration_screen.configuration_frame.add_pv_panel,
             self.data_directory,
+            self.input_file_writer,
             self.renewables_ninja_token,
             self.save_configuration,
             self.configuration_screen.configuration_frame.set_batteries,
@@ -864,6 +1383,9 @@ class App(ttk.Window):
             self.system_lifetime,
         )
         self.details_window.withdraw()
+
+        # Only edits to the configuration and details are autosaved.
+        self._watch_edits()
         self.splash.set_progress_bar_progress(80)
 
         # Run
@@ -874,6 +1396,12 @@ class App(ttk.Window):
             self.open_post_run_screen,
         )
 
+        # Start the CLOVER workers so that they are warm before the first run.
+        try:
+            get_worker_pool()
+        except (OSError, RuntimeError):
+            self.logger.info("CLOVER worker pool unavailable, runs will use CLOVER.")
+
         self.splash.set_progress_bar_progress(100)
 
     def destroy_splash(self):
@@ -881,5 +1409,8 @@ class App(ttk.Window):
 
 
 if __name__ == "__main__":
+    # CLOVER runs take place in worker processes, which frozen builds must support.
+    multiprocessing.freeze_support()
+
     app = App()
     app.mainloop()
@@ -20,7 +20,7 @@ from typing import Any, DefaultDict
 
 import ttkbootstrap as ttk
 
-from clover import __version__, read_yaml
+from clover import __version__
 from clover.fileparser import (
     CAPACITY,
     DIESEL_CONSUMPTION,
@@ -29,9 +29,12 @@ from clover.fileparser import (
 )
 from clover.simulation.diesel import DieselGenerator
 from clover.generation.solar import PVPanel, SolarPanelType
-from clover.scripts.clover import clover_main
 from clover.simulation.storage_utils import Battery
 
+from .input_writer import atomic_write
+from .worker_pool import CloverWorkerRun, get_worker_pool
+from .yaml_io import dump_yaml, read_yaml
+
 __all__ = (
     "BaseScreen",
     "BATTERIES",
@@ -49,6 +52,7 @@ __all__ = (
     "EMISSIONS",
     "END_YEAR",
     "FONTSIZE",
+    "format_value",
     "GLOBAL_SETTINGS_FILEPATH",
     "IMAGES_DIRECTORY",
     "LOAD_LOCATION_GEOMETRY",
@@ -218,8 +222,8 @@ _LONGITUDE: str = "longitude"
 _NAME: str = "name"
 
 # Time zone:
-#   Keyword for time zone.
-_TIME_ZONE: str = "time_zone"
+#   Keyword for the time zone, which CLOVER reads as the time difference from UTC.
+_TIME_ZONE: str = "time_difference"
 
 
 clover_splash_screen_image: str = CLOVER_SPLASH_SCREEN_IMAGE.format(
@@ -341,16 +345,40 @@ class BaseScreen(ttk.Frame):
         home_frame.pack(fill="both", expand=True)
 
 
-def clover_thread(clover_args: list[str]) -> Popen:
+def clover_thread(clover_args: list[str]) -> CloverWorkerRun | Popen:
     """
     Run CLOVER in the background.
 
+    Runs are carried out in a warm worker process where possible, falling back to
+    running the CLOVER executable if the worker pool cannot be started.
+
     :param: clover_args
         Arguments to pass through to CLOVER.
 
+    :returns:
+        The run, which exposes the stdout and return code of CLOVER.
+
+    """
+
+    try:
+        return get_worker_pool().run(clover_args)
+    except (OSError, RuntimeError):
+        return Popen(["clover"] + clover_args, stdout=PIPE, stderr=STDOUT)
+
+
+def format_value(value: float | None) -> str:
+    """
+    Format a result for display.
+
+    :param: value
+        The value to format.
+
+    :returns:
+        The formatted value.
+
     """
 
-    return Popen(["clover"] + clover_args, stdout=PIPE, stderr=STDOUT)
+    return "" if value is None else f"{value:.6g}"
 
 
 def parse_battery_inputs(
@@ -382,13 +410,14 @@ def parse_battery_inputs(
         raise Exception("Battery input file is not of type `list`.")
     logger.info("Battery inputs successfully parsed.")
 
-    batteries = [Battery.from_dict(entry) for entry in battery_inputs]
-    battery_costs: dict[str, dict[str, float]] = {
-        entry[_NAME]: entry[COSTS] for entry in battery_inputs
-    }
-    battery_emissions: dict[str, dict[str, float]] = {
-        entry[_NAME]: entry[EMISSIONS] for entry in battery_inputs
-    }
+    # Build the batteries and index their impacts by name in a single pass.
+    batteries: list[Battery] = []
+    battery_costs: dict[str, dict[str, float]] = {}
+    battery_emissions: dict[str, dict[str, float]] = {}
+    for entry in battery_inputs:
+        batteries.append(Battery.from_dict(entry))
+        battery_costs[entry[_NAME]] = entry[COSTS]
+        battery_emissions[entry[_NAME]] = entry[EMISSIONS]
 
     return batteries, battery_costs, battery_emissions
 
@@ -422,21 +451,21 @@ def parse_diesel_inputs(
         raise Exception("Diesel input file is not of type `dict`.")
     logger.info("Diesel inputs successfully parsed.")
 
-    diesel_generators: list[DieselGenerator] = [
-        DieselGenerator(
-            entry.get(CAPACITY, 1),
-            entry[DIESEL_CONSUMPTION],
-            entry[MINIMUM_LOAD],
-            entry[_NAME],
+    # Build the generators and index their impacts by name in a single pass.
+    diesel_generators: list[DieselGenerator] = []
+    diesel_generator_costs: dict[str, dict[str, float]] = {}
+    diesel_generator_emissions: dict[str, dict[str, float]] = {}
+    for entry in diesel_inputs[DIESEL_GENERATORS]:
+        diesel_generators.append(
+            DieselGenerator(
+                entry.get(CAPACITY, 1),
+                entry[DIESEL_CONSUMPTION],
+                entry[MINIMUM_LOAD],
+                entry[_NAME],
+            )
         )
-        for entry in diesel_inputs[DIESEL_GENERATORS]
-    ]
-    diesel_generator_costs: dict[str, dict[str, float]] = {
-        entry[_NAME]: entry[COSTS] for entry in diesel_inputs[DIESEL_GENERATORS]
-    }
-    diesel_generator_emissions: dict[str, dict[str, float]] = {
-        entry[_NAME]: entry[EMISSIONS] for entry in diesel_inputs[DIESEL_GENERATORS]
-    }
+        diesel_generator_costs[entry[_NAME]] = entry[COSTS]
+        diesel_generator_emissions[entry[_NAME]] = entry[EMISSIONS]
 
     return diesel_generators, diesel_generator_costs, diesel_generator_emissions
 
@@ -477,45 +506,39 @@ def parse_solar_inputs(
         raise Exception("Solar generation inputs are not of type `dict`.")
     logger.info("Solar generation inputs successfully parsed.")
 
-    # Parse the PV-panel information.
-    pv_panels: list[PVPanel] = [
-        PVPanel.from_dict(logger, panel_input)
-        for panel_input in solar_generation_inputs[PANELS]
-        if panel_input["type"] == SolarPanelType.PV.value
-    ]
+    # Parse the PV-panel information, indexing the impacts of each panel by name in a
+    # single pass. Where names are repeated, the first panel's impacts are used.
+    pv_panels: list[PVPanel] = []
+    pv_panel_costs: dict[str, DefaultDict[str, float]] = {}
+    pv_panel_emissions: dict[str, DefaultDict[str, float]] = {}
+    for panel_input in solar_generation_inputs[PANELS]:
+        if panel_input["type"] != SolarPanelType.PV.value:
+            continue
 
-    # Determine the PV panel costs.
-    try:
-        pv_panel_costs: dict[str, DefaultDict[str, float]] = {
-            pv_panel.name: [
-                collections.defaultdict(float, panel_data[COSTS])
-                for panel_data in solar_generation_inputs[PANELS]
-                if panel_data[_NAME] == pv_panel.name
-            ][0]
-            for pv_panel in pv_panels
-        }
-    except (KeyError, IndexError):
-        logger.error(
-            "Failed to determine costs for PV panels.",
-        )
-        raise
-    logger.info("PV panel costs successfully determined.")
+        pv_panels.append(PVPanel.from_dict(logger, panel_input))
+        if panel_input[_NAME] in pv_panel_costs:
+            continue
 
-    # Determine the PV panel emissions.
-    try:
-        pv_panel_emissions: dict[str, DefaultDict[str, float]] = {
-            pv_panel.name: [
-                collections.defaultdict(float, panel_data[EMISSIONS])
-                for panel_data in solar_generation_inputs[PANELS]
-                if panel_data[_NAME] == pv_panel.name
-            ][0]
-            for pv_panel in pv_panels
-        }
-    except (KeyError, IndexError):
-        logger.error(
-            "Failed to determine emissions for PV panels.",
-        )
-    logger.info("PV panel emissions successfully determined.")
+        try:
+            pv_panel_costs[panel_input[_NAME]] = collections.defaultdict(
+                float, panel_input[COSTS]
+            )
+        except KeyError:
+            logger.error(
+                "Failed to determine costs for PV panels.",
+            )
+            raise
+
+        try:
+            pv_panel_emissions[panel_input[_NAME]] = collections.defaultdict(
+                float, panel_input[EMISSIONS]
+            )
+        except KeyError:
+            logger.error(
+                "Failed to determine emissions for PV panels.",
+            )
+
+    logger.info("PV panel costs and emissions successfully determined.")
 
     return (
         pv_panels,
@@ -529,11 +552,14 @@ def update_location_information(
     latitude: float,
     logger: Logger,
     longitude: float,
-    timezone: int,
+    timezone: float,
 ) -> None:
     """
     Called to update the location inputs when created.
 
+    :param: inputs_directory_relative_path
+        The path to the inputs directory of the location.
+
     :param: latitude
         The latitude for the location to use.
 
@@ -554,3 +580,8 @@ def update_location_information(
     locations_inputs[_LATITUDE] = latitude
     locations_inputs[_LONGITUDE] = longitude
     locations_inputs[_TIME_ZONE] = timezone
+
+    atomic_write(
+        os.path.join(inputs_directory_relative_path, LOCATIONS_INPUT_FILE),
+        dump_yaml(locations_inputs),
+    )
@@ -0,0 +1,292 @@
+#!/usr/bin/python3.10
+########################################################################################
+# autosave.py - The autosave module for CLOVER-GUI application.                        #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import tkinter as tk
+
+from logging import Logger
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Iterable
+
+from .input_writer import InputFileWriter, serialise_input
+
+__all__ = (
+    "AUTOSAVE_DELAY",
+    "AUTOSAVE_EVENT_SEQUENCES",
+    "Autosaver",
+)
+
+# Autosave delay:
+#   The time, in milliseconds, after the last edit before the configuration is saved.
+AUTOSAVE_DELAY: int = 2000
+
+# Autosave event sequences:
+#   The events, within the widgets watched, after which an autosave is scheduled.
+AUTOSAVE_EVENT_SEQUENCES: tuple[str, ...] = (
+    "<<ComboboxSelected>>",
+    "<ButtonRelease-1>",
+    "<KeyRelease>",
+)
+
+
+class Autosaver:
+    """
+    Saves the configuration in the background once the user stops editing it.
+
+    Only edits made within the widgets being watched schedule a save, so that using the
+    rest of the application costs nothing. Each widget is watched along with the input
+    files which it edits, which are marked as dirty by its edits, so that a save only
+    snapshots and serialises the files which may have changed since the last load or
+    save. Each edit reschedules the save, so that a burst of edits results in a single
+    save. When the save is due, a snapshot of the dirty files is taken on the main
+    thread. The snapshot is then serialised and written by a background thread, so
+    that the GUI never waits on the disk. Snapshots taken whilst a write is in progress
+    are merged file by file, with the latest contents of each file written.
+
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        snapshot_callback: Callable[[set[str] | None], dict[str, Any] | None],
+        input_file_writer: InputFileWriter,
+        logger: Logger,
+        delay: int = AUTOSAVE_DELAY,
+    ) -> None:
+        """
+        Instantiate a :class:`Autosaver` instance, starting its background thread.
+
+        :param: widget
+            The widget used to schedule callbacks on the main thread.
+
+        :param: snapshot_callback
+            A callable function which, given the names of the dirty input files, or
+            `None` for all of them, returns a mapping between the path to each of them
+            and its contents, or `None` if there is nothing to save.
+
+        :param: input_file_writer
+            The :class:`InputFileWriter` with which to write the input files.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        :param: delay
+            The time, in milliseconds, after the last edit before saving.
+
+        """
+
+        self._after_id: str | None = None
+        self._bound_toplevels: set[str] = set()
+        self._condition = Condition()
+        self._delay: int = delay
+        self._dirty: set[str] = set()
+        self._generation: int = 0
+        self._input_file_writer = input_file_writer
+        self._logger = logger
+        self._pending: tuple[int, dict[str, Any]] | None = None
+        self._snapshot_callback = snapshot_callback
+        self._stopped: bool = False
+        self._watched: dict[str, frozenset[str]] = {}
+        self._widget = widget
+        self._write_lock = Lock()
+        self._written_generations: dict[str, int] = {}
+
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _edited(self, event: tk.Event) -> None:
+        """
+        Schedule a save if an event occurred within a widget being watched.
+
+        :param: event
+            The event.
+
+        """
+
+        # Widget path names are nested, so the widget's ancestors are found by
+        # stripping its path back one name at a time.
+        widget_path = str(event.widget)
+        while widget_path != "":
+            if (sources := self._watched.get(widget_path)) is not None:
+                self._dirty.update(sources)
+                self.schedule()
+                return
+            widget_path = widget_path.rpartition(".")[0]
+
+    def _merge_pending(
+        self, pending: tuple[int, dict[str, Any]] | None
+    ) -> tuple[int, dict[str, Any]] | None:
+        """
+        Take the snapshot waiting to be written, merged with a later snapshot.
+
+        This must be called whilst holding the condition.
+
+        :param: pending
+            The later snapshot, along with its generation, or `None`.
+
+        :returns:
+            The snapshots merged by file, with the contents of the later snapshot taking
+            precedence, along with the latest generation, or `None` if neither snapshot
+            is present.
+
+        """
+
+        previous, self._pending = self._pending, None
+        if previous is None or pending is None:
+            return pending if previous is None else previous
+
+        return pending[0], {**previous[1], **pending[1]}
+
+    def _run(self) -> None:
+        """Write each snapshot passed to the background thread."""
+
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                generation, snapshot = self._pending
+                self._pending = None
+
+            self._write(generation, snapshot)
+
+    def _snapshot(self, all_sources: bool = False) -> tuple[int, dict[str, Any]] | None:
+        """
+        Take a snapshot of the input files which are dirty.
+
+        :param: all_sources
+            Whether to snapshot all of the input files, including those changed other
+            than by edits within the widgets watched.
+
+        :returns:
+            The generation of the snapshot and the snapshot, or `None` if there is
+            nothing to save.
+
+        """
+
+        if len(self._dirty) == 0 and not all_sources:
+            return None
+
+        dirty, self._dirty = self._dirty, set()
+        snapshot = self._snapshot_callback(None if all_sources else dirty)
+        if snapshot is None:
+            return None
+
+        self._generation += 1
+        return self._generation, snapshot
+
+    def _snapshot_to_thread(self) -> None:
+        """Take a snapshot and pass it to the background thread to write."""
+
+        self._after_id = None
+        if (pending := self._snapshot()) is None:
+            return
+
+        with self._condition:
+            self._pending = self._merge_pending(pending)
+            self._condition.notify()
+
+    def _write(self, generation: int, snapshot: dict[str, Any]) -> None:
+        """
+        Serialise and write a snapshot, skipping each file of which a later snapshot has
+        been written.
+
+        :param: generation
+            The generation of the snapshot.
+
+        :param: snapshot
+            The snapshot to write.
+
+        """
+
+        with self._write_lock:
+            for filepath, data in snapshot.items():
+                if generation <= self._written_generations.get(filepath, 0):
+                    continue
+                try:
+                    self._input_file_writer.write(filepath, serialise_input(data))
+                except OSError as e:
+                    self._logger.error("Failed to save '%s': %s", filepath, e)
+                    continue
+                self._written_generations[filepath] = generation
+
+    def mark_clean(self) -> None:
+        """Record that the input files are unchanged, e.g., as they have been loaded."""
+
+        self._dirty = set()
+
+    def save_now(self, all_sources: bool = False) -> None:
+        """
+        Save the configuration immediately, waiting for the write to complete.
+
+        :param: all_sources
+            Whether to save all of the input files, rather than only those edited. The
+            :class:`InputFileWriter` still skips those whose contents are unchanged.
+
+        """
+
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        # Any snapshot still waiting for the background thread is written now too.
+        snapshot = self._snapshot(all_sources)
+        with self._condition:
+            pending = self._merge_pending(snapshot)
+
+        if pending is not None:
+            self._write(*pending)
+
+    def schedule(self, *_: Any) -> None:
+        """Schedule a save, postponing any save already scheduled."""
+
+        if self._stopped:
+            return
+
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+
+        self._after_id = self._widget.after(self._delay, self._snapshot_to_thread)
+
+    def stop(self) -> None:
+        """Save the configuration and stop the background thread."""
+
+        self.save_now(all_sources=True)
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+        self._thread.join()
+
+    def watch(self, widget: tk.Misc, sources: Iterable[str]) -> None:
+        """
+        Schedule a save of the input files edited within a widget after each edit.
+
+        The events are bound on the widget's toplevel window, which receives the events
+        of all of its descendants, including those created later. An edit within
+        several of the widgets watched marks the files of the innermost as dirty.
+
+        :param: widget
+            The widget, e.g., a screen or frame, whose edits should be saved.
+
+        :param: sources
+            The names of the input files which the widget edits.
+
+        """
+
+        toplevel = widget.winfo_toplevel()
+        if str(toplevel) not in self._bound_toplevels:
+            for sequence in AUTOSAVE_EVENT_SEQUENCES:
+                toplevel.bind(sequence, self._edited, add="+")
+            self._bound_toplevels.add(str(toplevel))
+
+        self._watched[str(widget)] = frozenset(sources)
@@ -0,0 +1,389 @@
+#!/usr/bin/python3.10
+########################################################################################
+# column_cache.py - The column-cache module for CLOVER-GUI application.                #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import glob
+import json
+import os
+import shutil
+import tempfile
+
+from logging import Logger
+
+import numpy as np
+import pandas as pd
+
+from clover import OUTPUTS_FOLDER
+from clover.__main__ import AUTO_GENERATED_FILES_DIRECTORY
+
+__all__ = (
+    "cache_run_columns",
+    "COLUMN_CACHE_DIRECTORY",
+    "convert_to_columns",
+    "HOURLY_OUTPUTS_FILENAME",
+    "load_columns",
+    "load_profiles",
+    "read_csv_columns",
+)
+
+# Column-cache directory:
+#   The directory, alongside each output converted or within a location's outputs for
+#   the profiles converted, holding their columns.
+COLUMN_CACHE_DIRECTORY: str = ".columns"
+
+# Column-cache manifest filename:
+#   The name of the file, within the columns of a CSV file, listing the columns along
+#   with the CSV file from which they were converted.
+COLUMN_CACHE_MANIFEST_FILENAME: str = "columns.json"
+
+# Column-cache version:
+#   The version of the column-cache format, changed whenever the manifest changes.
+COLUMN_CACHE_VERSION: int = 1
+
+# Hourly outputs filename:
+#   The name of the file, within the outputs of a simulation, containing its hourly
+#   results.
+HOURLY_OUTPUTS_FILENAME: str = "simulation_output_1.csv"
+
+# Profile patterns:
+#   Patterns matching the profiles, within a location's auto-generated files, which
+#   simulations read: the lifetime solar profiles and the grid-availability profiles.
+#   Their columns are kept within the location's outputs rather than alongside them, as
+#   the auto-generated files are inputs to, and so hashed for, each run.
+PROFILE_PATTERNS: tuple[str, ...] = (
+    os.path.join("solar", "*_years.csv"),
+    os.path.join("grid", "*_grid_status.csv"),
+)
+
+
+def _columns_directory(csv_filepath: str, cache_directory: str | None = None) -> str:
+    """
+    Return the directory holding the columns of a CSV file.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :param: cache_directory
+        The directory in which to keep the columns, alongside the CSV file if `None`.
+
+    :returns:
+        The directory holding its columns.
+
+    """
+
+    if cache_directory is None:
+        cache_directory = os.path.join(
+            os.path.dirname(csv_filepath), COLUMN_CACHE_DIRECTORY
+        )
+
+    return os.path.join(
+        cache_directory, os.path.splitext(os.path.basename(csv_filepath))[0]
+    )
+
+
+def _profile_filepaths(location_directory: str) -> list[tuple[str, str]]:
+    """
+    Return the profiles of a location which are converted to columns.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        The path to each profile along with the directory in which to keep its columns.
+
+    """
+
+    return [
+        (
+            filepath,
+            os.path.join(
+                location_directory,
+                OUTPUTS_FOLDER,
+                COLUMN_CACHE_DIRECTORY,
+                os.path.dirname(pattern),
+            ),
+        )
+        for pattern in PROFILE_PATTERNS
+        for filepath in sorted(
+            glob.glob(
+                os.path.join(
+                    location_directory, AUTO_GENERATED_FILES_DIRECTORY, pattern
+                )
+            )
+        )
+    ]
+
+
+def _read_manifest(
+    csv_filepath: str, cache_directory: str | None = None
+) -> dict | None:
+    """
+    Read the manifest of the columns converted from a CSV file.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :param: cache_directory
+        The directory in which the columns are kept, alongside the CSV file if `None`.
+
+    :returns:
+        The manifest, or `None` if the CSV file has not been converted since it was
+        last written.
+
+    """
+
+    try:
+        with open(
+            os.path.join(
+                _columns_directory(csv_filepath, cache_directory),
+                COLUMN_CACHE_MANIFEST_FILENAME,
+            ),
+            "r",
+            encoding="utf-8",
+        ) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("version") != COLUMN_CACHE_VERSION or manifest.get(
+            "source"
+        ) != _source_stamp(csv_filepath):
+            return None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    return manifest
+
+
+def _source_stamp(csv_filepath: str) -> dict[str, int]:
+    """
+    Return the stamp of a CSV file, which changes whenever it is rewritten.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :returns:
+        The size and modification time, in nanoseconds, of the file.
+
+    """
+
+    stat_result = os.stat(csv_filepath)
+    return {"mtime_ns": stat_result.st_mtime_ns, "size": stat_result.st_size}
+
+
+def read_csv_columns(csv_filepath: str) -> dict[str, np.ndarray]:
+    """
+    Read the numeric columns of a CSV file.
+
+    The index written alongside the data by :mod:`pandas` is dropped, and integer
+    columns are stored in the smallest type which holds them.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :returns:
+        A mapping from the name of each numeric column to its values.
+
+    """
+
+    data = pd.read_csv(csv_filepath)
+    data = data.loc[:, ~data.columns.astype(str).str.startswith("Unnamed:")]
+
+    return {
+        str(column): (
+            pd.to_numeric(data[column], downcast="integer").to_numpy()
+            if pd.api.types.is_integer_dtype(data[column])
+            else data[column].to_numpy(dtype=np.float64)
+        )
+        for column in data.select_dtypes(include="number").columns
+    }
+
+
+def convert_to_columns(csv_filepath: str, cache_directory: str | None = None) -> str:
+    """
+    Convert the numeric columns of a CSV file into a `.npy` file each.
+
+    The columns are written into a temporary directory and then moved into place, so
+    that a reader never sees a partially-written conversion.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :param: cache_directory
+        The directory in which to keep the columns, alongside the CSV file if `None`.
+
+    :returns:
+        The directory holding the columns.
+
+    """
+
+    columns_directory = _columns_directory(csv_filepath, cache_directory)
+    stamp = _source_stamp(csv_filepath)
+    columns = read_csv_columns(csv_filepath)
+
+    os.makedirs(os.path.dirname(columns_directory), exist_ok=True)
+    temporary_directory = tempfile.mkdtemp(
+        dir=os.path.dirname(columns_directory), prefix=".", suffix=".tmp"
+    )
+
+    try:
+        shutil.copymode(os.path.dirname(columns_directory), temporary_directory)
+        for index, values in enumerate(columns.values()):
+            np.save(os.path.join(temporary_directory, f"{index}.npy"), values)
+        with open(
+            os.path.join(temporary_directory, COLUMN_CACHE_MANIFEST_FILENAME),
+            "w",
+            encoding="utf-8",
+        ) as manifest_file:
+            json.dump(
+                {
+                    "columns": [
+                        {"filename": f"{index}.npy", "name": name}
+                        for index, name in enumerate(columns)
+                    ],
+                    "source": stamp,
+                    "version": COLUMN_CACHE_VERSION,
+                },
+                manifest_file,
+                indent=4,
+            )
+
+        # Columns still memory-mapped from a previous conversion remain readable on
+        # POSIX systems once removed.
+        shutil.rmtree(columns_directory, ignore_errors=True)
+        os.rename(temporary_directory, columns_directory)
+    except BaseException:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        raise
+
+    return columns_directory
+
+
+def load_columns(
+    csv_filepath: str, cache_directory: str | None = None
+) -> dict[str, np.ndarray] | None:
+    """
+    Memory-map the columns converted from a CSV file.
+
+    :param: csv_filepath
+        The path to the CSV file.
+
+    :param: cache_directory
+        The directory in which the columns are kept, alongside the CSV file if `None`.
+
+    :returns:
+        A mapping from the name of each numeric column to its read-only, memory-mapped
+        values, or `None` if the CSV file has not been converted since it was last
+        written.
+
+    """
+
+    if (manifest := _read_manifest(csv_filepath, cache_directory)) is None:
+        return None
+
+    columns_directory = _columns_directory(csv_filepath, cache_directory)
+    try:
+        return {
+            column["name"]: np.load(
+                os.path.join(columns_directory, column["filename"]), mmap_mode="r"
+            )
+            for column in manifest["columns"]
+        }
+    except (KeyError, OSError, TypeError, ValueError):
+        return None
+
+
+def load_profiles(location_directory: str) -> dict[str, np.ndarray]:
+    """
+    Load the profiles of a location which simulations read.
+
+    The columns converted once a simulation finished are memory-mapped where they are
+    up to date, with the profile read otherwise. This is safe to call from a background
+    thread.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        A mapping from the name of each profile, along with that of the column where it
+        has several, to its hourly values.
+
+    """
+
+    profiles: dict[str, np.ndarray] = {}
+    for csv_filepath, cache_directory in _profile_filepaths(location_directory):
+        if (columns := load_columns(csv_filepath, cache_directory)) is None:
+            try:
+                columns = read_csv_columns(csv_filepath)
+            except (OSError, ValueError):
+                continue
+
+        profile_name = os.path.splitext(os.path.basename(csv_filepath))[0]
+        profiles.update(
+            {
+                (
+                    profile_name
+                    if len(columns) == 1
+                    else f"{profile_name}: {column_name}"
+                ): values
+                for column_name, values in columns.items()
+            }
+        )
+
+    return profiles
+
+
+def cache_run_columns(
+    output_directory: str, location_directory: str, logger: Logger
+) -> int:
+    """
+    Convert the hourly outputs of a simulation, and the profiles it read, to columns.
+
+    This is safe to call from a background thread. The profiles are shared between
+    the runs of a location, so each is only converted again once it is rewritten, and
+    their columns are kept within the location's outputs so that the auto-generated
+    files hashed as inputs to a run are left untouched.
+
+    :param: output_directory
+        The directory containing the outputs of the simulation.
+
+    :param: location_directory
+        The directory of the location which was simulated.
+
+    :param: logger
+        The :class:`logging.Logger` to use.
+
+    :returns:
+        The number of files converted.
+
+    """
+
+    csv_filepaths: list[tuple[str, str | None]] = [
+        (os.path.join(output_directory, HOURLY_OUTPUTS_FILENAME), None)
+    ] + _profile_filepaths(location_directory)
+
+    converted_count: int = 0
+    for csv_filepath, cache_directory in csv_filepaths:
+        if (
+            not os.path.isfile(csv_filepath)
+            or _read_manifest(csv_filepath, cache_directory) is not None
+        ):
+            continue
+        try:
+            convert_to_columns(csv_filepath, cache_directory)
+        except (OSError, ValueError) as exception:
+            logger.warning(
+                "Could not convert %s to columns: %s", csv_filepath, exception
+            )
+            continue
+        converted_count += 1
+
+    logger.info(
+        "Converted %s files to columns for %s.", converted_count, output_directory
+    )
+
+    return converted_count
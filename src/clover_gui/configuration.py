@@ -48,7 +48,11 @@ from ttkbootstrap.scrolled import *
 from ttkbootstrap.tooltip import ToolTip
 
 from .__utils__ import BaseScreen, clover_thread, IMAGES_DIRECTORY
+from .result_cache import RESULT_CACHE_DIRECTORY, ResultCache
+from .run_log import RUN_LOGS_DIRECTORY
+from .run_timings import RunTimings
 from .scenario import ConfigurationFrame
+from .sweep import SweepPoint, SweepResultsWindow, sweep_values
 
 
 __all__ = ("ConfigurationScreen",)
@@ -70,6 +74,7 @@ class SimulationFrame(BaseScreen, show_navigation=False):
         parent,
         help_image: ttk.PhotoImage,
         launch_clover_run: Callable,
+        queue_clover_run: Callable,
     ) -> None:
         super().__init__(parent)
 
@@ -82,6 +87,9 @@ class SimulationFrame(BaseScreen, show_navigation=False):
         :param: launch_clover_run
             A callable function to launch a simulation.
 
+        :param: queue_clover_run
+            A callable function to add a simulation to the run queue.
+
         """
 
         self.pack(fill="both", expand=True)
@@ -290,6 +298,18 @@ class SimulationFrame(BaseScreen, show_navigation=False):
         self.run_simulation_frame.columnconfigure(1, weight=1)
         self.run_simulation_frame.rowconfigure(0, weight=1)
 
+        self.queue_simulation_button = ttk.Button(
+            self.run_simulation_frame,
+            text="Add to Queue",
+            bootstyle=f"{INFO}-outline",
+            command=lambda operating_mode=OperatingMode.SIMULATION: queue_clover_run(
+                operating_mode
+            ),
+        )
+        self.queue_simulation_button.grid(
+            row=0, column=0, padx=5, pady=10, ipadx=40, ipady=20, sticky="es"
+        )
+
         self.run_simulation_button = ttk.Button(
             self.run_simulation_frame,
             text="Run Simulation",
@@ -655,6 +675,7 @@ class OptimisationFrame(ttk.Frame):
         parent,
         help_image: ttk.PhotoImage,
         launch_clover_run: Callable,
+        queue_clover_run: Callable,
         system_lifetime: ttk.IntVar,
     ):
         super().__init__(parent)
@@ -1829,6 +1850,19 @@ class OptimisationFrame(ttk.Frame):
         self.run_optimisation_frame.columnconfigure(2, weight=1)
         self.run_optimisation_frame.rowconfigure(0, weight=1)
 
+        self.queue_optimisation_button = ttk.Button(
+            self.run_optimisation_frame,
+            text="Add to Queue",
+            bootstyle=f"{INFO}-outline",
+            command=lambda operating_mode=OperatingMode.OPTIMISATION: queue_clover_run(
+                operating_mode
+            ),
+            state=DISABLED,
+        )
+        self.queue_optimisation_button.grid(
+            row=0, column=0, padx=5, pady=10, sticky="es", ipadx=40, ipady=20
+        )
+
         self.run_optimisation_button = ttk.Button(
             self.run_optimisation_frame,
             text="Run Optimisation",
@@ -1850,14 +1884,16 @@ class OptimisationFrame(ttk.Frame):
         Checks whether the optimisation criterion frame has been scrolled.
 
         Once the optimisation frame has been scrolled to the bottom, the "Run
-        Optimisation" button will be enabled.
+        Optimisation" and "Add to Queue" buttons will be enabled.
 
         """
 
         if self.scrollable_optimisation_frame.vscroll.get()[1] == 1.0:
             self.run_optimisation_button.configure(state="enabled")
+            self.queue_optimisation_button.configure(state="enabled")
         else:
             self.run_optimisation_button.configure(state=DISABLED)
+            self.queue_optimisation_button.configure(state=DISABLED)
 
     @property
     def as_dict(
@@ -2062,6 +2098,179 @@ class OptimisationFrame(ttk.Frame):
             criterion.display()
 
 
+class SweepFrame(ttk.Frame):
+    """
+    Represents the sweep frame.
+
+    The sweep frame contains the ranges of PV and storage sizes over which to sweep, as
+    well as a launch button which queues a simulation for every combination of sizes.
+
+    .. attribute:: output_name
+        The name to give the outputs of the sweep.
+
+    .. attribute:: pv_size_max
+        The largest PV size to simulate, in kWp.
+
+    .. attribute:: pv_size_min
+        The smallest PV size to simulate, in kWp.
+
+    .. attribute:: pv_size_step
+        The step between successive PV sizes, in kWp.
+
+    .. attribute:: storage_size_max
+        The largest storage size to simulate, in kWh.
+
+    .. attribute:: storage_size_min
+        The smallest storage size to simulate, in kWh.
+
+    .. attribute:: storage_size_step
+        The step between successive storage sizes, in kWh.
+
+    """
+
+    def __init__(
+        self,
+        parent,
+        help_image: ttk.PhotoImage,
+        launch_clover_sweep: Callable,
+    ) -> None:
+        """
+        Instantiate a :class:`SweepFrame` instance.
+
+        :param: help_image
+            The :class:`ttk.PhotoImage` to use for help boxes.
+
+        :param: launch_clover_sweep
+            A callable function to launch a sweep.
+
+        """
+
+        super().__init__(parent)
+
+        self.pack(fill="both", expand=True)
+
+        self.help_image = help_image
+
+        for row in range(6):
+            self.rowconfigure(row, weight=1)
+        for column in range(5):
+            self.columnconfigure(column, weight=1)
+
+        # Help text
+        self.help_text_label = ttk.Label(
+            self, text="Sweep component sizes", style="Bold.TLabel"
+        )
+        self.help_text_label.grid(
+            row=0, column=0, columnspan=2, padx=20, pady=10, sticky="w"
+        )
+        self.sweep_help_icon = ttk.Label(
+            self, bootstyle=INFO, image=self.help_image, text=""
+        )
+        self.sweep_help_tooltip = ToolTip(
+            self.sweep_help_icon,
+            text="Run a simulation for every combination of PV and storage sizes "
+            "within the ranges given. The runs are added to the run queue and their "
+            "key results are gathered into a table and heatmap as they complete.",
+            bootstyle=f"{INFO}-{INVERSE}",
+        )
+        self.sweep_help_icon.grid(row=0, column=1, padx=20, pady=10, sticky="e")
+
+        for column, text in enumerate(("Minimum", "Maximum", "Step"), 1):
+            ttk.Label(self, text=text, style="Bold.TLabel").grid(
+                row=1, column=column, padx=20, pady=10, sticky="w"
+            )
+
+        # PV size
+        self.pv_size_label = ttk.Label(self, text="PV System Size")
+        self.pv_size_label.grid(row=2, column=0, padx=20, pady=10, sticky="w")
+
+        self.pv_size_min: ttk.DoubleVar = ttk.DoubleVar(self, 0)
+        self.pv_size_max: ttk.DoubleVar = ttk.DoubleVar(self, 0)
+        self.pv_size_step: ttk.DoubleVar = ttk.DoubleVar(self, 1)
+
+        # Storage size
+        self.storage_size_label = ttk.Label(self, text="Storage Size")
+        self.storage_size_label.grid(row=3, column=0, padx=20, pady=10, sticky="w")
+
+        self.storage_size_min: ttk.DoubleVar = ttk.DoubleVar(self, 0)
+        self.storage_size_max: ttk.DoubleVar = ttk.DoubleVar(self, 0)
+        self.storage_size_step: ttk.DoubleVar = ttk.DoubleVar(self, 1)
+
+        for row, variables, units in (
+            (2, (self.pv_size_min, self.pv_size_max, self.pv_size_step), "kWp"),
+            (
+                3,
+                (self.storage_size_min, self.storage_size_max, self.storage_size_step),
+                "kWh",
+            ),
+        ):
+            for column, variable in enumerate(variables, 1):
+                entry = ttk.Entry(self, bootstyle=INFO, textvariable=variable)
+                entry.grid(row=row, column=column, padx=20, pady=10, sticky="ew")
+                entry.bind("<KeyRelease>", lambda _: self._update_number_of_runs())
+            ttk.Label(self, text=units).grid(row=row, column=4, sticky="w")
+
+        # Output name
+        self.output_name_label = ttk.Label(self, text="Output name")
+        self.output_name_label.grid(row=4, column=0, padx=20, pady=10, sticky="w")
+
+        self.output_name: ttk.StringVar = ttk.StringVar(self, "sweep")
+        self.output_name_entry = ttk.Entry(
+            self, bootstyle=INFO, textvariable=self.output_name
+        )
+        self.output_name_entry.grid(
+            row=4, column=1, columnspan=2, padx=20, pady=10, sticky="ew"
+        )
+
+        # Run sweep
+        self.number_of_runs_label = ttk.Label(self, bootstyle=INFO)
+        self.number_of_runs_label.grid(row=5, column=0, padx=20, pady=10, sticky="w")
+
+        self.run_sweep_button = ttk.Button(
+            self,
+            text="Run Sweep",
+            bootstyle=f"{INFO}-outline",
+            command=launch_clover_sweep,
+        )
+        self.run_sweep_button.grid(
+            row=5,
+            column=2,
+            columnspan=3,
+            padx=5,
+            pady=10,
+            ipadx=80,
+            ipady=20,
+            sticky="es",
+        )
+
+        self._update_number_of_runs()
+
+    def _update_number_of_runs(self) -> None:
+        """Update the label displaying the number of runs in the sweep."""
+
+        try:
+            number_of_runs = len(
+                sweep_values(
+                    self.pv_size_min.get(),
+                    self.pv_size_max.get(),
+                    self.pv_size_step.get(),
+                )
+            ) * len(
+                sweep_values(
+                    self.storage_size_min.get(),
+                    self.storage_size_max.get(),
+                    self.storage_size_step.get(),
+                )
+            )
+        except tk.TclError:
+            self.number_of_runs_label.configure(text="Invalid sweep ranges")
+            return
+
+        self.number_of_runs_label.configure(
+            text=f"{number_of_runs} run{'s' if number_of_runs != 1 else ''}"
+        )
+
+
 class ConfigurationScreen(BaseScreen, show_navigation=True):
     """
     Represents the configuration screen.
@@ -2074,11 +2283,15 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
 
     def __init__(
         self,
+        add_run_to_queue: Callable,
+        compute_input_hash: Callable,
         data_directory: str,
         location_name: ttk.StringVar,
         open_details_window: Callable,
+        open_run_outputs: Callable,
         open_run_screen: Callable,
         output_directory_name: ttk.StringVar,
+        record_run: Callable,
         save_configuration: Callable,
         system_lifetime: ttk.IntVar,
         update_post_run_screen_output_directory_name: Callable,
@@ -2086,6 +2299,12 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
         """
         Instantiate a :class:`ConfigureFrame` instance.
 
+        :param: add_run_to_queue
+            A callable function to add a CLOVER run to the run queue.
+
+        :param: compute_input_hash
+            A callable function to compute the hash of the inputs to a CLOVER run.
+
         :param: data_directory
             The path to the data directory.
 
@@ -2095,12 +2314,18 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
         :param: open_details_window
             A callable function to open the details screen.
 
+        :param: open_run_outputs
+            A callable function to open the outputs of a completed run.
+
         :param: open_run_screen
             A callable function to open the run screen.
 
         :param: output_directory_name
             The output filename for displaying files once a run has compmleted.
 
+        :param: record_run
+            A callable function to record a finished run in the run history.
+
         :param: save_configuration
             A callable function to save the configuration.
 
@@ -2115,8 +2340,12 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
 
         super().__init__()
 
+        self.add_run_to_queue: Callable = add_run_to_queue
+        self.compute_input_hash: Callable = compute_input_hash
+        self.open_run_outputs: Callable = open_run_outputs
         self.open_run_screen: Callable = open_run_screen
         self.output_directory_name: ttk.StringVar = output_directory_name
+        self.record_run: Callable = record_run
         self.save_configuration: Callable = save_configuration
         self.system_lifetime: ttk.IntVar = system_lifetime
         self.update_post_run_screen_output_directory_name: Callable = (
@@ -2202,7 +2431,7 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
         )  # Use grid
 
         style = ttk.Style()
-        style.configure("TNotebook.Tab", width=int(self.winfo_screenwidth() / 4))
+        style.configure("TNotebook.Tab", width=int(self.winfo_screenwidth() / 5))
 
         self.configuration_frame = ConfigurationFrame(
             self.configuration_notebook,
@@ -2224,6 +2453,9 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
             lambda operating_mode=OperatingMode.SIMULATION: self.launch_clover_run(
                 operating_mode
             ),
+            lambda operating_mode=OperatingMode.SIMULATION: self.queue_clover_run(
+                operating_mode
+            ),
         )
         self.configuration_notebook.add(
             self.simulation_frame,
@@ -2236,6 +2468,9 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
             lambda operating_mode=OperatingMode.OPTIMISATION: self.launch_clover_run(
                 operating_mode
             ),
+            lambda operating_mode=OperatingMode.OPTIMISATION: self.queue_clover_run(
+                operating_mode
+            ),
             self.system_lifetime,
         )
         self.configuration_notebook.add(
@@ -2243,6 +2478,14 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
             text="Optimise",
         )
 
+        self.sweep_frame = SweepFrame(
+            self.configuration_notebook, self.help_image, self.launch_clover_sweep
+        )
+        self.configuration_notebook.add(
+            self.sweep_frame,
+            text="Sweep",
+        )
+
         self.bottom_bar_frame = ttk.Frame(self)
         self.bottom_bar_frame.grid(row=2, column=0, columnspan=5, sticky="news")
 
@@ -2299,6 +2542,25 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
         )
         self.forward_button.grid(row=0, column=2, padx=20, pady=(10, 20), sticky="news")
 
+        # Force re-run
+        self.force_rerun: ttk.BooleanVar = ttk.BooleanVar(self, False, "force_rerun")
+        self.force_rerun_button = ttk.Checkbutton(
+            self.bottom_bar_frame,
+            bootstyle=f"{INFO}-round-toggle",
+            text="Force re-run",
+            variable=self.force_rerun,
+        )
+        self.force_rerun_button.grid(
+            row=0, column=3, sticky="e", padx=20, pady=(10, 20)
+        )
+        self.force_rerun_tooltip = ToolTip(
+            self.force_rerun_button,
+            text="Simulations whose inputs are identical to a completed simulation "
+            "open the existing outputs rather than running CLOVER again. Select this "
+            "to run CLOVER regardless.",
+            bootstyle=f"{INFO}-{INVERSE}",
+        )
+
         self.advanced_settings_button = ttk.Button(
             self.bottom_bar_frame,
             bootstyle=INFO,
@@ -2315,11 +2577,45 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
             ipady=20,
         )
 
-    def launch_clover_run(self, operating_mode: OperatingMode) -> None:
-        """Launch a CLOVER simulation."""
+    def _assemble_clover_args(
+        self,
+        operating_mode: OperatingMode,
+        generate_plots: bool | None = None,
+        output_name: str | None = None,
+        pv_size: float | None = None,
+        storage_size: float | None = None,
+    ) -> tuple[list[str], str, str]:
+        """
+        Assemble the arguments needed to carry out a CLOVER run.
 
-        # Save all input files before running.
-        self.save_configuration()
+        The PV size, storage size, plotting and output name are taken from the
+        simulation frame unless overridden.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: generate_plots
+            Whether to generate plots for a simulation.
+
+        :param: output_name
+            The name to give the outputs of a simulation, excluding the timestamp.
+
+        :param: pv_size
+            The PV size to simulate, in kWp.
+
+        :param: storage_size
+            The storage size to simulate, in kWh.
+
+        :returns:
+            A `tuple` containing:
+            - the arguments to pass to CLOVER;
+            - the directory into which CLOVER will save the outputs from the run;
+            - the path to the file in which to save the stdout from the run.
+
+        """
+
+        # Timestamp the run so that its outputs and logs can be identified.
+        run_timestamp: str = datetime.datetime.now().strftime("_%Y_%m_%d_%H_%M_%S_%f")
 
         # Assemble arguments and call to CLOVER.
         clover_args: list[str] = [
@@ -2336,7 +2632,11 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
                 clover_args.extend(
                     [
                         "-pv",
-                        str(self.simulation_frame.pv_size.get()),
+                        str(
+                            pv_size
+                            if pv_size is not None
+                            else self.simulation_frame.pv_size.get()
+                        ),
                     ]
                 )
 
@@ -2345,47 +2645,223 @@ class ConfigurationScreen(BaseScreen, show_navigation=True):
                 clover_args.extend(
                     [
                         "-b",
-                        str(self.simulation_frame.storage_size.get()),
+                        str(
+                            storage_size
+                            if storage_size is not None
+                            else self.simulation_frame.storage_size.get()
+                        ),
                     ]
                 )
 
-            if not self.simulation_frame.generate_plots.get():
+            if not (
+                generate_plots
+                if generate_plots is not None
+                else self.simulation_frame.generate_plots.get()
+            ):
                 clover_args.append("-sp")
 
-            # Append the datetime to the output name then append to the arguments
-            clover_args.extend(
-                [
-                    "-o",
-                    (
-                        output_name := str(self.simulation_frame.output_name.get())
-                        + datetime.datetime.now().strftime("_%Y_%m_%d_%H_%M_%S_%f")
-                    ),
-                ]
+            # Append the datetime to the output name.
+            output_name = (
+                output_name
+                if output_name is not None
+                else str(self.simulation_frame.output_name.get())
+            ) + run_timestamp
+
+        if operating_mode == OperatingMode.OPTIMISATION:
+            clover_args.extend(["-opt"])
+
+            # Name the output by the datetime so that each run has its own outputs.
+            output_name = operating_mode.value + run_timestamp
+
+        # Append the output name to the arguments
+        clover_args.extend(["-o", output_name])
+
+        output_directory: str = os.path.join(
+            get_locations_foldername(),
+            self.location_name.get(),
+            (
+                SIMULATION_OUTPUTS_FOLDER
+                if operating_mode == OperatingMode.SIMULATION
+                else OPTIMISATION_OUTPUTS_FOLDER
+            ),
+            output_name,
+        )
+
+        # Determine where to save the stdout from the run.
+        run_log_filepath: str = os.path.join(
+            get_locations_foldername(),
+            self.location_name.get(),
+            OUTPUTS_FOLDER,
+            RUN_LOGS_DIRECTORY,
+            f"{operating_mode.value}{run_timestamp}.log",
+        )
+
+        return clover_args, output_directory, run_log_filepath
+
+    def launch_clover_sweep(self) -> None:
+        """
+        Launch a sweep of simulations over a grid of PV and storage sizes.
+
+        Each simulation is added to the run queue, so that the sweep is spread across
+        the available cores, and the results are gathered into a results window.
+
+        """
+
+        try:
+            pv_sizes = sweep_values(
+                self.sweep_frame.pv_size_min.get(),
+                self.sweep_frame.pv_size_max.get(),
+                self.sweep_frame.pv_size_step.get(),
+            )
+            storage_sizes = sweep_values(
+                self.sweep_frame.storage_size_min.get(),
+                self.sweep_frame.storage_size_max.get(),
+                self.sweep_frame.storage_size_step.get(),
             )
+        except tk.TclError:
+            return
 
-            # Set the output filename variable
-            self.output_directory_name.set(output_name)
-            self.update_post_run_screen_output_directory_name(
-                os.path.join(
-                    get_locations_foldername(),
-                    self.location_name.get(),
-                    (
-                        SIMULATION_OUTPUTS_FOLDER
-                        if operating_mode == OperatingMode.SIMULATION
-                        else OPTIMISATION_OUTPUTS_FOLDER
+        # Components which are not selected are not swept.
+        if not self.configuration_frame.solar_pv_selected.get():
+            pv_sizes = [0]
+        if not self.configuration_frame.battery_selected.get():
+            storage_sizes = [0]
+
+        # Save all input files once before queueing the runs.
+        self.save_configuration()
+
+        points: list[SweepPoint] = []
+        for pv_size in pv_sizes:
+            for storage_size in storage_sizes:
+                (
+                    clover_args,
+                    output_directory,
+                    run_log_filepath,
+                ) = self._assemble_clover_args(
+                    OperatingMode.SIMULATION,
+                    generate_plots=False,
+                    output_name=(
+                        f"{self.sweep_frame.output_name.get()}_pv_{pv_size}"
+                        f"_storage_{storage_size}"
                     ),
-                    (self.output_directory_name.get()),
+                    pv_size=pv_size,
+                    storage_size=storage_size,
                 )
+                points.append(
+                    SweepPoint(
+                        self.add_run_to_queue(
+                            clover_args,
+                            self.location_name.get(),
+                            OperatingMode.SIMULATION,
+                            output_directory,
+                            run_log_filepath,
+                        ),
+                        pv_size,
+                        storage_size,
+                    )
+                )
+
+        SweepResultsWindow(points, self.sweep_frame.output_name.get())
+
+    def launch_clover_run(self, operating_mode: OperatingMode) -> None:
+        """Launch a CLOVER simulation."""
+
+        # Save all input files before running.
+        self.save_configuration()
+
+        clover_args, output_directory, run_log_filepath = self._assemble_clover_args(
+            operating_mode
+        )
+
+        input_hash: str = self.compute_input_hash(clover_args)
+        location_name: str = self.location_name.get()
+        result_cache = ResultCache(
+            os.path.join(
+                get_locations_foldername(),
+                location_name,
+                OUTPUTS_FOLDER,
+                RESULT_CACHE_DIRECTORY,
             )
+        )
 
-        if operating_mode == OperatingMode.OPTIMISATION:
-            clover_args.extend(["-opt"])
+        # Open the outputs of an identical simulation instead, if one exists.
+        if (
+            operating_mode == OperatingMode.SIMULATION
+            and not self.force_rerun.get()
+            and (cached_output_directory := result_cache.lookup(input_hash))
+        ):
+            self.output_directory_name.set(os.path.basename(cached_output_directory))
+            self.open_run_outputs(cached_output_directory)
+            return
+
+        if operating_mode == OperatingMode.SIMULATION:
+            # Set the output filename variable
+            self.output_directory_name.set(os.path.basename(output_directory))
+            self.update_post_run_screen_output_directory_name(output_directory)
+
+        def run_finished_callback(return_code: int, run_timings: RunTimings) -> None:
+            """
+            Record the run in the run history once it has finished.
 
-            # Append the datetime to the output name then append to the arguments
-            # self.simulation_frame.output_name.get() + datetime.datetime.now().strftime("_%Y_%m_%d_%H_%M_%S_%f")
+            :param: return_code
+                The return code of the run.
+
+            :param: run_timings
+                The timings of the run.
+
+            """
+
+            self.record_run(
+                clover_args,
+                input_hash,
+                location_name,
+                operating_mode,
+                output_directory,
+                return_code,
+                run_timings,
+            )
+
+            if return_code != 0 or operating_mode != OperatingMode.SIMULATION:
+                return
+
+            # Register the outputs of the simulation in the result cache.
+            result_cache.register(input_hash, output_directory)
+
+            # Profiles generated by the run are inputs to subsequent runs.
+            result_cache.register(
+                self.compute_input_hash(clover_args), output_directory
+            )
 
         self.clover_thread = clover_thread(clover_args)
-        self.open_run_screen(self.clover_thread)
+        self.open_run_screen(
+            self.clover_thread,
+            output_directory,
+            run_log_filepath,
+            run_finished_callback,
+        )
+
+    def queue_clover_run(self, operating_mode: OperatingMode) -> None:
+        """
+        Add a CLOVER run to the run queue.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        """
+
+        # Save all input files before queueing.
+        self.save_configuration()
+
+        clover_args, output_directory, run_log_filepath = self._assemble_clover_args(
+            operating_mode
+        )
+        self.add_run_to_queue(
+            clover_args,
+            self.location_name.get(),
+            operating_mode,
+            output_directory,
+            run_log_filepath,
+        )
 
     def pv_button_configuration_callback(self, solar_pv_selected: bool) -> None:
         """
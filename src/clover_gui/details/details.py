@@ -19,6 +19,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import *
 
 from ..__utils__ import DETAILS_GEOMETRY
+from ..input_writer import InputFileWriter
 
 __all__ = ("DetailsWindow",)
 
@@ -53,6 +54,7 @@ class DetailsWindow(tk.Toplevel):
         add_grid_profile_to_scenario_frame,
         add_pv_panel_to_scenario_frame,
         data_directory: str,
+        input_file_writer: InputFileWriter,
         renewables_ninja_token: ttk.StringVar,
         save_configuration: Callable,
         set_batteries_on_scenario_frame,
@@ -79,6 +81,9 @@ class DetailsWindow(tk.Toplevel):
         :param: data_directory
             The name of the data directory.
 
+        :param: input_file_writer
+            The :class:`InputFileWriter` with which the input files are written.
+
         :param: renewables_ninja_token
             The renewables.ninja API token for the user.
 
@@ -178,7 +183,7 @@ class DetailsWindow(tk.Toplevel):
             sticky="news",
         )
 
-        self.load_frame = LoadFrame(self.details_notebook)
+        self.load_frame = LoadFrame(self.details_notebook, input_file_writer)
         self.details_notebook.add(
             self.load_frame,
             text="Load",
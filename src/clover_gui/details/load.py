@@ -36,6 +36,7 @@ from ttkbootstrap.scrolled import *
 from ttkbootstrap.tableview import Tableview
 
 from ..__utils__ import MAIN_TEXT_FONTSIZE
+from ..input_writer import InputFileWriter
 
 __all__ = ("LoadFrame",)
 
@@ -180,10 +181,13 @@ class CSVEntryFrame(ttk.Frame):
     current_cells: list[ttk.Entry | ttk.Text] = []
     current_cell: ttk.Entry | ttk.Text | None = None
 
-    def __init__(self, master=None):
+    def __init__(self, input_file_writer: InputFileWriter, master=None):
         """
         Instantiate the :class:`CSVEntryFrame` instance.
 
+        :param: input_file_writer
+            The :class:`InputFileWriter` with which the input files are written.
+
         :param: master
             The parent instance.
 
@@ -192,6 +196,7 @@ class CSVEntryFrame(ttk.Frame):
         ttk.Frame.__init__(self, master)
 
         self.filename: str | None = None
+        self._input_file_writer = input_file_writer
 
         # Place the frame on the screen.
         self.grid()
@@ -459,6 +464,7 @@ class CSVEntryFrame(ttk.Frame):
 
         self.current_cells = load_cells
         self.current_cell = self.current_cells[0][0]
+        self._input_file_writer.mark_clean({filename: self._cells_contents()})
 
     def _round(self, event) -> None:
         """
@@ -474,25 +480,39 @@ class CSVEntryFrame(ttk.Frame):
         cell.delete(0, END)
         cell.insert(END, str(min(max(float(cell_value), 0), 1)))
 
-    def save_cells(self):
-        filename = self.filename
+    def _cells_contents(self) -> str:
+        """
+        Return the contents of the cells as CSV text.
 
-        vals = []
-        for row in range(len(self.current_cells)):
-            for column in range(len(self.current_cells[0])):
-                vals.append(str(self.current_cells[row][column].get()).strip())
+        :returns:
+            The contents of the cells.
 
-        with open(filename, "w", encoding="UTF-8") as csvfile:
-            for rw in range(len(self.current_cells)):
-                row = ""
-                for row_index in range(len(self.current_cells[0])):
-                    x = rw * len(self.current_cells[0])
-                    if row_index != len(self.current_cells[0]) - 1:
-                        row += vals[x + row_index] + ","
-                    else:
-                        row += vals[x + row_index]
+        """
 
-                csvfile.write(row + "\n")
+        return "".join(
+            ",".join(str(cell.get()).strip() for cell in row) + "\n"
+            for row in self.current_cells
+        )
+
+    def snapshot(self) -> dict[str, str]:
+        """
+        Return the contents of the cells for saving.
+
+        :returns:
+            A mapping between the filename and the contents of the cells, which is
+            empty if no file has been loaded.
+
+        """
+
+        if self.filename is None:
+            return {}
+
+        return {self.filename: self._cells_contents()}
+
+    def save_cells(self):
+        """Save the cells, if they have changed since they were loaded or saved."""
+
+        self._input_file_writer.write(self.filename, self._cells_contents())
 
     def update_device_name(self, device_name: str) -> None:
         """
@@ -526,13 +546,18 @@ class DeviceSettingsFrame(ttk.Labelframe):
 
     """
 
-    def __init__(self, parent: Any, set_device_type: Callable):
+    def __init__(
+        self, parent: Any, input_file_writer: InputFileWriter, set_device_type: Callable
+    ):
         """
         Instantiate a :class:`DeviceSettingsFrame` instance.
 
         :param: parent
             The parent frame.
 
+        :param: input_file_writer
+            The :class:`InputFileWriter` with which the input files are written.
+
         :param: set_device_type
             Callable function to call when setting the device type.
 
@@ -790,6 +815,7 @@ class DeviceSettingsFrame(ttk.Labelframe):
 
         # Device utilisation
         self.csv_entry_frame: CSVEntryFrame = CSVEntryFrame(
+            input_file_writer,
             master=self.scrollable_frame,
         )
         self.csv_entry_frame.grid(
@@ -849,7 +875,18 @@ class LoadFrame(ttk.Frame):
 
     """
 
-    def __init__(self, parent):
+    def __init__(self, parent, input_file_writer: InputFileWriter):
+        """
+        Instantiate a :class:`LoadFrame` instance.
+
+        :param: parent
+            The parent frame.
+
+        :param: input_file_writer
+            The :class:`InputFileWriter` with which the input files are written.
+
+        """
+
         super().__init__(parent)
 
         self.device_utilisations_directory: str | None = None
@@ -936,7 +973,9 @@ class LoadFrame(ttk.Frame):
         )
 
         # Create the right-hand frame for adjusting device settings
-        self.settings_frame = DeviceSettingsFrame(self, self.set_device_type)
+        self.settings_frame = DeviceSettingsFrame(
+            self, input_file_writer, self.set_device_type
+        )
         self.settings_frame.grid(
             row=3, column=1, columnspan=3, padx=20, pady=10, sticky="news", rowspan=2
         )
@@ -0,0 +1,271 @@
+#!/usr/bin/python3.10
+########################################################################################
+# input_writer.py - The input-writer module for CLOVER-GUI application.                #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from threading import Lock
+from typing import Any, Iterable
+
+import pandas as pd
+
+from .yaml_io import dump_yaml
+
+__all__ = (
+    "atomic_write",
+    "digest_input_files",
+    "InputFileWriter",
+    "NEW_FILE_MODE",
+    "serialise_input",
+)
+
+# New file mode:
+#   The mode given to input files when they are first created, being that with which
+#   `open` would create them under the umask of the process when the module is loaded.
+_umask: int = os.umask(0)
+os.umask(_umask)
+NEW_FILE_MODE: int = 0o666 & ~_umask
+
+
+def _file_stamp(filepath: str) -> tuple[int, int] | None:
+    """
+    Return the size and modification time of a file.
+
+    :param: filepath
+        The path to the file.
+
+    :returns:
+        The size and modification time, in nanoseconds, of the file, or `None` if the
+        file does not exist.
+
+    """
+
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def atomic_write(filepath: str, contents: str, encoding: str = "utf-8") -> None:
+    """
+    Write a file such that it is never left partially written.
+
+    The contents are written to a temporary file in the same directory, which then
+    replaces the file in a single step. The file keeps its mode, or is given
+    :data:`NEW_FILE_MODE` if it is new, rather than that of the temporary file, which
+    only its owner can read.
+
+    :param: filepath
+        The path to the file.
+
+    :param: contents
+        The contents to write.
+
+    :param: encoding
+        The encoding with which to write the file.
+
+    """
+
+    directory = os.path.dirname(os.path.abspath(filepath))
+    file_descriptor, temporary_filepath = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(filepath)}.", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(file_descriptor, "w", encoding=encoding) as temporary_file:
+            temporary_file.write(contents)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        try:
+            shutil.copymode(filepath, temporary_filepath)
+        except FileNotFoundError:
+            os.chmod(temporary_filepath, NEW_FILE_MODE)
+        os.replace(temporary_filepath, filepath)
+    except BaseException:
+        try:
+            os.remove(temporary_filepath)
+        except OSError:
+            pass
+        raise
+
+
+def digest_input_files(
+    filepaths: Iterable[str],
+) -> dict[str, tuple[str, tuple[int, int] | None]]:
+    """
+    Compute the digest of input files as they are on disk.
+
+    Each file is stamped before it is read, so that a file modified meanwhile no longer
+    matches its stamp and is written when next saved. This makes no calls to tkinter
+    and so can be run in a background thread.
+
+    :param: filepaths
+        The paths to the files.
+
+    :returns:
+        A mapping between the path to each file which exists and the hex digest of its
+        contents along with its size and modification time, in nanoseconds.
+
+    """
+
+    digests: dict[str, tuple[str, tuple[int, int] | None]] = {}
+    for filepath in filepaths:
+        if (stamp := _file_stamp(filepath)) is None:
+            continue
+        try:
+            with open(filepath, "rb") as input_file:
+                digest = hashlib.sha256(input_file.read()).hexdigest()
+        except OSError:
+            continue
+        digests[filepath] = (digest, stamp)
+
+    return digests
+
+
+def serialise_input(data: Any) -> str:
+    """
+    Serialise the contents of an input file.
+
+    :param: data
+        The contents of the file: text, which is returned as is, a
+        :class:`pandas.DataFrame`, which is written as CSV, or any other data, which is
+        written as YAML.
+
+    :returns:
+        The serialised contents.
+
+    """
+
+    if isinstance(data, str):
+        return data
+
+    if isinstance(data, pd.DataFrame):
+        return data.to_csv()
+
+    return dump_yaml(data)
+
+
+class InputFileWriter:
+    """
+    Writes the input files of a location, skipping those which have not changed.
+
+    The digest of the contents of each file as last loaded or saved is kept, along with
+    the size and modification time of the file at that point. A file is only written if
+    its contents have changed or if it has been modified by something else since.
+
+    The writer can be shared between threads.
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate a :class:`InputFileWriter` instance."""
+
+        self._lock = Lock()
+        self._saved: dict[str, tuple[str, tuple[int, int] | None]] = {}
+
+    @staticmethod
+    def _digest(contents: str) -> str:
+        """
+        Compute the digest of the contents of a file.
+
+        :param: contents
+            The contents of the file.
+
+        :returns:
+            The hex digest of the contents.
+
+        """
+
+        return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+    def is_dirty(self, filepath: str, contents: str) -> bool:
+        """
+        Return whether a file needs to be written.
+
+        :param: filepath
+            The path to the file.
+
+        :param: contents
+            The contents which the file should have.
+
+        :returns:
+            Whether the contents differ from those last loaded or saved, or whether the
+            file has changed on disk since.
+
+        """
+
+        with self._lock:
+            saved = self._saved.get(filepath)
+
+        if saved is None:
+            return True
+
+        return saved != (self._digest(contents), _file_stamp(filepath))
+
+    def mark_clean(self, contents_by_filepath: dict[str, str]) -> None:
+        """
+        Record the contents of files as they have just been loaded.
+
+        :param: contents_by_filepath
+            A mapping between the path to each file and the contents which the screens
+            hold for it.
+
+        """
+
+        saved = {
+            filepath: (self._digest(contents), _file_stamp(filepath))
+            for filepath, contents in contents_by_filepath.items()
+        }
+
+        with self._lock:
+            self._saved.update(saved)
+
+    def mark_files_clean(
+        self, digests: dict[str, tuple[str, tuple[int, int] | None]]
+    ) -> None:
+        """
+        Record the digests of files as they are on disk, e.g., as they have been loaded.
+
+        :param: digests
+            The digests of the files, as returned by :func:`digest_input_files`.
+
+        """
+
+        with self._lock:
+            self._saved.update(digests)
+
+    def write(self, filepath: str, contents: str) -> bool:
+        """
+        Write a file if its contents have changed.
+
+        :param: filepath
+            The path to the file.
+
+        :param: contents
+            The contents which the file should have.
+
+        :returns:
+            Whether the file was written.
+
+        """
+
+        if not self.is_dirty(filepath, contents):
+            return False
+
+        atomic_write(filepath, contents)
+        with self._lock:
+            self._saved[filepath] = (self._digest(contents), _file_stamp(filepath))
+
+        return True
@@ -0,0 +1,196 @@
+#!/usr/bin/python3.10
+########################################################################################
+# inputs_snapshot.py - The inputs-snapshot module for CLOVER-GUI application.          #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from typing import Any, Iterable
+
+from clover import __version__, INPUTS_DIRECTORY
+
+__all__ = (
+    "INPUTS_SNAPSHOT_DIRECTORY",
+    "read_inputs_snapshot",
+    "stamp_location_inputs",
+    "write_inputs_snapshot",
+)
+
+# Inputs snapshot directory:
+#   The per-user directory holding the inputs snapshots. These are kept outside of the
+#   locations, which are shared, copied and imported, so that only snapshots written by
+#   the user are ever unpickled.
+INPUTS_SNAPSHOT_DIRECTORY: str = os.path.join(
+    os.environ.get("LOCALAPPDATA")
+    or os.environ.get("XDG_CACHE_HOME")
+    or os.path.join(os.path.expanduser("~"), ".cache"),
+    "clover-gui",
+    "inputs_snapshots",
+)
+
+# Snapshot version:
+#   The version of the snapshot format, changed whenever the parsed inputs change.
+SNAPSHOT_VERSION: int = 2
+
+
+def _file_stamps(filepaths: Iterable[str]) -> dict[str, tuple[int, int] | None]:
+    """
+    Return the size and modification time of each file.
+
+    :param: filepaths
+        The paths to the files.
+
+    :returns:
+        A mapping between each path and the size and modification time, in nanoseconds,
+        of the file, or `None` if the file does not exist.
+
+    """
+
+    stamps: dict[str, tuple[int, int] | None] = {}
+    for filepath in filepaths:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            stamps[filepath] = None
+        else:
+            stamps[filepath] = (stat.st_size, stat.st_mtime_ns)
+
+    return stamps
+
+
+def _snapshot_filepath(location_directory: str) -> str:
+    """
+    Return the path to the inputs snapshot of a location.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        The path to the snapshot, named by the hash of the location's absolute path.
+
+    """
+
+    location_hash = hashlib.sha256(
+        os.path.realpath(location_directory).encode("utf-8")
+    ).hexdigest()
+
+    return os.path.join(INPUTS_SNAPSHOT_DIRECTORY, f"{location_hash}.pickle")
+
+
+def read_inputs_snapshot(location_directory: str) -> Any | None:
+    """
+    Read the snapshot of a location's parsed inputs, if it is still valid.
+
+    Only the key of the snapshot is read in order to validate it: the sizes and
+    modification times of the input files are compared with those recorded before the
+    inputs were parsed.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        The parsed inputs, or `None` if there is no valid snapshot.
+
+    """
+
+    try:
+        with open(_snapshot_filepath(location_directory), "rb") as snapshot_file:
+            version, clover_version, stamps = pickle.load(snapshot_file)
+            if (
+                version != SNAPSHOT_VERSION
+                or clover_version != __version__
+                or _file_stamps(stamps) != stamps
+            ):
+                return None
+
+            return pickle.load(snapshot_file)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def stamp_location_inputs(location_directory: str) -> dict[str, tuple[int, int] | None]:
+    """
+    Record the size and modification time of each of a location's input files.
+
+    This should be called before the inputs are parsed, so that any file edited whilst
+    they are being parsed invalidates the snapshot written from them. The directories
+    are included so that files which are added are noticed.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        A mapping between the path to each input file, and directory, and its size and
+        modification time.
+
+    """
+
+    filepaths: list[str] = []
+    for dirpath, _, filenames in os.walk(
+        os.path.join(location_directory, INPUTS_DIRECTORY)
+    ):
+        filepaths.append(dirpath)
+        filepaths.extend(os.path.join(dirpath, filename) for filename in filenames)
+
+    return _file_stamps(filepaths)
+
+
+def write_inputs_snapshot(
+    location_directory: str,
+    inputs: Any,
+    stamps: dict[str, tuple[int, int] | None],
+) -> None:
+    """
+    Write a snapshot of a location's parsed inputs.
+
+    The snapshot is only written if the inputs can be pickled, and is never left
+    partially written.
+
+    :param: location_directory
+        The directory of the location.
+
+    :param: inputs
+        The parsed inputs.
+
+    :param: stamps
+        The stamps of the input files, recorded by :func:`stamp_location_inputs` before
+        the inputs were parsed.
+
+    """
+
+    try:
+        key = pickle.dumps((SNAPSHOT_VERSION, __version__, stamps))
+        contents = pickle.dumps(inputs)
+    except Exception:  # pylint: disable=broad-except
+        return
+
+    snapshot_filepath = _snapshot_filepath(location_directory)
+    try:
+        os.makedirs(INPUTS_SNAPSHOT_DIRECTORY, mode=0o700, exist_ok=True)
+        file_descriptor, temporary_filepath = tempfile.mkstemp(
+            dir=INPUTS_SNAPSHOT_DIRECTORY,
+            prefix=f".{os.path.basename(snapshot_filepath)}.",
+            suffix=".tmp",
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(key)
+            temporary_file.write(contents)
+        os.replace(temporary_filepath, snapshot_filepath)
+    except OSError:
+        try:
+            os.remove(temporary_filepath)
+        except OSError:
+            pass
@@ -9,20 +9,878 @@
 # For more information, contact: benedict.winchester@gmail.com                         #
 ########################################################################################
 
+import datetime
 import os
+import sqlite3
+import tempfile
 import tkinter as tk
 
-from typing import Callable
+from collections import defaultdict
+from dataclasses import dataclass
+from logging import Logger
+from queue import Empty, Queue
+from threading import Thread
+from typing import Any, Callable
 
+import pandas as pd
 import ttkbootstrap as ttk
 
+from clover import (
+    INPUTS_DIRECTORY,
+    InputFileError,
+    Location,
+    parse_input_files,
+    Simulation,
+)
+from clover.__main__ import AUTO_GENERATED_FILES_DIRECTORY
 from clover.__utils__ import get_locations_foldername
+from clover.fileparser import (
+    DEVICE_UTILISATION_TEMPLATE_FILENAME,
+    DEVICE_UTILISATIONS_INPUT_DIRECTORY,
+    FINANCE_INPUTS_FILE,
+    GHG_INPUTS_FILE,
+    GRID_TIMES_FILE,
+    LOCATION_INPUTS_FILE,
+    OPTIMISATION_INPUTS_FILE,
+    OPTIMISATIONS,
+    parse_scenario_inputs,
+    SIMULATIONS_INPUTS_FILE,
+    WATER_SOURCE_INPUTS_FILE,
+)
+from clover.impact.finance import ImpactingComponent
+from clover.load.load import Device
+from clover.mains_supply.grid import get_lifetime_grid_status
+from clover.optimisation import Optimisation, OptimisationParameters
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import *
 
-from .__utils__ import BaseScreen, BIG_BUTTON_FONTSIZE, LOAD_LOCATION_GEOMETRY
+from .__utils__ import (
+    BaseScreen,
+    BIG_BUTTON_FONTSIZE,
+    format_value,
+    LOAD_LOCATION_GEOMETRY,
+    parse_battery_inputs,
+    parse_diesel_inputs,
+    parse_solar_inputs,
+)
+from .input_writer import digest_input_files
+from .inputs_snapshot import (
+    read_inputs_snapshot,
+    stamp_location_inputs,
+    write_inputs_snapshot,
+)
+from .location_index import LOCATION_COLUMNS, LocationIndex
+from .yaml_io import read_yaml
 
-__all__ = ("LoadLocationWindow",)
+# The parsers of the individual input files are private to CLOVER, and so may change or
+# be removed in any release, in which case the full parse is used instead.
+try:
+    from clover.fileparser import (
+        _parse_conversion_inputs,
+        _parse_device_inputs,
+        _parse_minigrid_inputs,
+    )
+except ImportError:
+    _parse_conversion_inputs = _parse_device_inputs = _parse_minigrid_inputs = None
+
+__all__ = (
+    "LocationInputs",
+    "LocationLoader",
+    "LoadLocationWindow",
+    "load_location_inputs",
+    "parse_location_inputs",
+    "pregenerate_grid_profiles",
+)
+
+# Location-index poll interval:
+#   The interval, in milliseconds, at which the refresh of the location index is
+#   checked.
+LOCATION_INDEX_POLL_INTERVAL: int = 100
+
+# Location-loader poll interval:
+#   The interval, in milliseconds, at which the parsing of a location is checked.
+LOCATION_LOADER_POLL_INTERVAL: int = 50
+
+# Location page size:
+#   The number of locations appended to the location catalogue at a time as the user
+#   scrolls through it.
+LOCATION_PAGE_SIZE: int = 100
+
+# Minigrid inputs length:
+#   The number of values returned by CLOVER's parser of the minigrid inputs, in the
+#   versions of CLOVER with which the inputs displayed can be parsed on their own.
+MINIGRID_INPUTS_LENGTH: int = 32
+
+# Location search delay:
+#   The time, in milliseconds, after the last keystroke before the location catalogue
+#   is filtered.
+LOCATION_SEARCH_DELAY: int = 150
+
+
+class _UnsupportedCloverError(Exception):
+    """Raised when the private parsers of the installed CLOVER cannot be used."""
+
+
+@dataclass
+class LocationInputs:
+    """
+    Represents the parsed inputs of a location, ready to be displayed.
+
+    .. attribute:: batteries
+        The batteries, along with their costs and emissions.
+
+    .. attribute:: device_utilisations
+        The utilisation profile of each device.
+
+    .. attribute:: diesel_generators
+        The diesel generators, along with their costs and emissions.
+
+    .. attribute:: finance_inputs
+        The finance inputs, combined with the grid emissions.
+
+    .. attribute:: ghg_inputs
+        The GHG inputs.
+
+    .. attribute:: grid_times
+        The grid-availability profiles.
+
+    .. attribute:: input_file_info
+        Information about the input files which were parsed.
+
+    .. attribute:: location
+        The :class:`Location` being loaded.
+
+    .. attribute:: minigrid
+        The minigrid.
+
+    .. attribute:: optimisation_inputs
+        The optimisation inputs.
+
+    .. attribute:: optimisations
+        The optimisations.
+
+    .. attribute:: pv_panels
+        The PV panels, along with their costs and emissions.
+
+    .. attribute:: scenarios
+        The scenarios.
+
+    .. attribute:: simulations
+        The simulations.
+
+    """
+
+    batteries: tuple[list, dict[str, dict[str, float]], dict[str, dict[str, float]]]
+    device_utilisations: dict[Any, Any]
+    diesel_generators: tuple[
+        list, dict[str, dict[str, float]], dict[str, dict[str, float]]
+    ]
+    finance_inputs: dict[str, Any]
+    ghg_inputs: dict[str, Any]
+    grid_times: Any
+    input_file_info: dict[str, str]
+    location: Location
+    minigrid: Any
+    optimisation_inputs: Any
+    optimisations: list[Any]
+    pv_panels: tuple[list, dict[str, dict[str, float]], dict[str, dict[str, float]]]
+    scenarios: list[Any]
+    simulations: list[Any]
+
+
+def _float_defaultdict() -> defaultdict[str, float]:
+    """Return a `defaultdict` of floats, used in place of a lambda so as to pickle."""
+
+    return defaultdict(float)
+
+
+def _format_timestamp(timestamp: float | None) -> str:
+    """
+    Format a time for display in the location catalogue.
+
+    :param: timestamp
+        The time, in seconds since the epoch.
+
+    :returns:
+        The formatted time.
+
+    """
+
+    if timestamp is None:
+        return ""
+
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def _private_parser_result(parser: Callable | None, length: int, *args) -> tuple:
+    """
+    Call one of CLOVER's private parsers, checking the values it returns.
+
+    :param: parser
+        The parser, or `None` if the installed CLOVER does not provide it.
+
+    :param: length
+        The number of values which the parser is expected to return.
+
+    :param: args
+        The arguments with which to call the parser.
+
+    :returns:
+        The values returned by the parser.
+
+    :raises: _UnsupportedCloverError
+        If the parser is not provided, or returns an unexpected number of values.
+
+    """
+
+    if parser is None:
+        raise _UnsupportedCloverError("CLOVER does not provide the parsers needed.")
+
+    if not isinstance(result := parser(*args), tuple) or len(result) != length:
+        raise _UnsupportedCloverError(
+            f"CLOVER's {parser.__name__} returned "
+            f"{len(result) if isinstance(result, tuple) else 1} values rather than "
+            f"{length}."
+        )
+
+    return result
+
+
+def _read_yaml_inputs(filepath: str, logger: Logger, input_type: type) -> Any:
+    """
+    Read a YAML inputs file, checking the type of its contents.
+
+    :param: filepath
+        The path to the inputs file.
+
+    :param: logger
+        The :class:`logging.Logger` to use for the run.
+
+    :param: input_type
+        The type which the contents of the file should have.
+
+    :returns:
+        The contents of the file.
+
+    """
+
+    contents = read_yaml(filepath, logger)
+    if not isinstance(contents, input_type):
+        raise InputFileError(
+            os.path.basename(filepath),
+            f"The file contents are not of type `{input_type.__name__}`.",
+        )
+
+    return contents
+
+
+def _parse_all_inputs(location_name: str, logger: Logger) -> LocationInputs:
+    """
+    Parse all of the inputs of a location with :func:`clover.parse_input_files`.
+
+    :param: location_name
+        The name of the location to parse.
+
+    :param: logger
+        The :class:`logging.Logger` to use for the run.
+
+    :returns:
+        The parsed inputs.
+
+    """
+
+    (
+        _,
+        device_utilisations,
+        minigrid,
+        finance_inputs,
+        ghg_inputs,
+        _,
+        grid_times,
+        location,
+        optimisation_inputs,
+        optimisations,
+        scenarios,
+        simulations,
+        _,
+        _,
+        _,
+        input_file_info,
+    ) = parse_input_files(
+        None,
+        False,
+        None,
+        location_name,
+        get_locations_foldername(),
+        logger,
+        None,
+    )
+
+    # Combine the inputs, to phase out.
+    finance_inputs[ImpactingComponent.GRID.value].update(
+        ghg_inputs[ImpactingComponent.GRID.value]
+    )
+
+    inputs_directory_relative_path = os.path.join(
+        get_locations_foldername(), location_name, INPUTS_DIRECTORY
+    )
+    return LocationInputs(
+        parse_battery_inputs(inputs_directory_relative_path, logger),
+        device_utilisations,
+        parse_diesel_inputs(inputs_directory_relative_path, logger),
+        finance_inputs,
+        ghg_inputs,
+        grid_times,
+        input_file_info,
+        location,
+        minigrid,
+        optimisation_inputs,
+        optimisations,
+        parse_solar_inputs(inputs_directory_relative_path, logger),
+        scenarios,
+        simulations,
+    )
+
+
+def _parse_displayed_inputs(location_name: str, logger: Logger) -> LocationInputs:
+    """
+    Parse only the inputs of a location which are displayed in the GUI.
+
+    Unlike :func:`clover.parse_input_files`, the conventional water-source inputs and
+    availability profiles are not read and the impacts of each component are not
+    collated, as the GUI parses these itself. No hourly profiles are read, and so the
+    time taken does not depend on the length of the location's profiles.
+
+    :param: location_name
+        The name of the location to parse.
+
+    :param: logger
+        The :class:`logging.Logger` to use for the run.
+
+    :returns:
+        The parsed inputs.
+
+    :raises: _UnsupportedCloverError
+        If the private parsers of the installed CLOVER cannot be used.
+
+    """
+
+    inputs_directory_relative_path = os.path.join(
+        get_locations_foldername(), location_name, INPUTS_DIRECTORY
+    )
+
+    # Parse the converters, which are needed by the optimisation and minigrid inputs.
+    conversion_inputs_filepath, _, _, converters = _private_parser_result(
+        _parse_conversion_inputs, 4, inputs_directory_relative_path, logger
+    )
+
+    # Parse the devices and their utilisation profiles.
+    device_inputs_filepath, devices = _private_parser_result(
+        _parse_device_inputs, 2, inputs_directory_relative_path, logger
+    )
+    device_utilisations: dict[Device, pd.DataFrame] = {}
+    for device in devices:
+        try:
+            device_utilisations[device] = pd.read_csv(
+                os.path.join(
+                    inputs_directory_relative_path,
+                    DEVICE_UTILISATIONS_INPUT_DIRECTORY,
+                    DEVICE_UTILISATION_TEMPLATE_FILENAME.format(device=device.name),
+                ),
+                header=None,
+                index_col=None,
+            )
+        except FileNotFoundError:
+            logger.info("No device-utilisation profile for %s.", device.name)
+            device_utilisations[device] = pd.DataFrame([[0] * 12] * 24)
+
+    # Parse the scenarios, optimisations and simulations.
+    (
+        desalination_scenario_inputs_filepath,
+        hot_water_scenario_inputs_filepath,
+        scenarios,
+        scenario_inputs_filepath,
+    ) = parse_scenario_inputs(inputs_directory_relative_path, logger)
+
+    optimisation_inputs_filepath = os.path.join(
+        inputs_directory_relative_path, OPTIMISATION_INPUTS_FILE
+    )
+    optimisation_file_contents = _read_yaml_inputs(
+        optimisation_inputs_filepath, logger, dict
+    )
+    optimisation_inputs = OptimisationParameters.from_dict(
+        list(converters.values()), logger, optimisation_file_contents
+    )
+    optimisations = [
+        Optimisation.from_dict(logger, entry, scenarios)
+        for entry in optimisation_file_contents[OPTIMISATIONS]
+    ]
+
+    simulations_inputs_filepath = os.path.join(
+        inputs_directory_relative_path, SIMULATIONS_INPUTS_FILE
+    )
+    simulations = [
+        Simulation.from_dict(entry)
+        for entry in _read_yaml_inputs(simulations_inputs_filepath, logger, list)
+    ]
+
+    # Parse the impact inputs.
+    finance_inputs_filepath = os.path.join(
+        inputs_directory_relative_path, FINANCE_INPUTS_FILE
+    )
+    finance_inputs: defaultdict[str, Any] = defaultdict(_float_defaultdict)
+    finance_inputs.update(_read_yaml_inputs(finance_inputs_filepath, logger, dict))
+
+    ghg_inputs_filepath = os.path.join(inputs_directory_relative_path, GHG_INPUTS_FILE)
+    ghg_inputs: defaultdict[str, Any] = defaultdict(_float_defaultdict)
+    ghg_inputs.update(_read_yaml_inputs(ghg_inputs_filepath, logger, dict))
+
+    # Parse the minigrid.
+    (
+        _,
+        _,
+        battery_inputs_filepath,
+        _,
+        _,
+        _,
+        _,
+        _,
+        _,
+        diesel_fuel_impact,
+        diesel_inputs_filepath,
+        _,
+        _,
+        energy_system_inputs_filepath,
+        _,
+        _,
+        _,
+        _,
+        _,
+        minigrid,
+        _,
+        _,
+        _,
+        _,
+        solar_generation_inputs_filepath,
+        _,
+        _,
+        tank_inputs_filepath,
+        _,
+        _,
+        transmission_inputs_filepath,
+        _,
+    ) = _private_parser_result(
+        _parse_minigrid_inputs,
+        MINIGRID_INPUTS_LENGTH,
+        converters,
+        False,
+        finance_inputs,
+        inputs_directory_relative_path,
+        logger,
+        scenarios,
+    )
+
+    # The diesel-fuel impact, if specified, is taken from the diesel inputs file.
+    if diesel_fuel_impact is not None:
+        finance_inputs[ImpactingComponent.DIESEL_FUEL.value] = defaultdict(
+            float, diesel_fuel_impact
+        )
+        ghg_inputs[ImpactingComponent.DIESEL_FUEL.value] = defaultdict(
+            float, diesel_fuel_impact
+        )
+
+    # Combine the inputs, to phase out.
+    finance_inputs[ImpactingComponent.GRID.value].update(
+        ghg_inputs[ImpactingComponent.GRID.value]
+    )
+
+    # Parse the grid profiles and location.
+    grid_times_filepath = os.path.join(inputs_directory_relative_path, GRID_TIMES_FILE)
+    grid_times = pd.read_csv(grid_times_filepath, index_col=0)
+
+    location_inputs_filepath = os.path.join(
+        inputs_directory_relative_path, LOCATION_INPUTS_FILE
+    )
+    location = Location.from_dict(
+        _read_yaml_inputs(location_inputs_filepath, logger, dict)
+    )
+
+    input_file_info: dict[str, str] = {
+        "batteries": battery_inputs_filepath,
+        "converters": conversion_inputs_filepath,
+        "devices": device_inputs_filepath,
+        "diesel_inputs": diesel_inputs_filepath,
+        "energy_system": energy_system_inputs_filepath,
+        "finance_inputs": finance_inputs_filepath,
+        "ghg_inputs": ghg_inputs_filepath,
+        "grid_times": grid_times_filepath,
+        "location_inputs": location_inputs_filepath,
+        "optimisation_inputs": optimisation_inputs_filepath,
+        "scenarios": scenario_inputs_filepath,
+        "simulation": simulations_inputs_filepath,
+        "solar_inputs": solar_generation_inputs_filepath,
+        "transmission_inputs": transmission_inputs_filepath,
+    }
+    if any(scenario.desalination_scenario is not None for scenario in scenarios):
+        input_file_info["conventional_water_source_inputs"] = os.path.join(
+            inputs_directory_relative_path, WATER_SOURCE_INPUTS_FILE
+        )
+        input_file_info["desalination_scenario"] = (
+            desalination_scenario_inputs_filepath
+        )
+        if tank_inputs_filepath is not None:
+            input_file_info["tank_inputs"] = tank_inputs_filepath
+    if any(scenario.hot_water_scenario is not None for scenario in scenarios):
+        input_file_info["hot_water_scenario"] = hot_water_scenario_inputs_filepath
+
+    return LocationInputs(
+        parse_battery_inputs(inputs_directory_relative_path, logger),
+        device_utilisations,
+        parse_diesel_inputs(inputs_directory_relative_path, logger),
+        finance_inputs,
+        ghg_inputs,
+        grid_times,
+        input_file_info,
+        location,
+        minigrid,
+        optimisation_inputs,
+        optimisations,
+        parse_solar_inputs(inputs_directory_relative_path, logger),
+        scenarios,
+        simulations,
+    )
+
+
+def parse_location_inputs(location_name: str, logger: Logger) -> LocationInputs:
+    """
+    Parse the inputs of a location which are displayed in the GUI.
+
+    Only the input files which the configuration and details screens display are read
+    where the installed CLOVER allows, with all of the location's inputs parsed
+    otherwise.
+
+    This makes no calls to tkinter and so can be run in a background thread.
+
+    :param: location_name
+        The name of the location to parse.
+
+    :param: logger
+        The :class:`logging.Logger` to use for the run.
+
+    :returns:
+        The parsed inputs.
+
+    """
+
+    try:
+        return _parse_displayed_inputs(location_name, logger)
+    except _UnsupportedCloverError as e:
+        logger.warning("Parsing all inputs of location '%s': %s", location_name, e)
+
+    return _parse_all_inputs(location_name, logger)
+
+
+def load_location_inputs(location_name: str, logger: Logger) -> LocationInputs:
+    """
+    Load the inputs of a location, reusing its inputs snapshot if nothing has changed.
+
+    If none of the input files have changed since the snapshot was written, the inputs
+    are read from the snapshot. Otherwise, the inputs are parsed and a new snapshot
+    is written.
+
+    This makes no calls to tkinter and so can be run in a background thread.
+
+    :param: location_name
+        The name of the location to load.
+
+    :param: logger
+        The :class:`logging.Logger` to use for the run.
+
+    :returns:
+        The inputs of the location.
+
+    """
+
+    location_directory = os.path.join(get_locations_foldername(), location_name)
+    if isinstance(inputs := read_inputs_snapshot(location_directory), LocationInputs):
+        logger.info("Inputs of location '%s' read from snapshot.", location_name)
+        return inputs
+
+    # The input files are stamped before they are parsed so that any edited meanwhile
+    # invalidate the snapshot.
+    stamps = stamp_location_inputs(location_directory)
+    inputs = parse_location_inputs(location_name, logger)
+    write_inputs_snapshot(location_directory, inputs, stamps)
+
+    return inputs
+
+
+def pregenerate_grid_profiles(
+    location_name: str, inputs: LocationInputs, logger: Logger
+) -> None:
+    """
+    Generate the grid-availability profiles of a location ahead of its first run.
+
+    The profiles are generated in a temporary directory and each is then moved into
+    place, unless CLOVER has generated it in the meantime, so that a run never reads a
+    partially-written profile.
+
+    :param: location_name
+        The name of the location.
+
+    :param: inputs
+        The parsed inputs of the location.
+
+    :param: logger
+        The :class:`logging.Logger` to use.
+
+    """
+
+    if not any(scenario.grid for scenario in inputs.scenarios):
+        return
+
+    max_years: int = inputs.location.max_years
+    grid_directory = os.path.join(
+        get_locations_foldername(),
+        location_name,
+        AUTO_GENERATED_FILES_DIRECTORY,
+        "grid",
+    )
+    os.makedirs(grid_directory, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(
+        dir=grid_directory, prefix=".", suffix=".tmp"
+    ) as temporary_directory:
+        get_lifetime_grid_status(
+            True, temporary_directory, inputs.grid_times, logger, max_years
+        )
+        for filename in os.listdir(temporary_directory):
+            try:
+                os.link(
+                    os.path.join(temporary_directory, filename),
+                    os.path.join(grid_directory, filename),
+                )
+            except FileExistsError:
+                continue
+            except OSError:
+                if not os.path.exists(os.path.join(grid_directory, filename)):
+                    os.replace(
+                        os.path.join(temporary_directory, filename),
+                        os.path.join(grid_directory, filename),
+                    )
+
+    logger.info("Grid-availability profiles generated for %s.", location_name)
+
+
+class LocationLoader:
+    """
+    Loads a location without blocking the GUI.
+
+    The location's inputs are parsed in a background thread. Once parsed, the inputs
+    are displayed in a series of steps, each of which is scheduled as a separate
+    callback so that the GUI remains responsive throughout. The load can be cancelled
+    at any point, after which any inputs still being parsed are discarded.
+
+    .. attribute:: cancelled
+        Whether the load has been cancelled.
+
+    .. attribute:: location_name
+        The name of the location being loaded.
+
+    .. attribute:: populating
+        Whether the parsed inputs have started to be displayed.
+
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        location_name: str,
+        logger: Logger,
+        populate_steps: Callable,
+        load_completed_callback: Callable,
+        load_failed_callback: Callable,
+        set_progress: Callable,
+        prepare: Callable[[Callable[[str, float], None]], None] | None = None,
+        set_status: Callable[[str], None] | None = None,
+        follow_up: Callable[[LocationInputs], None] | None = None,
+    ) -> None:
+        """
+        Instantiate a :class:`LocationLoader` instance, starting the load.
+
+        :param: widget
+            The widget used to schedule callbacks on the main thread.
+
+        :param: location_name
+            The name of the location to load.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        :param: populate_steps
+            A callable function which, given the :class:`LocationInputs`, returns the
+            steps with which to display them.
+
+        :param: load_completed_callback
+            A callable function to call once the location has been loaded, with the
+            digests of its input files as they were parsed, as returned by
+            :func:`digest_input_files`.
+
+        :param: load_failed_callback
+            A callable function to call, with the exception raised, if the location
+            could not be parsed.
+
+        :param: set_progress
+            A callable function which sets the progress of the load, as a percentage.
+
+        :param: prepare
+            If specified, a callable function run in the background thread before the
+            location is parsed, e.g., to create it. It is passed a function with which
+            to report each stage that it reaches, along with the progress at that
+            stage, as a percentage.
+
+        :param: set_status
+            If specified, a callable function which displays the stage reached.
+
+        :param: follow_up
+            If specified, a callable function run in the background thread with the
+            parsed inputs once they have been passed to the main thread, e.g., to
+            generate profiles whilst the location is being displayed and edited.
+
+        """
+
+        self.cancelled: bool = False
+        self.location_name: str = location_name
+        self.populating: bool = False
+
+        self._after_id: str | None = None
+        self._follow_up = follow_up
+        self._input_file_digests: dict[str, tuple[str, tuple[int, int] | None]] = {}
+        self._load_completed_callback = load_completed_callback
+        self._load_failed_callback = load_failed_callback
+        self._populate_steps = populate_steps
+        self._prepare = prepare
+        self._progress_offset: float = 0
+        self._result_queue: Queue = Queue()
+        self._set_progress = set_progress
+        self._set_status = set_status
+        self._widget = widget
+
+        self._parsing_thread = Thread(target=self._parse, args=(logger,), daemon=True)
+        self._parsing_thread.start()
+        self._after_id = self._widget.after(LOCATION_LOADER_POLL_INTERVAL, self._poll)
+
+    def _parse(self, logger: Logger) -> None:
+        """
+        Parse the location's inputs and pass the result to the main thread.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        """
+
+        try:
+            if self._prepare is not None:
+                self._prepare(self._report_stage)
+            inputs = load_location_inputs(self.location_name, logger)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Failed to parse location '%s': %s", self.location_name, e)
+            self._result_queue.put(e)
+            return
+
+        # The input files are digested here, rather than once displayed, so that an
+        # unchanged file is not written when the location is next saved.
+        self._input_file_digests = digest_input_files(
+            filepath
+            for filepath in inputs.input_file_info.values()
+            if filepath is not None
+        )
+        self._result_queue.put(inputs)
+
+        if self._follow_up is None or self.cancelled:
+            return
+
+        try:
+            self._follow_up(inputs)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(
+                "Failed to follow up the load of location '%s': %s",
+                self.location_name,
+                e,
+            )
+
+    def _poll(self) -> None:
+        """Check whether the location's inputs have been parsed."""
+
+        try:
+            while isinstance(result := self._result_queue.get_nowait(), tuple):
+                status, self._progress_offset = result
+                self._set_progress(self._progress_offset)
+                if self._set_status is not None:
+                    self._set_status(status)
+        except Empty:
+            self._after_id = self._widget.after(
+                LOCATION_LOADER_POLL_INTERVAL, self._poll
+            )
+            return
+
+        self._after_id = None
+        if isinstance(result, Exception):
+            self._load_failed_callback(result)
+            return
+
+        self.populating = True
+        steps: list[Callable] = self._populate_steps(result)
+        self._after_id = self._widget.after_idle(self._run_step, steps, 0)
+
+    def _report_stage(self, status: str, progress: float) -> None:
+        """
+        Report a stage reached whilst preparing the location to the main thread.
+
+        :param: status
+            A description of the stage.
+
+        :param: progress
+            The progress of the load at this stage, as a percentage.
+
+        """
+
+        self._result_queue.put((status, progress))
+
+    def _run_step(self, steps: list[Callable], index: int) -> None:
+        """
+        Run a single step of displaying the location's inputs.
+
+        :param: steps
+            The steps with which to display the inputs.
+
+        :param: index
+            The index of the step to run.
+
+        """
+
+        steps[index]()
+        self._set_progress(
+            self._progress_offset
+            + (100 - self._progress_offset) * (index + 1) / len(steps)
+        )
+
+        if index + 1 < len(steps):
+            self._after_id = self._widget.after_idle(self._run_step, steps, index + 1)
+            return
+
+        self._after_id = None
+        self._load_completed_callback(self._input_file_digests)
+
+    def cancel(self) -> None:
+        """Cancel the load, discarding any inputs still being parsed."""
+
+        self.cancelled = True
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
 
 
 class LoadLocationScreen(BaseScreen, show_navigation=False):
@@ -35,16 +893,28 @@ class LoadLocationScreen(BaseScreen, show_navigation=False):
 
     """
 
-    def __init__(self, parent, load_location_callback: Callable) -> None:
+    def __init__(
+        self,
+        parent,
+        cancel_load_location_callback: Callable,
+        load_location_callback: Callable,
+        logger: Logger,
+    ) -> None:
         """
         Instantiate a :class:`LoadLocationScreen` instance.
 
         :param: parent
             The parent window or frame.
 
+        :param: cancel_load_location_callback
+            The callback function for cancelling the loading of a location.
+
         :param: load_location_callback
             The callback function for loading an existing location.
 
+        :param: logger
+            The :class:`logging.Logger` to use.
+
         """
 
         super().__init__(parent)
@@ -53,10 +923,12 @@ class LoadLocationScreen(BaseScreen, show_navigation=False):
         self.columnconfigure(0, weight=2)  # First row has the header
         self.columnconfigure(1, weight=1)  # These rows have entries
 
-        self.rowconfigure(0, weight=6)
-        self.rowconfigure(1, weight=3)
-        self.rowconfigure(2, weight=3)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+        self.rowconfigure(2, weight=10)
         self.rowconfigure(3, weight=1)
+        self.rowconfigure(4, weight=1)
+        self.rowconfigure(5, weight=1)
 
         self.label = ttk.Label(
             self,
@@ -66,61 +938,280 @@ class LoadLocationScreen(BaseScreen, show_navigation=False):
         self.label.grid(row=0, column=0, columnspan=2, pady=10)
 
         self.location_name_label = ttk.Label(self, text="Location name")
-        self.location_name_label.grid(row=1, column=0, sticky="e")
+        self.location_name_label.grid(row=1, column=0, padx=20, sticky="e")
 
         self.load_location_name: ttk.StringVar = ttk.StringVar(self)
+        self.search: ttk.StringVar = ttk.StringVar(self, "")
 
-        self.load_location_combobox = ttk.Combobox(
-            self,
-            bootstyle="primary",
-            textvariable=self.load_location_name,
-            state=READONLY,
+        self.search_entry = ttk.Entry(
+            self, bootstyle="primary", textvariable=self.search
+        )
+        self.search_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+        self.search_entry.bind("<Return>", lambda _: self._load_selected_location())
+        self.search_entry.bind("<Down>", lambda _: self.locations_treeview.focus_set())
+        self.search.trace_add("write", lambda *_: self._schedule_search())
+
+        # Location catalogue
+        self.locations_frame = ttk.Frame(self)
+        self.locations_frame.grid(
+            row=2, column=0, columnspan=2, padx=20, pady=5, sticky="news"
+        )
+        self.locations_frame.columnconfigure(0, weight=1)
+        self.locations_frame.rowconfigure(0, weight=1)
+
+        self.locations_scrollbar = ttk.Scrollbar(
+            self.locations_frame, bootstyle=f"{PRIMARY}-round", orient=VERTICAL
+        )
+        self.locations_scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.locations_treeview = ttk.Treeview(
+            self.locations_frame,
+            bootstyle=PRIMARY,
+            columns=list(LOCATION_COLUMNS),
+            selectmode=BROWSE,
+            show="headings",
+            yscrollcommand=self._scroll_locations,
         )
-        self.load_location_combobox.grid(
-            row=1, column=1, padx=10, pady=5, sticky="w", ipadx=80
+        for column, database_column in LOCATION_COLUMNS.items():
+            self.locations_treeview.heading(
+                column,
+                text=column,
+                anchor=W,
+                command=lambda column=database_column: self._sort_by(column),
+            )
+            self.locations_treeview.column(
+                column, width=200 if column == "Name" else 80, minwidth=60, stretch=True
+            )
+        self.locations_treeview.grid(row=0, column=0, sticky="news")
+        self.locations_treeview.bind("<<TreeviewSelect>>", self.select_location)
+        self.locations_treeview.bind(
+            "<Double-1>", lambda _: self._load_selected_location()
         )
-        self.load_location_combobox.bind("<<ComboboxSelected>>", self.select_location)
-        self.populate_available_locations()
+        self.locations_treeview.bind(
+            "<Return>", lambda _: self._load_selected_location()
+        )
+        self.locations_scrollbar.configure(command=self.locations_treeview.yview)
+
+        self.count_label = ttk.Label(self, bootstyle=SECONDARY, text="")
+        self.count_label.grid(row=3, column=0, padx=20, sticky="w")
 
+        self.load_location_callback = load_location_callback
         self.load_button = ttk.Button(
             self,
             text="Load",
             bootstyle=f"{PRIMARY}-outline",
             command=load_location_callback,
         )
-        self.load_button.grid(row=2, column=1, padx=10, pady=10, ipadx=80, ipady=20)
+        self.load_button.grid(row=3, column=1, padx=10, pady=10, ipadx=80, ipady=20)
 
         self.progress_bar = ttk.Progressbar(
             self, bootstyle=f"{PRIMARY}-striped", mode="determinate"
         )
         self.progress_bar.grid(
-            row=3, column=0, columnspan=2, pady=20, padx=20, sticky="ew"
+            row=4, column=0, columnspan=2, pady=20, padx=20, sticky="ew"
+        )
+
+        self.status_label = ttk.Label(self, bootstyle=SECONDARY, text="")
+        self.status_label.grid(row=5, column=0, padx=20, pady=10, sticky="w")
+
+        self.cancel_button = ttk.Button(
+            self,
+            text="Cancel",
+            bootstyle=f"{DANGER}-outline",
+            command=cancel_load_location_callback,
+            state=DISABLED,
         )
+        self.cancel_button.grid(row=5, column=1, padx=10, pady=10, sticky="e")
 
-    def populate_available_locations(self) -> None:
-        """Populates available locations for selection."""
+        self.location_index = LocationIndex(get_locations_foldername())
+        self.logger = logger
 
-        if not os.path.isdir(
-            locations_foldername := get_locations_foldername(),
+        self._append_after_id: str | None = None
+        self._displayed_count: int = 0
+        self._matching_count: int = 0
+        self._refresh_after_id: str | None = None
+        self._refresh_queue: Queue = Queue()
+        self._search_after_id: str | None = None
+        self._sort_column: str = "name"
+        self._sort_descending: bool = False
+
+        self.display_locations()
+        self.refresh_location_index()
+
+    def _append_locations(self) -> None:
+        """Append the next page of matching locations to the catalogue."""
+
+        self._append_after_id = None
+        try:
+            self._matching_count, locations = self.location_index.query(
+                self.search.get().strip(),
+                self._sort_column,
+                self._sort_descending,
+                LOCATION_PAGE_SIZE,
+                self._displayed_count,
+            )
+        except sqlite3.Error as e:
+            self.logger.error("Failed to query the location index: %s", e)
+            self._matching_count, locations = self._displayed_count, []
+
+        for location in locations:
+            self.locations_treeview.insert(
+                "",
+                END,
+                iid=location["name"],
+                values=(
+                    location["name"],
+                    format_value(location["latitude"]),
+                    format_value(location["longitude"]),
+                    (
+                        f"UTC{location['time_difference']:+g}"
+                        if location["time_difference"] is not None
+                        else ""
+                    ),
+                    _format_timestamp(location["modified"]),
+                    _format_timestamp(location["last_run"]),
+                    location["run_count"],
+                ),
+            )
+        self._displayed_count += len(locations)
+
+        self.count_label.configure(
+            text=f"{self._matching_count} location"
+            + ("" if self._matching_count == 1 else "s")
+        )
+
+    def _load_selected_location(self) -> None:
+        """Load the location currently selected, if any."""
+
+        if (
+            len(self.locations_treeview.selection()) > 0
+            and str(self.load_button.cget("state")) != DISABLED
         ):
+            self.load_location_callback()
+
+    def _poll_refresh(self) -> None:
+        """Check whether the background refresh of the location index has finished."""
+
+        try:
+            changed = self._refresh_queue.get_nowait()
+        except Empty:
+            self._refresh_after_id = self.after(
+                LOCATION_INDEX_POLL_INTERVAL, self._poll_refresh
+            )
             return
 
-        self.load_location_combobox["values"] = sorted(
-            [
-                entry
-                for entry in os.listdir(locations_foldername)
-                if (
-                    os.path.isdir(os.path.join(locations_foldername, entry))
-                    and not entry.startswith(".")
-                )
-            ]
+        self._refresh_after_id = None
+        if changed:
+            self.display_locations()
+
+    def _refresh_index(self) -> None:
+        """
+        Refresh the location index and pass whether it changed to the main thread.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+
+        """
+
+        try:
+            self._refresh_queue.put(self.location_index.refresh(self.logger))
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error("Failed to refresh the location index: %s", e)
+            self._refresh_queue.put(False)
+
+    def _schedule_search(self) -> None:
+        """Filter the catalogue once the user pauses typing."""
+
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+
+        self._search_after_id = self.after(LOCATION_SEARCH_DELAY, self._search)
+
+    def _scroll_locations(self, first: str, last: str) -> None:
+        """
+        Update the scrollbar, appending further locations once the end is reached.
+
+        :param: first
+            The fraction of the catalogue above the visible rows.
+
+        :param: last
+            The fraction of the catalogue above the end of the visible rows.
+
+        """
+
+        self.locations_scrollbar.set(first, last)
+        if (
+            float(last) >= 1
+            and self._displayed_count < self._matching_count
+            and self._append_after_id is None
+        ):
+            self._append_after_id = self.after_idle(self._append_locations)
+
+    def _search(self) -> None:
+        """Display the locations which match the search."""
+
+        self._search_after_id = None
+        self.display_locations()
+
+    def _sort_by(self, column: str) -> None:
+        """
+        Sort the locations by a column, reversing the order if already sorted by it.
+
+        :param: column
+            The database column to sort by.
+
+        """
+
+        self._sort_descending = (
+            column == self._sort_column and not self._sort_descending
+        )
+        self._sort_column = column
+        self.display_locations()
+
+    def display_locations(self) -> None:
+        """
+        Display the locations which match the search from the location index.
+
+        Only the first page of matching locations is displayed, with further pages
+        appended as the user scrolls through the catalogue.
+
+        """
+
+        if self._append_after_id is not None:
+            self.after_cancel(self._append_after_id)
+
+        self.locations_treeview.delete(*self.locations_treeview.get_children())
+        self._displayed_count = 0
+        self._append_locations()
+
+        if self.locations_treeview.exists(self.load_location_name.get()):
+            self.locations_treeview.selection_set(self.load_location_name.get())
+            self.locations_treeview.see(self.load_location_name.get())
+        elif len(children := self.locations_treeview.get_children()) > 0:
+            self.locations_treeview.selection_set(children[0])
+
+    def refresh_location_index(self) -> None:
+        """
+        Refresh the location index in the background.
+
+        The locations already indexed are displayed straight away, and the catalogue is
+        updated once any locations which have been added, modified or removed since have
+        been indexed.
+
+        """
+
+        if self._refresh_after_id is not None:
+            return
+
+        Thread(target=self._refresh_index, daemon=True).start()
+        self._refresh_after_id = self.after(
+            LOCATION_INDEX_POLL_INTERVAL, self._poll_refresh
         )
-        self.load_location_name.set(self.load_location_combobox["values"][0])
 
     def select_location(self, _) -> None:
         """Selects the location specified."""
 
-        self.load_location_name.set(self.load_location_combobox.get())
+        if len(selection := self.locations_treeview.selection()) > 0:
+            self.load_location_name.set(selection[0])
 
 
 class LoadLocationWindow(tk.Toplevel):
@@ -134,13 +1225,24 @@ class LoadLocationWindow(tk.Toplevel):
 
     """
 
-    def __init__(self, load_location_callback: Callable) -> None:
+    def __init__(
+        self,
+        cancel_load_location_callback: Callable,
+        load_location_callback: Callable,
+        logger: Logger,
+    ) -> None:
         """
         Instantiate a :class:`LoadLocationWindow` instance.
 
+        :param: cancel_load_location_callback:
+            The callback function for when the loading of a location is cancelled.
+
         :param: load_location_callback:
             The callback function for when an existing location is to be loaded.
 
+        :param: logger:
+            The :class:`logging.Logger` to use.
+
         """
 
         # Instntiate the parent class
@@ -150,7 +1252,9 @@ class LoadLocationWindow(tk.Toplevel):
 
         self.geometry(LOAD_LOCATION_GEOMETRY)
 
-        self.load_location_frame = LoadLocationScreen(self, load_location_callback)
+        self.load_location_frame = LoadLocationScreen(
+            self, cancel_load_location_callback, load_location_callback, logger
+        )
 
         self.protocol("WM_DELETE_WINDOW", self.withdraw)
 
@@ -161,6 +1265,26 @@ class LoadLocationWindow(tk.Toplevel):
         """
 
         self.load_location_frame.progress_bar.grid(
-            row=3, column=0, columnspan=2, pady=20, padx=20, sticky="ew"
+            row=4, column=0, columnspan=2, pady=20, padx=20, sticky="ew"
         )
         self.load_location_frame.progress_bar.start()
+        self.load_location_frame.cancel_button.configure(state="enabled")
+        self.load_location_frame.load_button.configure(state=DISABLED)
+        self.load_location_frame.status_label.configure(
+            text=f"Loading {self.load_location_frame.load_location_name.get()}"
+        )
+
+    def reset_progress_bar(self, status: str = "") -> None:
+        """
+        Reset the progress bar once a location has loaded, or failed to load.
+
+        :param: status
+            A message to display about the load.
+
+        """
+
+        self.load_location_frame.progress_bar.stop()
+        self.load_location_frame.progress_bar["value"] = 0
+        self.load_location_frame.cancel_button.configure(state=DISABLED)
+        self.load_location_frame.load_button.configure(state="enabled")
+        self.load_location_frame.status_label.configure(text=status)
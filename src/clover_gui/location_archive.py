@@ -0,0 +1,804 @@
+#!/usr/bin/python3.10
+########################################################################################
+# location_archive.py - The location-archive module for CLOVER-GUI application.        #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import abc
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import tempfile
+import tkinter as tk
+import zipfile
+
+from logging import Logger
+from queue import Empty, Queue
+from threading import Event, Thread
+from tkinter import filedialog
+from typing import Callable
+
+import ttkbootstrap as ttk
+
+from clover import OUTPUTS_FOLDER
+from clover.__main__ import AUTO_GENERATED_FILES_DIRECTORY
+from clover.__utils__ import get_locations_foldername
+from ttkbootstrap.constants import *
+
+from .column_cache import COLUMN_CACHE_DIRECTORY
+from .location_index import LOCATION_INDEX_FILENAME
+from .plot_cache import THUMBNAILS_DIRECTORY
+from .result_cache import RESULT_CACHE_DIRECTORY
+
+__all__ = (
+    "ArchiveError",
+    "export_location",
+    "ExportLocationWindow",
+    "import_location",
+    "ImportLocationWindow",
+    "location_files",
+    "LocationArchiveWindow",
+    "new_location_directory",
+    "read_archive_location_name",
+)
+
+# Archive chunk size:
+#   The number of bytes streamed at a time into or out of an archive.
+ARCHIVE_CHUNK_SIZE: int = 1 << 20
+
+# Archive filetypes:
+#   The filetypes offered when choosing a location archive.
+ARCHIVE_FILETYPES: list[tuple[str, str]] = [("CLOVER location archives", "*.zip")]
+
+# Archive manifest filename:
+#   The name of the file, at the root of an archive, listing the checksum of each file.
+ARCHIVE_MANIFEST_FILENAME: str = "clover_location_manifest.json"
+
+# Archive poll interval:
+#   The interval, in milliseconds, at which the progress of an archive is checked.
+ARCHIVE_POLL_INTERVAL: int = 100
+
+# Archive version:
+#   The version of the archive format, changed whenever the manifest changes.
+ARCHIVE_VERSION: int = 1
+
+# Excluded directories:
+#   Directories which are never archived: OS metadata and GUI caches which are only
+#   valid on the machine on which they were created.
+EXCLUDED_DIRECTORIES: set[str] = {
+    "__MACOSX",
+    COLUMN_CACHE_DIRECTORY,
+    RESULT_CACHE_DIRECTORY,
+    THUMBNAILS_DIRECTORY,
+}
+
+# Excluded filenames:
+#   Files which are never archived: OS metadata and GUI caches which are only valid on
+#   the machine on which they were created.
+EXCLUDED_FILENAMES: set[str] = {
+    ".DS_Store",
+    "desktop.ini",
+    "Thumbs.db",
+    LOCATION_INDEX_FILENAME,
+}
+
+
+class ArchiveError(Exception):
+    """Raised when a location archive cannot be written or is invalid."""
+
+
+def _is_excluded(name: str, directory: bool = False) -> bool:
+    """
+    Return whether a file or directory should be left out of an archive.
+
+    :param: name
+        The name of the file or directory.
+
+    :param: directory
+        Whether the name is that of a directory.
+
+    :returns:
+        Whether the file or directory is OS metadata or a GUI cache.
+
+    """
+
+    if directory:
+        return name in EXCLUDED_DIRECTORIES
+
+    return (
+        name in EXCLUDED_FILENAMES
+        or name.startswith("._")
+        or (name.startswith(".") and name.endswith(".tmp"))
+    )
+
+
+def _read_manifest(archive: zipfile.ZipFile) -> dict:
+    """
+    Read and validate the manifest of a location archive.
+
+    :param: archive
+        The open archive.
+
+    :returns:
+        The manifest.
+
+    """
+
+    try:
+        manifest = json.loads(archive.read(ARCHIVE_MANIFEST_FILENAME))
+    except KeyError:
+        raise ArchiveError(
+            "The archive was not exported from CLOVER-GUI: it has no manifest."
+        ) from None
+    except ValueError as e:
+        raise ArchiveError(f"The manifest of the archive is invalid: {e}") from None
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != ARCHIVE_VERSION
+        or not isinstance(manifest.get("location"), str)
+        or not isinstance(manifest.get("files"), dict)
+    ):
+        raise ArchiveError("The manifest of the archive is not supported.")
+
+    return manifest
+
+
+def export_location(
+    location_directory: str,
+    archive_filepath: str,
+    include_auto_generated: bool,
+    include_outputs: bool,
+    progress_callback: Callable[[int, int], None],
+    cancel_event: Event,
+) -> None:
+    """
+    Export a location to a compressed archive.
+
+    Each file is streamed into the archive, and hashed, a chunk at a time. The archive
+    is written alongside its destination and only moved into place once complete.
+
+    :param: location_directory
+        The directory of the location.
+
+    :param: archive_filepath
+        The path to the archive to write.
+
+    :param: include_auto_generated
+        Whether to include the profiles which CLOVER generated for the location.
+
+    :param: include_outputs
+        Whether to include the outputs of the location's runs.
+
+    :param: progress_callback
+        Called with the number of bytes archived so far and the total to archive.
+
+    :param: cancel_event
+        Set in order to cancel the export.
+
+    """
+
+    location_name = os.path.basename(os.path.normpath(location_directory))
+    files = location_files(location_directory, include_auto_generated, include_outputs)
+    total_size = sum(os.path.getsize(filepath) for filepath, _ in files)
+
+    file_descriptor, temporary_filepath = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(archive_filepath)),
+        prefix=f".{os.path.basename(archive_filepath)}.",
+        suffix=".tmp",
+    )
+    os.close(file_descriptor)
+
+    try:
+        checksums: dict[str, str] = {}
+        archived_size: int = 0
+        with zipfile.ZipFile(
+            temporary_filepath, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for filepath, relative_path in files:
+                info = zipfile.ZipInfo.from_file(
+                    filepath, posixpath.join(location_name, relative_path)
+                )
+                info.compress_type = zipfile.ZIP_DEFLATED
+                checksum = hashlib.sha256()
+                with open(filepath, "rb") as source_file, archive.open(
+                    info, "w", force_zip64=True
+                ) as archive_file:
+                    while chunk := source_file.read(ARCHIVE_CHUNK_SIZE):
+                        if cancel_event.is_set():
+                            raise ArchiveError("The export was cancelled.")
+                        checksum.update(chunk)
+                        archive_file.write(chunk)
+                        archived_size += len(chunk)
+                        progress_callback(archived_size, total_size)
+                checksums[relative_path] = checksum.hexdigest()
+
+            archive.writestr(
+                ARCHIVE_MANIFEST_FILENAME,
+                json.dumps(
+                    {
+                        "version": ARCHIVE_VERSION,
+                        "location": location_name,
+                        "files": checksums,
+                    },
+                    indent=2,
+                ),
+            )
+
+        os.replace(temporary_filepath, archive_filepath)
+    except BaseException:
+        try:
+            os.remove(temporary_filepath)
+        except OSError:
+            pass
+        raise
+
+
+def import_location(
+    archive_filepath: str,
+    location_name: str,
+    progress_callback: Callable[[int, int], None],
+    cancel_event: Event,
+) -> str:
+    """
+    Import a location from an archive exported by :func:`export_location`.
+
+    Each file is streamed out of the archive a chunk at a time, and its checksum
+    compared with that in the archive's manifest. The location is extracted alongside
+    the other locations and only moved into place once every file has been verified.
+
+    :param: archive_filepath
+        The path to the archive.
+
+    :param: location_name
+        The name to give the imported location.
+
+    :param: progress_callback
+        Called with the number of bytes extracted so far and the total to extract.
+
+    :param: cancel_event
+        Set in order to cancel the import.
+
+    :returns:
+        The directory of the imported location.
+
+    """
+
+    locations_foldername = get_locations_foldername()
+    location_directory = new_location_directory(location_name)
+
+    with zipfile.ZipFile(archive_filepath) as archive:
+        manifest = _read_manifest(archive)
+        prefix = f"{manifest['location']}/"
+
+        members: list[tuple[zipfile.ZipInfo, str]] = []
+        for info in archive.infolist():
+            if (
+                info.filename == ARCHIVE_MANIFEST_FILENAME
+                or info.is_dir()
+                or any(
+                    _is_excluded(name) or _is_excluded(name, True)
+                    for name in info.filename.split("/")
+                )
+            ):
+                continue
+            relative_path = posixpath.normpath(info.filename[len(prefix) :])
+            if (
+                not info.filename.startswith(prefix)
+                or relative_path.startswith(("/", "../"))
+                or relative_path in (".", "..")
+            ):
+                raise ArchiveError(
+                    f"The archive contains an unsafe path: {info.filename}"
+                )
+            if relative_path not in manifest["files"]:
+                raise ArchiveError(
+                    f"'{relative_path}' is missing from the manifest of the archive."
+                )
+            members.append((info, relative_path))
+
+        if len(missing := manifest["files"].keys() - {path for _, path in members}):
+            raise ArchiveError(
+                f"The archive is missing files listed in its manifest: {missing}"
+            )
+
+        total_size = sum(info.file_size for info, _ in members)
+        extracted_size: int = 0
+        os.makedirs(locations_foldername, exist_ok=True)
+        temporary_directory = tempfile.mkdtemp(
+            dir=locations_foldername, prefix=f".{location_name}.", suffix=".import"
+        )
+
+        try:
+            for info, relative_path in members:
+                filepath = os.path.join(temporary_directory, *relative_path.split("/"))
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                checksum = hashlib.sha256()
+                with archive.open(info) as archive_file, open(
+                    filepath, "wb"
+                ) as destination_file:
+                    while chunk := archive_file.read(ARCHIVE_CHUNK_SIZE):
+                        if cancel_event.is_set():
+                            raise ArchiveError("The import was cancelled.")
+                        checksum.update(chunk)
+                        destination_file.write(chunk)
+                        extracted_size += len(chunk)
+                        progress_callback(extracted_size, total_size)
+                if checksum.hexdigest() != manifest["files"][relative_path]:
+                    raise ArchiveError(f"'{relative_path}' failed its checksum.")
+
+            if os.path.exists(location_directory):
+                raise ArchiveError(
+                    f"A location named '{location_name}' already exists."
+                )
+            os.rename(temporary_directory, location_directory)
+        except BaseException:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+            raise
+
+    return location_directory
+
+
+def location_files(
+    location_directory: str, include_auto_generated: bool, include_outputs: bool
+) -> list[tuple[str, str]]:
+    """
+    List the files of a location which should be archived.
+
+    :param: location_directory
+        The directory of the location.
+
+    :param: include_auto_generated
+        Whether to include the profiles which CLOVER generated for the location.
+
+    :param: include_outputs
+        Whether to include the outputs of the location's runs.
+
+    :returns:
+        The path to each file along with its path, using forward slashes, relative to
+        the location's directory.
+
+    """
+
+    excluded_top_level: set[str] = set()
+    if not include_auto_generated:
+        excluded_top_level.add(AUTO_GENERATED_FILES_DIRECTORY)
+    if not include_outputs:
+        excluded_top_level.add(OUTPUTS_FOLDER)
+
+    files: list[tuple[str, str]] = []
+    for directory, subdirectories, filenames in os.walk(location_directory):
+        relative_directory = os.path.relpath(directory, location_directory)
+        subdirectories[:] = sorted(
+            subdirectory
+            for subdirectory in subdirectories
+            if not _is_excluded(subdirectory, True)
+            and not (relative_directory == "." and subdirectory in excluded_top_level)
+        )
+        for filename in sorted(filenames):
+            if _is_excluded(filename):
+                continue
+            filepath = os.path.join(directory, filename)
+            files.append(
+                (
+                    filepath,
+                    os.path.relpath(filepath, location_directory).replace(os.sep, "/"),
+                )
+            )
+
+    return files
+
+
+def new_location_directory(location_name: str) -> str:
+    """
+    Return the directory of a location which is about to be created.
+
+    :param: location_name
+        The name of the new location.
+
+    :returns:
+        The directory of the new location.
+
+    """
+
+    if location_name in ("", ".", "..") or any(
+        separator in location_name for separator in ("/", os.sep)
+    ):
+        raise ArchiveError(f"'{location_name}' is not a valid location name.")
+
+    location_directory = os.path.join(get_locations_foldername(), location_name)
+    if os.path.exists(location_directory):
+        raise ArchiveError(f"A location named '{location_name}' already exists.")
+
+    return location_directory
+
+
+def read_archive_location_name(archive_filepath: str) -> str:
+    """
+    Read the name of the location held within an archive.
+
+    :param: archive_filepath
+        The path to the archive.
+
+    :returns:
+        The name of the location.
+
+    """
+
+    try:
+        with zipfile.ZipFile(archive_filepath) as archive:
+            return _read_manifest(archive)["location"]
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(f"The file is not a valid archive: {e}") from None
+
+
+class LocationArchiveWindow(tk.Toplevel, abc.ABC):
+    """
+    Represents a popup window which exports or imports a location in the background.
+
+    Subclasses implement :meth:`start`, which gathers the options chosen and passes the
+    export or import to :meth:`_start`.
+
+    .. attribute:: options_frame
+        The frame holding the options of the export or import.
+
+    """
+
+    def __init__(self, logger: Logger, title: str, button_text: str) -> None:
+        """
+        Instantiate a :class:`LocationArchiveWindow` instance.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        :param: title
+            The title of the window.
+
+        :param: button_text
+            The text of the button which starts the export or import.
+
+        """
+
+        super().__init__()
+
+        self.title(title)
+        self.geometry("600x300")
+        self.protocol("WM_DELETE_WINDOW", self.cancel_and_destroy)
+
+        self.logger = logger
+
+        self._after_id: str | None = None
+        self._cancel_event: Event | None = None
+        self._progress_queue: Queue = Queue()
+        self._title: str = title
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=4)
+        self.rowconfigure(1, weight=1)
+        self.rowconfigure(2, weight=1)
+
+        self.options_frame = ttk.Frame(self)
+        self.options_frame.grid(row=0, column=0, padx=20, pady=10, sticky="news")
+        self.options_frame.columnconfigure(1, weight=1)
+
+        self.progress_bar = ttk.Progressbar(
+            self, bootstyle=f"{PRIMARY}-striped", mode="determinate"
+        )
+        self.progress_bar.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
+
+        self.buttons_frame = ttk.Frame(self)
+        self.buttons_frame.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
+        self.buttons_frame.columnconfigure(0, weight=1)
+
+        self.status_label = ttk.Label(self.buttons_frame, bootstyle=SECONDARY, text="")
+        self.status_label.grid(row=0, column=0, sticky="w")
+
+        self.start_button = ttk.Button(
+            self.buttons_frame,
+            bootstyle=f"{PRIMARY}-{OUTLINE}",
+            command=self.start,
+            text=button_text,
+        )
+        self.start_button.grid(row=0, column=1, padx=10, sticky="e")
+
+        self.cancel_button = ttk.Button(
+            self.buttons_frame,
+            bootstyle=f"{DANGER}-{OUTLINE}",
+            command=self.cancel,
+            state=DISABLED,
+            text="Cancel",
+        )
+        self.cancel_button.grid(row=0, column=2, sticky="e")
+
+    def _poll(self) -> None:
+        """Display the progress of the export or import."""
+
+        try:
+            while True:
+                message = self._progress_queue.get_nowait()
+                if message[0] == "progress":
+                    done, total = message[1:]
+                    self.progress_bar["value"] = 100 * done / total if total > 0 else 0
+                    continue
+                self._finish(*message)
+                return
+        except Empty:
+            self._after_id = self.after(ARCHIVE_POLL_INTERVAL, self._poll)
+
+    def _finish(self, outcome: str, status: str) -> None:
+        """
+        Display the outcome of the export or import.
+
+        :param: outcome
+            Either "done" or "failed".
+
+        :param: status
+            A message to display about the export or import.
+
+        """
+
+        self._after_id = None
+        self._cancel_event = None
+        if outcome == "done":
+            self.progress_bar["value"] = 100
+        self.status_label.configure(text=status)
+        self.start_button.configure(state="enabled")
+        self.cancel_button.configure(state=DISABLED)
+
+    def _run(self, task: Callable[[Callable, Event], str], cancel_event: Event) -> None:
+        """
+        Run the export or import and pass its outcome to the main thread.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+
+        :param: task
+            Called with the progress callback and the cancel event, returning a message
+            to display once complete.
+
+        :param: cancel_event
+            Set in order to cancel the task.
+
+        """
+
+        try:
+            status = task(
+                lambda done, total: self._progress_queue.put(("progress", done, total)),
+                cancel_event,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("%s failed: %s", self._title, e)
+            self._progress_queue.put(("failed", str(e)))
+        else:
+            self._progress_queue.put(("done", status))
+
+    def _start(self, task: Callable[[Callable, Event], str], status: str) -> None:
+        """
+        Start the export or import in a background thread.
+
+        :param: task
+            Called with the progress callback and the cancel event, returning a message
+            to display once complete.
+
+        :param: status
+            A message to display whilst the task is running.
+
+        """
+
+        self._cancel_event = Event()
+        self.progress_bar["value"] = 0
+        self.status_label.configure(text=status)
+        self.start_button.configure(state=DISABLED)
+        self.cancel_button.configure(state="enabled")
+
+        Thread(target=self._run, args=(task, self._cancel_event), daemon=True).start()
+        self._after_id = self.after(ARCHIVE_POLL_INTERVAL, self._poll)
+
+    def cancel(self) -> None:
+        """Cancel the export or import in progress."""
+
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def cancel_and_destroy(self) -> None:
+        """Cancel any export or import in progress and close the window."""
+
+        self.cancel()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self.destroy()
+
+    @abc.abstractmethod
+    def start(self) -> None:
+        """Start the export or import."""
+
+
+class ExportLocationWindow(LocationArchiveWindow):
+    """
+    Represents the export-location popup window.
+
+    The export-location window enables a user to export a location to a compressed
+    archive, with or without its generated profiles and outputs.
+
+    .. attribute:: location_name
+        The name of the location to export.
+
+    """
+
+    def __init__(self, location_name: str, logger: Logger) -> None:
+        """
+        Instantiate a :class:`ExportLocationWindow` instance.
+
+        :param: location_name
+            The name of the location to export.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        """
+
+        super().__init__(
+            logger, f"CLOVER-GUI Export Location: {location_name}", "Export"
+        )
+
+        self.location_name = location_name
+
+        self.include_auto_generated = ttk.BooleanVar(self, False)
+        self.include_outputs = ttk.BooleanVar(self, False)
+
+        self.label = ttk.Label(
+            self.options_frame,
+            style=f"{PRIMARY}",
+            text=f"Export {location_name} to an archive",
+        )
+        self.label.grid(row=0, column=0, columnspan=2, pady=10, sticky="w")
+
+        for row, (text, variable) in enumerate(
+            [
+                ("Include auto-generated profiles", self.include_auto_generated),
+                ("Include outputs", self.include_outputs),
+            ],
+            1,
+        ):
+            ttk.Checkbutton(
+                self.options_frame,
+                bootstyle=f"{PRIMARY}-round-toggle",
+                text=text,
+                variable=variable,
+            ).grid(row=row, column=0, columnspan=2, pady=5, sticky="w")
+
+    def start(self) -> None:
+        """Choose where to save the archive and export the location to it."""
+
+        if (
+            archive_filepath := filedialog.asksaveasfilename(
+                parent=self,
+                defaultextension=".zip",
+                filetypes=ARCHIVE_FILETYPES,
+                initialfile=f"{self.location_name}.zip",
+                title="Export location",
+            )
+        ) == "":
+            return
+
+        location_directory = os.path.join(
+            get_locations_foldername(), self.location_name
+        )
+        include_auto_generated = self.include_auto_generated.get()
+        include_outputs = self.include_outputs.get()
+
+        def _export(progress_callback: Callable, cancel_event: Event) -> str:
+            export_location(
+                location_directory,
+                archive_filepath,
+                include_auto_generated,
+                include_outputs,
+                progress_callback,
+                cancel_event,
+            )
+            return f"Exported to {os.path.basename(archive_filepath)}"
+
+        self._start(_export, f"Exporting {self.location_name}")
+
+
+class ImportLocationWindow(LocationArchiveWindow):
+    """
+    Represents the import-location popup window.
+
+    The import-location window enables a user to import a location from an archive
+    exported by CLOVER-GUI.
+
+    .. attribute:: archive_filepath
+        The path to the archive chosen.
+
+    .. attribute:: location_name
+        The name to give the imported location.
+
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        """
+        Instantiate a :class:`ImportLocationWindow` instance.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        """
+
+        super().__init__(logger, "CLOVER-GUI Import Location", "Import")
+
+        self.archive_filepath = ttk.StringVar(self, "")
+        self.location_name = ttk.StringVar(self, "")
+
+        self.label = ttk.Label(
+            self.options_frame,
+            style=f"{PRIMARY}",
+            text="Import a location from an archive",
+        )
+        self.label.grid(row=0, column=0, columnspan=3, pady=10, sticky="w")
+
+        self.archive_label = ttk.Label(self.options_frame, text="Archive")
+        self.archive_label.grid(row=1, column=0, pady=5, sticky="w")
+        self.archive_entry = ttk.Entry(
+            self.options_frame,
+            bootstyle=PRIMARY,
+            state=READONLY,
+            textvariable=self.archive_filepath,
+        )
+        self.archive_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+        self.browse_button = ttk.Button(
+            self.options_frame,
+            bootstyle=f"{PRIMARY}-{OUTLINE}",
+            command=self.choose_archive,
+            text="Browse",
+        )
+        self.browse_button.grid(row=1, column=2, pady=5, sticky="e")
+
+        self.location_name_label = ttk.Label(self.options_frame, text="Location name")
+        self.location_name_label.grid(row=2, column=0, pady=5, sticky="w")
+        self.location_name_entry = ttk.Entry(
+            self.options_frame, bootstyle=PRIMARY, textvariable=self.location_name
+        )
+        self.location_name_entry.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+
+    def choose_archive(self) -> None:
+        """Choose the archive to import, naming the location after that within it."""
+
+        if (
+            archive_filepath := filedialog.askopenfilename(
+                parent=self, filetypes=ARCHIVE_FILETYPES, title="Import location"
+            )
+        ) == "":
+            return
+
+        self.archive_filepath.set(archive_filepath)
+        try:
+            self.location_name.set(read_archive_location_name(archive_filepath))
+        except (ArchiveError, OSError) as e:
+            self.status_label.configure(text=str(e))
+        else:
+            self.status_label.configure(text="")
+
+    def start(self) -> None:
+        """Import the location from the archive chosen."""
+
+        if (archive_filepath := self.archive_filepath.get()) == "":
+            self.choose_archive()
+            if (archive_filepath := self.archive_filepath.get()) == "":
+                return
+
+        location_name = self.location_name.get().strip()
+
+        def _import(progress_callback: Callable, cancel_event: Event) -> str:
+            import_location(
+                archive_filepath, location_name, progress_callback, cancel_event
+            )
+            return f"Imported {location_name}"
+
+        self._start(_import, f"Importing {location_name}")
@@ -0,0 +1,258 @@
+#!/usr/bin/python3.10
+########################################################################################
+# location_clone.py - The location-clone module for CLOVER-GUI application.            #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import os
+import shutil
+import tempfile
+
+from logging import Logger
+from threading import Event
+from typing import Callable
+
+import ttkbootstrap as ttk
+
+from clover import INPUTS_DIRECTORY
+from clover.__main__ import AUTO_GENERATED_FILES_DIRECTORY
+from clover.__utils__ import get_locations_foldername
+from ttkbootstrap.constants import *
+
+from .__utils__ import LOCATIONS_INPUT_FILE
+from .input_writer import atomic_write
+from .location_archive import (
+    ArchiveError,
+    location_files,
+    LocationArchiveWindow,
+    new_location_directory,
+)
+from .yaml_io import dump_yaml, load_yaml
+
+# Reflinks are only supported through `ioctl` on Linux.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+__all__ = (
+    "clone_location",
+    "CloneLocationWindow",
+)
+
+# FICLONE:
+#   The Linux `ioctl` request which makes a file share the data of another, copying it
+#   only once either is written.
+FICLONE: int = 0x40049409
+
+# Shared profile directories:
+#   The directories, within a location's auto-generated files, whose profiles are
+#   shared between a location and its clones rather than copied.
+SHARED_PROFILE_DIRECTORIES: tuple[str, ...] = tuple(
+    f"{AUTO_GENERATED_FILES_DIRECTORY}/{directory}/"
+    for directory in ("grid", "solar", "weather", "wind")
+)
+
+
+def _share_file(source_filepath: str, destination_filepath: str) -> bool:
+    """
+    Make a file share the data of another where possible, copying it otherwise.
+
+    A reflink is used where the filesystem supports it, so that the data is copied only
+    once either file is written. Otherwise, a hardlink is used: the GUI only ever
+    writes a file by replacing it, which breaks the link, and CLOVER only writes
+    profiles which do not yet exist.
+
+    :param: source_filepath
+        The path to the existing file.
+
+    :param: destination_filepath
+        The path to the new file.
+
+    :returns:
+        Whether the data is shared rather than copied.
+
+    """
+
+    if fcntl is not None:
+        try:
+            with open(source_filepath, "rb") as source_file, open(
+                destination_filepath, "wb"
+            ) as destination_file:
+                fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        except OSError:
+            if os.path.exists(destination_filepath):
+                os.remove(destination_filepath)
+        else:
+            shutil.copystat(source_filepath, destination_filepath)
+            return True
+
+    try:
+        os.link(source_filepath, destination_filepath)
+    except OSError:
+        shutil.copy2(source_filepath, destination_filepath)
+        return False
+
+    return True
+
+
+def clone_location(
+    location_directory: str,
+    clone_name: str,
+    logger: Logger,
+    progress_callback: Callable[[int, int], None],
+    cancel_event: Event,
+) -> tuple[int, int]:
+    """
+    Clone a location, sharing its large profiles with the clone.
+
+    The inputs of the location are copied, whilst the profiles which CLOVER generated
+    or fetched for it are shared using :func:`_share_file`. The outputs of the
+    location are not cloned. The clone is created alongside the other locations and
+    only moved into place once complete.
+
+    :param: location_directory
+        The directory of the location to clone.
+
+    :param: clone_name
+        The name of the clone.
+
+    :param: logger
+        The :class:`logging.Logger` to use.
+
+    :param: progress_callback
+        Called with the number of files cloned so far and the total to clone.
+
+    :param: cancel_event
+        Set in order to cancel the clone.
+
+    :returns:
+        A `tuple` containing:
+        - the number of files whose data is shared with the location;
+        - the number of files copied.
+
+    """
+
+    clone_directory = new_location_directory(clone_name)
+    files = location_files(location_directory, True, False)
+
+    temporary_directory = tempfile.mkdtemp(
+        dir=get_locations_foldername(), prefix=f".{clone_name}.", suffix=".clone"
+    )
+
+    try:
+        shared_count: int = 0
+        for index, (filepath, relative_path) in enumerate(files, 1):
+            if cancel_event.is_set():
+                raise ArchiveError("The clone was cancelled.")
+
+            clone_filepath = os.path.join(
+                temporary_directory, *relative_path.split("/")
+            )
+            os.makedirs(os.path.dirname(clone_filepath), exist_ok=True)
+            if relative_path.startswith(SHARED_PROFILE_DIRECTORIES) and _share_file(
+                filepath, clone_filepath
+            ):
+                shared_count += 1
+            else:
+                shutil.copy2(filepath, clone_filepath)
+            progress_callback(index, len(files))
+
+        # Rename the location within its inputs.
+        location_inputs_filepath = os.path.join(
+            temporary_directory, INPUTS_DIRECTORY, LOCATIONS_INPUT_FILE
+        )
+        if os.path.isfile(location_inputs_filepath):
+            with open(location_inputs_filepath, "r", encoding="utf-8") as inputs_file:
+                location_inputs = load_yaml(inputs_file)
+            if isinstance(location_inputs, dict):
+                location_inputs["location"] = clone_name
+                atomic_write(location_inputs_filepath, dump_yaml(location_inputs))
+
+        os.rename(temporary_directory, clone_directory)
+    except BaseException:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        raise
+
+    logger.info(
+        "Cloned %s to %s: %s files shared, %s copied.",
+        os.path.basename(location_directory),
+        clone_name,
+        shared_count,
+        len(files) - shared_count,
+    )
+
+    return shared_count, len(files) - shared_count
+
+
+class CloneLocationWindow(LocationArchiveWindow):
+    """
+    Represents the clone-location popup window.
+
+    The clone-location window enables a user to create a variant of a location without
+    regenerating or refetching its profiles.
+
+    .. attribute:: clone_name
+        The name to give the clone.
+
+    .. attribute:: location_name
+        The name of the location to clone.
+
+    """
+
+    def __init__(self, location_name: str, logger: Logger) -> None:
+        """
+        Instantiate a :class:`CloneLocationWindow` instance.
+
+        :param: location_name
+            The name of the location to clone.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        """
+
+        super().__init__(logger, f"CLOVER-GUI Clone Location: {location_name}", "Clone")
+
+        self.location_name = location_name
+        self.clone_name = ttk.StringVar(self, f"{location_name}_copy")
+
+        self.label = ttk.Label(
+            self.options_frame, style=f"{PRIMARY}", text=f"Clone {location_name}"
+        )
+        self.label.grid(row=0, column=0, columnspan=2, pady=10, sticky="w")
+
+        self.clone_name_label = ttk.Label(self.options_frame, text="New location name")
+        self.clone_name_label.grid(row=1, column=0, pady=5, sticky="w")
+        self.clone_name_entry = ttk.Entry(
+            self.options_frame, bootstyle=PRIMARY, textvariable=self.clone_name
+        )
+        self.clone_name_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+
+    def start(self) -> None:
+        """Clone the location under the name given."""
+
+        clone_name = self.clone_name.get().strip()
+        location_directory = os.path.join(
+            get_locations_foldername(), self.location_name
+        )
+
+        def _clone(progress_callback: Callable, cancel_event: Event) -> str:
+            shared_count, copied_count = clone_location(
+                location_directory,
+                clone_name,
+                self.logger,
+                progress_callback,
+                cancel_event,
+            )
+            return (
+                f"Cloned to {clone_name}: {shared_count} profiles shared, "
+                f"{copied_count} files copied"
+            )
+
+        self._start(_clone, f"Cloning {self.location_name}")
@@ -0,0 +1,345 @@
+#!/usr/bin/python3.10
+########################################################################################
+# location_index.py - The location-index module for CLOVER-GUI application.            #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import os
+import sqlite3
+
+from logging import Logger
+from typing import Any
+
+from clover import INPUTS_DIRECTORY, OUTPUTS_FOLDER
+
+from .__utils__ import LOCATIONS_INPUT_FILE
+from .run_history import RUN_HISTORY_FILENAME, RunHistory
+from .yaml_io import read_yaml
+
+__all__ = (
+    "LOCATION_COLUMNS",
+    "LOCATION_INDEX_FILENAME",
+    "LocationIndex",
+)
+
+# Location columns:
+#   The columns of the location catalogue, mapped to the database column by which each
+#   is sorted.
+LOCATION_COLUMNS: dict[str, str] = {
+    "Name": "name",
+    "Latitude": "latitude",
+    "Longitude": "longitude",
+    "Time zone": "time_difference",
+    "Modified": "modified",
+    "Last run": "last_run",
+    "Runs": "run_count",
+}
+
+# Location index filename:
+#   The name of the database, within the locations folder, holding the location index.
+LOCATION_INDEX_FILENAME: str = ".location_index.sqlite3"
+
+# Location-index schema:
+#   The statements which create the location-index table along with an index on each of
+#   the columns by which locations can be sorted.
+LOCATION_INDEX_SCHEMA: str = (
+    "CREATE TABLE IF NOT EXISTS locations ("
+    "name TEXT PRIMARY KEY, latitude REAL, longitude REAL, time_difference REAL, "
+    "modified REAL NOT NULL, last_run REAL, run_count INTEGER NOT NULL, "
+    "stamp TEXT NOT NULL);\n"
+    + "".join(
+        f"CREATE INDEX IF NOT EXISTS locations_{column} ON locations ({column});\n"
+        for column in LOCATION_COLUMNS.values()
+        if column != "name"
+    )
+)
+
+
+def _float_or_none(value: Any) -> float | None:
+    """
+    Convert a value read from a location's inputs to a `float`.
+
+    :param: value
+        The value to convert.
+
+    :returns:
+        The value as a `float`, or `None` if it is missing or not a number.
+
+    """
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _location_stamp(location_directory: str) -> tuple[str, float] | None:
+    """
+    Return the stamp of a location, which changes whenever it is edited or run.
+
+    Only directory modification times are used: the location's inputs are written by
+    replacing each file, and each run adds its outputs and records itself in the run
+    history, all of which update the modification time of the directory concerned.
+
+    :param: location_directory
+        The directory of the location.
+
+    :returns:
+        The stamp of the location along with the time, in seconds since the epoch, at
+        which it was last modified, or `None` if the location no longer exists.
+
+    """
+
+    try:
+        modification_times = [os.stat(location_directory).st_mtime_ns]
+    except OSError:
+        return None
+
+    for directory in (
+        os.path.join(
+            location_directory,
+            INPUTS_DIRECTORY,
+            os.path.dirname(LOCATIONS_INPUT_FILE),
+        ),
+        os.path.join(location_directory, OUTPUTS_FOLDER),
+    ):
+        try:
+            modification_times.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            modification_times.append(0)
+
+    return (
+        ":".join(str(modification_time) for modification_time in modification_times),
+        max(modification_times) / 1e9,
+    )
+
+
+class LocationIndex:
+    """
+    Represents the catalogue of the locations available.
+
+    The catalogue is held in a SQLite database within the locations folder so that it
+    can be displayed and searched without reading each location. It is refreshed
+    incrementally: only those locations whose directories have been modified since they
+    were last indexed are read again.
+
+    .. attribute:: database_filepath
+        The path to the database.
+
+    .. attribute:: locations_foldername
+        The path to the locations folder.
+
+    """
+
+    def __init__(self, locations_foldername: str) -> None:
+        """
+        Instantiate a :class:`LocationIndex` instance.
+
+        :param: locations_foldername
+            The path to the locations folder.
+
+        """
+
+        self.database_filepath: str = os.path.join(
+            locations_foldername, LOCATION_INDEX_FILENAME
+        )
+        self.locations_foldername: str = locations_foldername
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database, creating it if it does not exist."""
+
+        connection = sqlite3.connect(self.database_filepath, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.executescript(LOCATION_INDEX_SCHEMA)
+
+        return connection
+
+    def _read_location(
+        self, location_name: str, logger: Logger, stamp: str, modified: float
+    ) -> tuple[Any, ...]:
+        """
+        Read the catalogue entry of a location.
+
+        :param: location_name
+            The name of the location.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        :param: stamp
+            The stamp of the location.
+
+        :param: modified
+            The time at which the location was last modified.
+
+        :returns:
+            The row of the location in the index.
+
+        """
+
+        location_directory = os.path.join(self.locations_foldername, location_name)
+
+        try:
+            location_inputs = read_yaml(
+                os.path.join(
+                    location_directory, INPUTS_DIRECTORY, LOCATIONS_INPUT_FILE
+                ),
+                logger,
+            )
+        except Exception:  # pylint: disable=broad-except
+            location_inputs = None
+        if not isinstance(location_inputs, dict):
+            location_inputs = {}
+
+        try:
+            run_count, last_run = RunHistory(
+                os.path.join(location_directory, OUTPUTS_FOLDER, RUN_HISTORY_FILENAME)
+            ).summary()
+        except sqlite3.Error:
+            run_count, last_run = 0, None
+
+        return (
+            location_name,
+            _float_or_none(location_inputs.get("latitude")),
+            _float_or_none(location_inputs.get("longitude")),
+            _float_or_none(location_inputs.get("time_difference")),
+            modified,
+            last_run,
+            run_count,
+            stamp,
+        )
+
+    def query(
+        self,
+        search: str = "",
+        sort_column: str = "name",
+        descending: bool = False,
+        limit: int = -1,
+        offset: int = 0,
+    ) -> tuple[int, list[sqlite3.Row]]:
+        """
+        Query the locations whose names match the search given.
+
+        :param: search
+            Text which the name of each location should contain.
+
+        :param: sort_column
+            The column by which to sort the locations.
+
+        :param: descending
+            Whether to sort the locations in descending order.
+
+        :param: limit
+            The maximum number of locations to return, or -1 to return all of them.
+
+        :param: offset
+            The number of matching locations to skip.
+
+        :returns:
+            A `tuple` containing:
+            - the total number of locations which match the search;
+            - the matching locations, sorted, within the limit and offset given.
+
+        """
+
+        if sort_column not in LOCATION_COLUMNS.values():
+            raise ValueError(
+                f"Cannot sort locations by unknown column '{sort_column}'."
+            )
+
+        if not os.path.isdir(self.locations_foldername):
+            return 0, []
+
+        where: str = ""
+        parameters: list[str] = []
+        if search != "":
+            where = "WHERE name LIKE ? ESCAPE '\\'"
+            parameters.append(
+                "%"
+                + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                + "%"
+            )
+
+        with self._connect() as connection:
+            count: int = connection.execute(
+                f"SELECT COUNT(*) FROM locations {where}", parameters
+            ).fetchone()[0]
+            locations = connection.execute(
+                f"SELECT * FROM locations {where} "
+                f"ORDER BY {sort_column} {'DESC' if descending else 'ASC'}, name "
+                "LIMIT ? OFFSET ?",
+                [*parameters, limit, offset],
+            ).fetchall()
+        connection.close()
+
+        return count, locations
+
+    def refresh(self, logger: Logger) -> bool:
+        """
+        Bring the index up to date with the locations folder.
+
+        Locations which have been added or modified since the index was last refreshed
+        are read, and those which have been removed are dropped from the index.
+
+        :param: logger
+            The :class:`logging.Logger` to use.
+
+        :returns:
+            Whether the index changed.
+
+        """
+
+        if not os.path.isdir(self.locations_foldername):
+            return False
+
+        with os.scandir(self.locations_foldername) as entries:
+            location_names = {
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            }
+
+        with self._connect() as connection:
+            stamps: dict[str, str] = dict(
+                connection.execute("SELECT name, stamp FROM locations").fetchall()
+            )
+        connection.close()
+
+        updated_locations: list[tuple[Any, ...]] = []
+        for location_name in location_names:
+            if (
+                location_stamp := _location_stamp(
+                    os.path.join(self.locations_foldername, location_name)
+                )
+            ) is None:
+                continue
+            stamp, modified = location_stamp
+            if stamps.get(location_name) != stamp:
+                updated_locations.append(
+                    self._read_location(location_name, logger, stamp, modified)
+                )
+
+        removed_locations = [
+            (location_name,) for location_name in stamps.keys() - location_names
+        ]
+        if len(updated_locations) == 0 and len(removed_locations) == 0:
+            return False
+
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO locations (name, latitude, longitude, "
+                "time_difference, modified, last_run, run_count, stamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                updated_locations,
+            )
+            connection.executemany(
+                "DELETE FROM locations WHERE name = ?", removed_locations
+            )
+        connection.close()
+
+        return True
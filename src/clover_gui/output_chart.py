@@ -0,0 +1,619 @@
+#!/usr/bin/python3.10
+########################################################################################
+# output_chart.py - The output-chart module for CLOVER-GUI application.                #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import math
+import os
+
+from queue import Empty, Queue
+from threading import Thread
+from typing import Callable
+
+import numpy as np
+import ttkbootstrap as ttk
+
+from ttkbootstrap.constants import *
+
+from .column_cache import (
+    HOURLY_OUTPUTS_FILENAME,
+    load_columns,
+    load_profiles,
+    read_csv_columns,
+)
+
+__all__ = (
+    "DOWNSAMPLING_METHODS",
+    "HOURLY_OUTPUTS_FILENAME",
+    "HourlyOutputChart",
+    "load_hourly_outputs",
+    "lttb_indices",
+    "minmax_indices",
+)
+
+# Chart margins:
+#   The space, in pixels, left around the plotting area of the chart for its axes, given
+#   as the left, top, right and bottom margins.
+CHART_MARGINS: tuple[int, int, int, int] = (70, 10, 20, 30)
+
+# Chart minimum span:
+#   The fewest hours to which the chart can be zoomed.
+CHART_MINIMUM_SPAN: int = 24
+
+# Chart poll interval:
+#   The interval, in milliseconds, at which hourly outputs being loaded are checked.
+CHART_POLL_INTERVAL: int = 100
+
+# Chart zoom step:
+#   The factor by which the span of the chart changes with each step of the mouse wheel.
+CHART_ZOOM_STEP: float = 1.25
+
+# Tick count:
+#   The approximate number of ticks to draw along each axis.
+TICK_COUNT: int = 6
+
+
+def _hour_unit(span: float) -> tuple[str, int]:
+    """
+    Return the unit in which to label an hourly axis.
+
+    :param: span
+        The number of hours across the axis.
+
+    :returns:
+        The name of the unit and the number of hours in it.
+
+    """
+
+    if span <= 24 * 7:
+        return "Hour", 1
+    if span <= 24 * 365 * 2:
+        return "Day", 24
+    return "Year", 24 * 365
+
+
+def _nice_ticks(lower: float, upper: float, count: int = TICK_COUNT) -> list[float]:
+    """
+    Return evenly-spaced, rounded tick values covering a range.
+
+    :param: lower
+        The lower end of the range.
+
+    :param: upper
+        The upper end of the range.
+
+    :param: count
+        The approximate number of ticks.
+
+    :returns:
+        The tick values within the range.
+
+    """
+
+    if upper <= lower:
+        return [lower]
+
+    raw_step = (upper - lower) / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = magnitude * next(
+        multiple for multiple in (1, 2, 5, 10) if multiple * magnitude >= raw_step
+    )
+
+    return [
+        tick * step
+        for tick in range(math.ceil(lower / step), math.floor(upper / step) + 1)
+    ]
+
+
+def load_hourly_outputs(
+    filepath: str, location_directory: str | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Load the hourly outputs of a simulation, along with the profiles it read.
+
+    The columns converted once the simulation finished are memory-mapped where they
+    are up to date, with the CSV files read otherwise. This is safe to call from a
+    background thread.
+
+    :param: filepath
+        The path to the hourly outputs.
+
+    :param: location_directory
+        The directory of the location simulated, whose profiles are also loaded, if
+        known.
+
+    :returns:
+        A mapping from the name of each numeric output, and of each profile, to its
+        hourly values, with any missing values drawn as zero.
+
+    """
+
+    if (hourly_outputs := load_columns(filepath)) is None:
+        hourly_outputs = read_csv_columns(filepath)
+
+    if location_directory is not None:
+        hourly_outputs.update(
+            {
+                f"Profile: {name}": values
+                for name, values in load_profiles(location_directory).items()
+            }
+        )
+
+    return {
+        name: np.nan_to_num(values) if np.isnan(np.sum(values)) else values
+        for name, values in hourly_outputs.items()
+    }
+
+
+def lttb_indices(
+    values: np.ndarray, start: int, stop: int, threshold: int
+) -> np.ndarray:
+    """
+    Downsample a series using the Largest-Triangle-Three-Buckets algorithm.
+
+    The points between the first and last are split into `threshold - 2` buckets, and
+    the point kept from each bucket is that forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next bucket, which preserves the
+    visual shape of the series.
+
+    :param: values
+        The series to downsample.
+
+    :param: start
+        The index of the first point to consider.
+
+    :param: stop
+        The index after the last point to consider.
+
+    :param: threshold
+        The number of points to keep.
+
+    :returns:
+        The indices of the points kept.
+
+    """
+
+    if threshold < 3 or stop - start <= threshold:
+        return np.arange(start, stop)
+
+    edges = np.linspace(start + 1, stop - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = start, stop - 1
+
+    previous = start
+    for bucket in range(threshold - 2):
+        lower, upper = edges[bucket], edges[bucket + 1]
+        if bucket < threshold - 3:
+            next_upper = edges[bucket + 2]
+            next_x = (upper + next_upper - 1) / 2
+            next_y = values[upper:next_upper].mean()
+        else:
+            next_x, next_y = stop - 1, values[stop - 1]
+
+        areas = np.abs(
+            (previous - next_x) * (values[lower:upper] - values[previous])
+            - (previous - np.arange(lower, upper)) * (next_y - values[previous])
+        )
+        indices[bucket + 1] = previous = lower + int(areas.argmax())
+
+    return indices
+
+
+def minmax_indices(
+    values: np.ndarray, start: int, stop: int, buckets: int
+) -> np.ndarray:
+    """
+    Downsample a series by keeping the minimum and maximum of each bucket.
+
+    With one bucket per pixel, the series drawn is indistinguishable from the full
+    series, with every peak and trough kept.
+
+    :param: values
+        The series to downsample.
+
+    :param: start
+        The index of the first point to consider.
+
+    :param: stop
+        The index after the last point to consider.
+
+    :param: buckets
+        The number of buckets.
+
+    :returns:
+        The indices of the points kept, in order.
+
+    """
+
+    if buckets < 1 or stop - start <= 2 * buckets:
+        return np.arange(start, stop)
+
+    bucket_size = -(-(stop - start) // buckets)
+    bucket_count = (stop - start) // bucket_size
+    blocks = values[start : start + bucket_count * bucket_size].reshape(
+        bucket_count, bucket_size
+    )
+    offsets = start + bucket_size * np.arange(bucket_count)
+    extremes = np.sort(
+        np.stack(
+            (offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)), axis=1
+        ),
+        axis=1,
+    ).ravel()
+
+    # Keep the remainder which does not fill a bucket along with the end points.
+    remainder_start = start + bucket_count * bucket_size
+    remainder = values[remainder_start:stop]
+    if len(remainder) > 0:
+        extremes = np.concatenate(
+            (
+                extremes,
+                np.sort(
+                    remainder_start
+                    + np.array([remainder.argmin(), remainder.argmax()])
+                ),
+            )
+        )
+
+    return np.unique(np.concatenate(([start], extremes, [stop - 1])))
+
+
+# Downsampling methods:
+#   The methods available to downsample an hourly series to the width of the chart,
+#   each called with the series, the range to display and the width, in pixels.
+DOWNSAMPLING_METHODS: dict[str, Callable[[np.ndarray, int, int, int], np.ndarray]] = {
+    "Min/max": minmax_indices,
+    "LTTB": lttb_indices,
+}
+
+
+class HourlyOutputChart(ttk.Frame):
+    """
+    Represents an interactive chart of the hourly outputs of a simulation.
+
+    The hourly outputs, along with the profiles which the simulation read, are loaded in
+    a background thread and drawn on a canvas. Each time the chart is zoomed, with the
+    mouse wheel, or panned, by dragging, the visible range is downsampled afresh to the
+    width of the chart so that every redraw costs the same however many years are
+    displayed. Double clicking resets the chart.
+
+    .. attribute:: downsampling
+        The name of the downsampling method in use.
+
+    .. attribute:: series_name
+        The name of the output being displayed.
+
+    """
+
+    def __init__(self, parent) -> None:
+        """
+        Instantiate a :class:`HourlyOutputChart` instance.
+
+        :param: parent
+            The parent widget.
+
+        """
+
+        super().__init__(parent)
+
+        self.columnconfigure(1, weight=1)
+        self.columnconfigure(3, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self.colors = ttk.Style().colors
+        self.hourly_outputs: dict[str, np.ndarray] = {}
+
+        self.series_name = ttk.StringVar(self, "")
+        self.series_label = ttk.Label(self, text="Output")
+        self.series_label.grid(row=0, column=0, padx=(0, 10), pady=5, sticky="w")
+        self.series_combobox = ttk.Combobox(
+            self, bootstyle=INFO, state=READONLY, textvariable=self.series_name
+        )
+        self.series_combobox.grid(row=0, column=1, pady=5, sticky="ew")
+        self.series_combobox.bind("<<ComboboxSelected>>", self.reset)
+
+        self.downsampling = ttk.StringVar(self, next(iter(DOWNSAMPLING_METHODS)))
+        self.downsampling_label = ttk.Label(self, text="Downsampling")
+        self.downsampling_label.grid(row=0, column=2, padx=10, pady=5, sticky="w")
+        self.downsampling_combobox = ttk.Combobox(
+            self,
+            bootstyle=INFO,
+            state=READONLY,
+            textvariable=self.downsampling,
+            values=list(DOWNSAMPLING_METHODS),
+            width=10,
+        )
+        self.downsampling_combobox.grid(row=0, column=3, pady=5, sticky="w")
+        self.downsampling_combobox.bind("<<ComboboxSelected>>", self._schedule_redraw)
+
+        self.canvas = ttk.Canvas(
+            self, background=self.colors.bg, height=400, highlightthickness=0
+        )
+        self.canvas.grid(row=1, column=0, columnspan=4, pady=5, sticky="news")
+        self.series_line = self.canvas.create_line(
+            0, 0, 0, 0, fill=self.colors.info, width=1
+        )
+        self.status_label = ttk.Label(self, bootstyle=SECONDARY, text="")
+        self.status_label.grid(row=2, column=0, columnspan=4, pady=5, sticky="w")
+
+        self.canvas.bind("<Configure>", self._schedule_redraw)
+        self.canvas.bind("<ButtonPress-1>", self._start_pan)
+        self.canvas.bind("<B1-Motion>", self._pan)
+        self.canvas.bind("<Double-Button-1>", self.reset)
+        self.canvas.bind("<MouseWheel>", self._zoom)
+        self.canvas.bind("<Button-4>", self._zoom)
+        self.canvas.bind("<Button-5>", self._zoom)
+
+        self._filepath: str | None = None
+        self._loading_queue: Queue = Queue()
+        self._pan_start: tuple[int, float, float] | None = None
+        self._poll_after_id: str | None = None
+        self._redraw_after_id: str | None = None
+        self._view: tuple[float, float] = (0, 1)
+
+    @property
+    def _plot_area(self) -> tuple[int, int, int, int]:
+        """Return the left, top, right and bottom edges of the plotting area."""
+
+        left, top, right, bottom = CHART_MARGINS
+        return (
+            left,
+            top,
+            max(self.canvas.winfo_width() - right, left + 1),
+            max(self.canvas.winfo_height() - bottom, top + 1),
+        )
+
+    @property
+    def _series(self) -> np.ndarray | None:
+        """Return the values of the output being displayed."""
+
+        return self.hourly_outputs.get(self.series_name.get())
+
+    def _clamp_view(self, lower: float, upper: float) -> tuple[float, float]:
+        """
+        Keep a view within the series, no narrower than the minimum span.
+
+        :param: lower
+            The first hour of the view.
+
+        :param: upper
+            The last hour of the view.
+
+        :returns:
+            The view, shifted and resized to lie within the series.
+
+        """
+
+        if (series := self._series) is None:
+            return lower, upper
+
+        length = max(len(series) - 1, 1)
+        span = min(max(upper - lower, min(CHART_MINIMUM_SPAN, length)), length)
+        lower = min(max(lower, 0), length - span)
+
+        return lower, lower + span
+
+    def _draw_axes(
+        self, lower: float, upper: float, minimum: float, maximum: float
+    ) -> None:
+        """
+        Draw the axes, ticks and labels of the chart.
+
+        :param: lower
+            The first hour displayed.
+
+        :param: upper
+            The last hour displayed.
+
+        :param: minimum
+            The smallest value displayed.
+
+        :param: maximum
+            The largest value displayed.
+
+        """
+
+        self.canvas.delete("axes")
+        left, top, right, bottom = self._plot_area
+        self.canvas.create_rectangle(
+            left, top, right, bottom, outline=self.colors.border, tags="axes"
+        )
+
+        for tick in _nice_ticks(minimum, maximum):
+            y = bottom - (tick - minimum) / (maximum - minimum) * (bottom - top)
+            self.canvas.create_line(
+                left - 4, y, left, y, fill=self.colors.fg, tags="axes"
+            )
+            self.canvas.create_text(
+                left - 6,
+                y,
+                anchor=E,
+                fill=self.colors.fg,
+                tags="axes",
+                text=f"{tick:g}",
+            )
+
+        unit, unit_hours = _hour_unit(upper - lower)
+        for tick in _nice_ticks(lower / unit_hours, upper / unit_hours):
+            x = left + (tick * unit_hours - lower) / (upper - lower) * (right - left)
+            self.canvas.create_line(
+                x, bottom, x, bottom + 4, fill=self.colors.fg, tags="axes"
+            )
+            self.canvas.create_text(
+                x,
+                bottom + 6,
+                anchor=N,
+                fill=self.colors.fg,
+                tags="axes",
+                text=f"{unit} {tick:g}",
+            )
+
+    def _pan(self, event) -> None:
+        """
+        Pan the chart as it is dragged.
+
+        :param: event
+            The motion event.
+
+        """
+
+        if self._pan_start is None:
+            return
+
+        x, lower, upper = self._pan_start
+        left, _, right, _ = self._plot_area
+        shift = (x - event.x) * (upper - lower) / (right - left)
+        self._view = self._clamp_view(lower + shift, upper + shift)
+        self._schedule_redraw()
+
+    def _poll(self) -> None:
+        """Display the hourly outputs once they have been loaded."""
+
+        # Discard outputs which are no longer wanted, polling until those wanted arrive.
+        self._poll_after_id = None
+        while True:
+            try:
+                filepath, hourly_outputs = self._loading_queue.get_nowait()
+            except Empty:
+                self._poll_after_id = self.after(CHART_POLL_INTERVAL, self._poll)
+                return
+            if filepath == self._filepath:
+                break
+
+        if isinstance(hourly_outputs, Exception):
+            self.hourly_outputs = {}
+            self.status_label.configure(
+                text=f"The hourly outputs could not be read: {hourly_outputs}"
+            )
+        else:
+            self.hourly_outputs = hourly_outputs
+
+        self.series_combobox.configure(values=list(self.hourly_outputs))
+        if self.series_name.get() not in self.hourly_outputs:
+            self.series_name.set(next(iter(self.hourly_outputs), ""))
+        self.reset()
+
+    def _redraw(self) -> None:
+        """Downsample the visible range of the output and draw it."""
+
+        self._redraw_after_id = None
+        if (series := self._series) is None or len(series) < 2:
+            self.canvas.delete("axes")
+            self.canvas.coords(self.series_line, 0, 0, 0, 0)
+            return
+
+        lower, upper = self._view
+        left, top, right, bottom = self._plot_area
+        start = max(math.floor(lower), 0)
+        stop = min(math.ceil(upper) + 1, len(series))
+
+        indices = DOWNSAMPLING_METHODS[self.downsampling.get()](
+            series, start, stop, right - left
+        )
+        values = series[indices]
+        minimum, maximum = float(values.min()), float(values.max())
+        if maximum == minimum:
+            minimum, maximum = minimum - 1, maximum + 1
+
+        x = left + (indices - lower) / (upper - lower) * (right - left)
+        y = bottom - (values - minimum) / (maximum - minimum) * (bottom - top)
+        self.canvas.coords(self.series_line, np.column_stack((x, y)).ravel().tolist())
+        self._draw_axes(lower, upper, minimum, maximum)
+        self.canvas.tag_raise(self.series_line)
+
+        self.status_label.configure(
+            text=(
+                f"Hours {lower:,.0f} to {upper:,.0f} of {len(series) - 1:,}: "
+                f"{len(indices):,} of {stop - start:,} points drawn"
+            )
+        )
+
+    def _schedule_redraw(self, _=None) -> None:
+        """Redraw the chart once the pending events have been handled."""
+
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.after_idle(self._redraw)
+
+    def _start_pan(self, event) -> None:
+        """
+        Start panning the chart.
+
+        :param: event
+            The button-press event.
+
+        """
+
+        self._pan_start = (event.x, *self._view)
+
+    def _zoom(self, event) -> None:
+        """
+        Zoom the chart in or out about the cursor.
+
+        :param: event
+            The mouse-wheel event.
+
+        """
+
+        zoom_in: bool = event.num == 4 or (event.num != 5 and event.delta > 0)
+        factor = 1 / CHART_ZOOM_STEP if zoom_in else CHART_ZOOM_STEP
+
+        lower, upper = self._view
+        left, _, right, _ = self._plot_area
+        anchor = lower + (min(max(event.x, left), right) - left) / (right - left) * (
+            upper - lower
+        )
+        self._view = self._clamp_view(
+            anchor - (anchor - lower) * factor, anchor + (upper - anchor) * factor
+        )
+        self._schedule_redraw()
+
+    def load(self, filepath: str, location_directory: str | None = None) -> None:
+        """
+        Load the hourly outputs of a simulation in the background and display them.
+
+        :param: filepath
+            The path to the hourly outputs.
+
+        :param: location_directory
+            The directory of the location simulated, whose profiles are also displayed,
+            if known.
+
+        """
+
+        try:
+            key = f"{filepath}:{os.stat(filepath).st_mtime_ns}"
+        except OSError:
+            key = filepath
+        if key == self._filepath:
+            return
+
+        self._filepath = key
+        self.hourly_outputs = {}
+        self.status_label.configure(text="Loading hourly outputs...")
+        self._schedule_redraw()
+
+        def _load() -> None:
+            try:
+                self._loading_queue.put(
+                    (key, load_hourly_outputs(filepath, location_directory))
+                )
+            except Exception as exception:  # pylint: disable=broad-except
+                self._loading_queue.put((key, exception))
+
+        Thread(target=_load, daemon=True).start()
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+        self._poll_after_id = self.after(CHART_POLL_INTERVAL, self._poll)
+
+    def reset(self, _=None) -> None:
+        """Display the whole of the output selected."""
+
+        if (series := self._series) is not None:
+            self._view = (0, max(len(series) - 1, 1))
+        self._schedule_redraw()
@@ -0,0 +1,186 @@
+#!/usr/bin/python3.10
+########################################################################################
+# output_watcher.py - The output-watcher module for CLOVER-GUI application.            #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import os
+import time
+import tkinter as tk
+
+from typing import Callable, Iterable
+
+__all__ = (
+    "OUTPUT_WATCH_INTERVAL",
+    "OutputWatcher",
+)
+
+# Output settle time:
+#   The time, in seconds, since an output was last modified after which it is taken to
+#   have been completely written.
+OUTPUT_SETTLE_TIME: float = 1
+
+# Output watch interval:
+#   The interval, in milliseconds, at which the outputs being watched are checked.
+OUTPUT_WATCH_INTERVAL: int = 500
+
+
+class OutputWatcher:
+    """
+    Watches for the outputs of a run appearing as CLOVER writes them.
+
+    The directories containing the outputs are polled from the main thread. Each poll
+    only stats the directories, which change whenever a file is added or removed, and
+    lists a directory again only once it has changed or whilst one of its outputs is
+    still being written. An output is reported once it is complete: when its size and
+    modification time are unchanged between two polls, or it has not been modified for
+    :data:`OUTPUT_SETTLE_TIME`. Polls are skipped whilst the widget is not displayed.
+
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        callback: Callable[[list[str], list[str]], None],
+        interval: int = OUTPUT_WATCH_INTERVAL,
+    ) -> None:
+        """
+        Instantiate a :class:`OutputWatcher` instance.
+
+        :param: widget
+            The widget used to schedule polls, which are skipped whilst it is hidden.
+
+        :param: callback
+            Called, on the main thread, with the outputs which have become available
+            and those which are no longer available.
+
+        :param: interval
+            The interval, in milliseconds, at which to poll.
+
+        """
+
+        self._after_id: str | None = None
+        self._available: set[str] = set()
+        self._callback = callback
+        self._directories: dict[str, list[str]] = {}
+        self._directory_stamps: dict[str, int | None] = {}
+        self._interval: int = interval
+        self._pending: dict[str, tuple[int, int]] = {}
+        self._widget = widget
+
+    @property
+    def available(self) -> set[str]:
+        """Return the outputs which are available."""
+
+        return set(self._available)
+
+    def _poll(self) -> None:
+        """Check the outputs whilst the widget is displayed, and poll again later."""
+
+        self._after_id = None
+        if self._widget.winfo_ismapped():
+            self._scan()
+        self._after_id = self._widget.after(self._interval, self._poll)
+
+    def _scan(self) -> None:
+        """Check the outputs and report any whose availability has changed."""
+
+        appeared: list[str] = []
+        disappeared: list[str] = []
+
+        for directory, filepaths in self._directories.items():
+            try:
+                directory_stamp: int | None = os.stat(directory).st_mtime_ns
+            except OSError:
+                directory_stamp = None
+
+            # Only list the directory again once it has changed, whilst an output is
+            # still being written or whilst it was modified too recently for a change
+            # to show in its modification time.
+            if (
+                directory in self._directory_stamps
+                and directory_stamp == self._directory_stamps[directory]
+                and not any(filepath in self._pending for filepath in filepaths)
+                and (
+                    directory_stamp is None
+                    or time.time() - directory_stamp / 1e9 >= OUTPUT_SETTLE_TIME
+                )
+            ):
+                continue
+            self._directory_stamps[directory] = directory_stamp
+
+            entries: dict[str, os.DirEntry] = {}
+            if directory_stamp is not None:
+                try:
+                    with os.scandir(directory) as directory_entries:
+                        entries = {entry.name: entry for entry in directory_entries}
+                except OSError:
+                    pass
+
+            for filepath in filepaths:
+                try:
+                    entry = entries[os.path.basename(filepath)]
+                    stat_result = entry.stat() if entry.is_file() else None
+                except (KeyError, OSError):
+                    stat_result = None
+
+                if stat_result is None:
+                    self._pending.pop(filepath, None)
+                    if filepath in self._available:
+                        self._available.discard(filepath)
+                        disappeared.append(filepath)
+                    continue
+
+                if filepath in self._available:
+                    continue
+
+                signature = (stat_result.st_size, stat_result.st_mtime_ns)
+                if stat_result.st_size > 0 and (
+                    self._pending.get(filepath) == signature
+                    or time.time() - stat_result.st_mtime >= OUTPUT_SETTLE_TIME
+                ):
+                    self._pending.pop(filepath, None)
+                    self._available.add(filepath)
+                    appeared.append(filepath)
+                else:
+                    self._pending[filepath] = signature
+
+        if len(appeared) > 0 or len(disappeared) > 0:
+            self._callback(appeared, disappeared)
+
+    def stop(self) -> None:
+        """Stop watching the outputs."""
+
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        self._available = set()
+        self._directories = {}
+        self._directory_stamps = {}
+        self._pending = {}
+
+    def watch(self, filepaths: Iterable[str]) -> None:
+        """
+        Watch the outputs given in place of any being watched.
+
+        The outputs which already exist are reported straight away.
+
+        :param: filepaths
+            The paths to the outputs.
+
+        """
+
+        self.stop()
+        for filepath in filepaths:
+            self._directories.setdefault(os.path.dirname(filepath), []).append(
+                filepath
+            )
+
+        self._scan()
+        self._after_id = self._widget.after(self._interval, self._poll)
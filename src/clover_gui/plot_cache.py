@@ -0,0 +1,578 @@
+#!/usr/bin/python3.10
+########################################################################################
+# plot_cache.py - The plot-cache module for CLOVER-GUI application.                    #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import os
+import tempfile
+import tkinter as tk
+
+from collections import deque, OrderedDict
+from dataclasses import dataclass
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Callable, Iterable
+
+from PIL import Image, ImageTk
+
+__all__ = (
+    "PLOT_CACHE_MAX_BYTES",
+    "PLOT_MAX_SCALE",
+    "PlotImageCache",
+    "THUMBNAIL_SIZE",
+    "THUMBNAILS_DIRECTORY",
+)
+
+# Plot-cache maximum bytes:
+#   The maximum number of bytes of decoded plots held in the plot cache.
+PLOT_CACHE_MAX_BYTES: int = 256 << 20
+
+# Plot-cache poll interval:
+#   The interval, in milliseconds, at which plots decoded in the background are checked.
+PLOT_CACHE_POLL_INTERVAL: int = 50
+
+# Plot maximum scale:
+#   The largest factor, relative to its full resolution, at which a plot is displayed
+#   however far it is zoomed in, so that zooming never renders more pixels than the plot
+#   holds.
+PLOT_MAX_SCALE: float = 1
+
+# Plot-pyramid levels:
+#   The maximum number of levels, including the full-resolution plot, in the pyramid of
+#   each plot. Each level is half the size of the one above it.
+PLOT_PYRAMID_LEVELS: int = 4
+
+# Plot-pyramid minimum size:
+#   The size, in pixels, below which the shorter side of a pyramid level is not halved.
+PLOT_PYRAMID_MIN_SIZE: int = 128
+
+# Plot resampling:
+#   The filter used to resample plots to the size at which they are displayed.
+PLOT_RESAMPLING: Image.Resampling = Image.Resampling.LANCZOS
+
+# Thumbnail size:
+#   The maximum width and height, in pixels, of the thumbnail of a plot.
+THUMBNAIL_SIZE: tuple[int, int] = (48, 32)
+
+# Thumbnails directory:
+#   The directory, alongside the plots of a run, in which their thumbnails are cached.
+THUMBNAILS_DIRECTORY: str = ".thumbnails"
+
+
+@dataclass
+class _CachedPlot:
+    """
+    Represents a plot held in the plot cache.
+
+    .. attribute:: levels
+        The pyramid of the plot, from the full-resolution plot downwards.
+
+    .. attribute:: photo_image
+        The Tk image of the plot at the size at which it was last displayed.
+
+    .. attribute:: photo_size
+        The size of the Tk image.
+
+    """
+
+    levels: list[Image.Image]
+    photo_image: ImageTk.PhotoImage | None = None
+    photo_size: tuple[int, int] | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held by the plot."""
+
+        return sum(4 * level.width * level.height for level in self.levels) + (
+            4 * self.photo_size[0] * self.photo_size[1]
+            if self.photo_size is not None
+            else 0
+        )
+
+
+def _cache_key(filepath: str) -> tuple[str, int] | None:
+    """
+    Return the key under which a plot is cached.
+
+    :param: filepath
+        The path to the plot.
+
+    :returns:
+        The path and modification time, in nanoseconds, of the plot, or `None` if the
+        plot does not exist.
+
+    """
+
+    try:
+        return filepath, os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _decode(filepath: str) -> list[Image.Image]:
+    """
+    Decode a plot into memory and build its pyramid.
+
+    This is safe to call from a background thread.
+
+    :param: filepath
+        The path to the plot.
+
+    :returns:
+        The pyramid of the plot, from the full-resolution plot downwards.
+
+    """
+
+    with Image.open(filepath) as image:
+        image.load()
+        levels = [
+            image.convert("RGBA") if image.mode not in ("RGB", "RGBA") else image.copy()
+        ]
+
+    while (
+        len(levels) < PLOT_PYRAMID_LEVELS
+        and min(levels[-1].size) // 2 >= PLOT_PYRAMID_MIN_SIZE
+    ):
+        levels.append(levels[-1].reduce(2))
+
+    return levels
+
+
+def _fit_scale(size: tuple[int, int], box: tuple[int, int] | None) -> float:
+    """
+    Return the factor by which a plot is scaled to fit the space available.
+
+    :param: size
+        The full-resolution size of the plot.
+
+    :param: box
+        The width and height available to display the plot, or `None` to display it at
+        full resolution. Plots are shrunk to fit but never enlarged.
+
+    :returns:
+        The factor by which to scale the plot.
+
+    """
+
+    if box is None:
+        return 1
+
+    return min(1, box[0] / size[0], box[1] / size[1])
+
+
+def _fitted_size(
+    size: tuple[int, int], box: tuple[int, int] | None, zoom: float
+) -> tuple[int, int]:
+    """
+    Return the size at which to display a plot.
+
+    :param: size
+        The full-resolution size of the plot.
+
+    :param: box
+        The width and height available to display the plot, or `None` to display it at
+        full resolution. Plots are shrunk to fit but never enlarged.
+
+    :param: zoom
+        The factor by which to scale the plot once fitted, limited so that the plot is
+        never displayed above :data:`PLOT_MAX_SCALE` times its full resolution.
+
+    :returns:
+        The width and height at which to display the plot.
+
+    """
+
+    scale = min(zoom * _fit_scale(size, box), PLOT_MAX_SCALE)
+
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _render(levels: list[Image.Image], size: tuple[int, int]) -> Image.Image:
+    """
+    Resample a plot to the size given from the smallest sufficient pyramid level.
+
+    This is safe to call from a background thread.
+
+    :param: levels
+        The pyramid of the plot.
+
+    :param: size
+        The width and height at which to display the plot.
+
+    :returns:
+        The resampled plot.
+
+    """
+
+    level = next(
+        (
+            level
+            for level in reversed(levels)
+            if level.width >= size[0] and level.height >= size[1]
+        ),
+        levels[0],
+    )
+    if level.size == size:
+        return level
+
+    return level.resize(size, PLOT_RESAMPLING)
+
+
+def _thumbnail(
+    filepath: str, mtime_ns: int, levels: list[Image.Image] | None
+) -> Image.Image:
+    """
+    Return the thumbnail of a plot, creating and caching it on disk where needed.
+
+    This is safe to call from a background thread.
+
+    :param: filepath
+        The path to the plot.
+
+    :param: mtime_ns
+        The modification time, in nanoseconds, of the plot.
+
+    :param: levels
+        The pyramid of the plot if it has already been decoded.
+
+    :returns:
+        The thumbnail of the plot.
+
+    """
+
+    thumbnail_filepath = os.path.join(
+        os.path.dirname(filepath), THUMBNAILS_DIRECTORY, os.path.basename(filepath)
+    )
+
+    # Use the cached thumbnail unless the plot has since been rewritten.
+    try:
+        if os.stat(thumbnail_filepath).st_mtime_ns >= mtime_ns:
+            with Image.open(thumbnail_filepath) as thumbnail:
+                thumbnail.load()
+                return thumbnail.copy()
+    except OSError:
+        pass
+
+    thumbnail = (levels if levels is not None else _decode(filepath))[-1].copy()
+    thumbnail.thumbnail(THUMBNAIL_SIZE, PLOT_RESAMPLING)
+
+    # Cache the thumbnail, leaving it uncached if the outputs cannot be written.
+    try:
+        os.makedirs(os.path.dirname(thumbnail_filepath), exist_ok=True)
+        file_descriptor, temporary_filepath = tempfile.mkstemp(
+            dir=os.path.dirname(thumbnail_filepath), prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as thumbnail_file:
+                thumbnail.save(thumbnail_file, format="PNG")
+            os.replace(temporary_filepath, thumbnail_filepath)
+        except BaseException:
+            os.remove(temporary_filepath)
+            raise
+    except OSError:
+        pass
+
+    return thumbnail
+
+
+class PlotImageCache:
+    """
+    Holds the plots of a run, decoded and ready to display.
+
+    Each plot is decoded once, in a background thread where prefetched, into a pyramid
+    of successively halved levels. Plots are displayed fitted to the space available,
+    resampled from the smallest sufficient level, so that resizing or zooming never
+    decodes the plot again, and only the Tk image of the size last displayed is kept.
+    The cache is keyed by the path and modification time of each plot, so a plot which
+    is rewritten is decoded afresh, and the least-recently-used plots are dropped once
+    the plots held exceed the memory bound.
+
+    """
+
+    def __init__(self, widget: tk.Misc, max_bytes: int = PLOT_CACHE_MAX_BYTES) -> None:
+        """
+        Instantiate a :class:`PlotImageCache` instance.
+
+        :param: widget
+            The widget used to create images and schedule callbacks on the main thread.
+
+        :param: max_bytes
+            The maximum number of bytes of decoded plots to hold.
+
+        """
+
+        self._after_id: str | None = None
+        self._bytes: int = 0
+        self._decoded_queue: Queue = Queue()
+        self._decoding: bool = False
+        self._decoding_lock: Lock = Lock()
+        self._entries: OrderedDict[tuple[str, int], _CachedPlot] = OrderedDict()
+        self._generation: int = 0
+        self._max_bytes: int = max_bytes
+        self._pending: deque[
+            tuple[
+                int,
+                tuple[str, int],
+                list[Image.Image] | None,
+                tuple[int, int] | None,
+                bool,
+            ]
+        ] = deque()
+        self._thumbnail_callback: Callable[[str, ImageTk.PhotoImage], None] | None = (
+            None
+        )
+        self._widget = widget
+
+    def _decode_pending(self) -> None:
+        """
+        Decode the plots pending, and create their thumbnails, and pass them to the
+        main thread.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+        Plots pending from a prefetch which has since been cancelled are skipped.
+
+        """
+
+        while True:
+            with self._decoding_lock:
+                if len(self._pending) == 0:
+                    self._decoding = False
+                    return
+                generation, key, levels, box, thumbnails = self._pending.popleft()
+
+            if generation != self._generation:
+                continue
+            try:
+                decoded_levels = _decode(key[0]) if levels is None else None
+                self._decoded_queue.put(
+                    (
+                        generation,
+                        key,
+                        decoded_levels,
+                        (
+                            _render(
+                                decoded_levels,
+                                _fitted_size(decoded_levels[0].size, box, 1),
+                            )
+                            if decoded_levels is not None
+                            else None
+                        ),
+                        (
+                            _thumbnail(*key, levels or decoded_levels)
+                            if thumbnails
+                            else None
+                        ),
+                    )
+                )
+            except (OSError, ValueError):
+                continue
+
+    def _insert(self, key: tuple[str, int], levels: list[Image.Image]) -> _CachedPlot:
+        """
+        Cache a decoded plot.
+
+        :param: key
+            The key of the plot.
+
+        :param: levels
+            The pyramid of the plot.
+
+        :returns:
+            The cached plot.
+
+        """
+
+        # Drop any stale version of the plot.
+        for stale_key in [
+            stale_key
+            for stale_key in self._entries
+            if stale_key[0] == key[0] and stale_key != key
+        ]:
+            self._bytes -= self._entries.pop(stale_key).size
+
+        self._entries[key] = (cached_plot := _CachedPlot(levels))
+        self._bytes += cached_plot.size
+        self._evict()
+
+        return cached_plot
+
+    def _evict(self) -> None:
+        """Drop the least-recently-used plots, always keeping the latest plot."""
+
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            self._bytes -= self._entries.popitem(last=False)[1].size
+
+    def _poll(self) -> None:
+        """Cache the next plot decoded in the background."""
+
+        self._after_id = None
+        decoding = self._decoding
+        try:
+            generation, key, levels, rendered, thumbnail = (
+                self._decoded_queue.get_nowait()
+            )
+        except Empty:
+            if decoding:
+                self._after_id = self._widget.after(
+                    PLOT_CACHE_POLL_INTERVAL, self._poll
+                )
+            return
+
+        if generation == self._generation:
+            if levels is not None and key not in self._entries:
+                self._set_photo_image(self._insert(key, levels), rendered)
+            if thumbnail is not None and self._thumbnail_callback is not None:
+                self._thumbnail_callback(
+                    key[0], ImageTk.PhotoImage(thumbnail, master=self._widget)
+                )
+
+        self._after_id = self._widget.after_idle(self._poll)
+
+    def _set_photo_image(self, cached_plot: _CachedPlot, image: Image.Image) -> None:
+        """
+        Replace the Tk image of a cached plot.
+
+        :param: cached_plot
+            The cached plot.
+
+        :param: image
+            The plot, resampled to the size at which it is to be displayed.
+
+        """
+
+        self._bytes -= cached_plot.size
+        cached_plot.photo_image = ImageTk.PhotoImage(image, master=self._widget)
+        cached_plot.photo_size = image.size
+        self._bytes += cached_plot.size
+        self._evict()
+
+    def cancel_prefetch(self) -> None:
+        """Abandon the plots still being prefetched, and stop creating thumbnails."""
+
+        self._generation += 1
+        self._thumbnail_callback = None
+        with self._decoding_lock:
+            self._pending.clear()
+
+    def get(
+        self, filepath: str, box: tuple[int, int] | None = None, zoom: float = 1
+    ) -> ImageTk.PhotoImage | None:
+        """
+        Return a plot ready to display, decoding it now if it has not been prefetched.
+
+        :param: filepath
+            The path to the plot.
+
+        :param: box
+            The width and height available to display the plot, or `None` to display
+            it at full resolution.
+
+        :param: zoom
+            The factor by which to scale the plot once fitted.
+
+        :returns:
+            The Tk image of the plot, or `None` if the plot cannot be read.
+
+        """
+
+        if (key := _cache_key(filepath)) is None:
+            return None
+
+        if (cached_plot := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        else:
+            try:
+                cached_plot = self._insert(key, _decode(filepath))
+            except (OSError, ValueError):
+                return None
+
+        if (
+            size := _fitted_size(cached_plot.levels[0].size, box, zoom)
+        ) != cached_plot.photo_size:
+            self._set_photo_image(cached_plot, _render(cached_plot.levels, size))
+
+        return cached_plot.photo_image
+
+    def max_zoom(
+        self, filepath: str, box: tuple[int, int] | None = None
+    ) -> float | None:
+        """
+        Return the largest zoom beyond which a plot is displayed no larger.
+
+        :param: filepath
+            The path to the plot.
+
+        :param: box
+            The width and height available to display the plot, or `None` to display
+            it at full resolution.
+
+        :returns:
+            The zoom at which the plot reaches :data:`PLOT_MAX_SCALE` times its full
+            resolution, or `None` if the plot has not been decoded.
+
+        """
+
+        if (key := _cache_key(filepath)) is None or (
+            cached_plot := self._entries.get(key)
+        ) is None:
+            return None
+
+        return PLOT_MAX_SCALE / _fit_scale(cached_plot.levels[0].size, box)
+
+    def prefetch(
+        self,
+        filepaths: Iterable[str],
+        box: tuple[int, int] | None = None,
+        thumbnail_callback: Callable[[str, ImageTk.PhotoImage], None] | None = None,
+    ) -> None:
+        """
+        Decode plots in the background ready to be displayed.
+
+        The plots are decoded after any still pending from previous calls, until the
+        prefetch is cancelled with :meth:`cancel_prefetch`.
+
+        :param: filepaths
+            The paths to the plots.
+
+        :param: box
+            The width and height available to display the plots, or `None` to display
+            them at full resolution.
+
+        :param: thumbnail_callback
+            If given, the thumbnail of each plot is created, or read from disk, and the
+            callback is called on the main thread with the path to the plot and its
+            thumbnail.
+
+        """
+
+        if thumbnail_callback is not None:
+            self._thumbnail_callback = thumbnail_callback
+        jobs = [
+            (
+                self._generation,
+                key,
+                self._entries[key].levels if key in self._entries else None,
+                box,
+                thumbnail_callback is not None,
+            )
+            for filepath in filepaths
+            if (key := _cache_key(filepath)) is not None
+            and (thumbnail_callback is not None or key not in self._entries)
+        ]
+        if len(jobs) == 0:
+            return
+
+        with self._decoding_lock:
+            self._pending.extend(jobs)
+            start_decoding = not self._decoding
+            self._decoding = True
+        if start_decoding:
+            Thread(target=self._decode_pending, daemon=True).start()
+        if self._after_id is None:
+            self._after_id = self._widget.after(PLOT_CACHE_POLL_INTERVAL, self._poll)
@@ -19,17 +19,23 @@ from typing import Callable
 
 import ttkbootstrap as ttk
 
+from PIL import ImageTk
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import *
 from ttkbootstrap.tableview import Tableview
 from ttkbootstrap.tooltip import ToolTip
 
+from clover.__utils__ import get_locations_foldername
+
 from .__utils__ import (
     BaseScreen,
     IMAGES_DIRECTORY,
     MAIN_TEXT_FONTSIZE,
     MENU_BAR_FONTSIZE,
 )
+from .output_chart import HOURLY_OUTPUTS_FILENAME, HourlyOutputChart
+from .output_watcher import OutputWatcher
+from .plot_cache import PlotImageCache
 
 
 __all__ = ("PostRunScreen",)
@@ -42,6 +48,7 @@ PLOT_BASE_NAME: str = f"simulation_1_plots{os.path.sep}" + "{filename}"
 #   A map between output titles and filenames which can be displayed in the outputs.
 DISAPLYABLE_OUTPUTS: dict[str, str] = {
     "Summary": "info_file.json",
+    "Hourly results": HOURLY_OUTPUTS_FILENAME,
     "Annaul electric demand": PLOT_BASE_NAME.format(
         filename="electric_demand_annual_variation.png"
     ),
@@ -83,18 +90,29 @@ DISAPLYABLE_OUTPUTS: dict[str, str] = {
 
 OUTPUT_UNAVAILABLE_TOOLTIP_TEXT: str = (
     "This output can't be viewed. This is likely due to it not being applicable to the "
-    "type of CLOVER run you launched.",
+    "type of CLOVER run you launched, or to CLOVER not having saved it yet."
 )
 
+# Plot-fit delay:
+#   The delay, in milliseconds, after the outputs viewer is resized before the plot is
+#   fitted to its new size.
+PLOT_FIT_DELAY: int = 100
+
+# Plot zoom range:
+#   The smallest and largest factors by which a plot can be zoomed once fitted. Plots
+#   are zoomed in no further than the largest scale allowed by the plot cache.
+PLOT_ZOOM_RANGE: tuple[float, float] = (0.25, 8)
+
+# Plot zoom step:
+#   The factor by which a plot is zoomed with each step of the mouse wheel.
+PLOT_ZOOM_STEP: float = 1.25
+
 
 @dataclass
 class Output:
     """
     Represents an output that can be displayed.
 
-    .. attribute:: available
-        Whether the output is available for viewing.
-
     .. attribute:: filepath
         The filepath to the output.
 
@@ -111,12 +129,6 @@ class Output:
 
         return hash(self.filepath.get())
 
-    @property
-    def available(self) -> ttk.BooleanVar:
-        """Return whether the output is available for displaying."""
-
-        return os.path.isfile(self.filepath.get())
-
 
 class OutputsSelectionFrame(ScrolledFrame):
     """
@@ -146,18 +158,43 @@ class OutputsSelectionFrame(ScrolledFrame):
         self.columnconfigure(0, weight=1)
 
         for index, output in enumerate(self.output_selected_buttons.keys()):
-            (button := self.output_selected_buttons[output]).grid(
+            self.output_selected_buttons[output].grid(
                 row=index, column=0, padx=(10, 40), pady=5, sticky="ew"
             )
 
-            # Disable the button if the output isn't available.
-            if not output.available:
-                button.configure(state=DISABLED)
-                ToolTip(
-                    button,
-                    bootstyle=f"{INFO}.{OUTLINE}.TButton",
-                    text=OUTPUT_UNAVAILABLE_TOOLTIP_TEXT,
-                )
+        # Outputs are unavailable until they have been found, with a tooltip for each
+        # button which is reused as its availability changes.
+        self.output_tooltips: dict[ttk.Button, ToolTip] = {
+            button: ToolTip(button) for button in self.output_selected_buttons.values()
+        }
+        for output, button in self.output_selected_buttons.items():
+            self.set_output_available(output, button, False)
+
+    def set_output_available(
+        self, output: Output, button: ttk.Button, available: bool
+    ) -> None:
+        """
+        Enable or disable the button for an output based on its availability.
+
+        :param: output
+            The output.
+
+        :param: button
+            The button which selects the output.
+
+        :param: available
+            Whether the output is available for viewing.
+
+        """
+
+        button.configure(state="enabled" if available else DISABLED)
+        tooltip = self.output_tooltips[button]
+        if available:
+            tooltip.bootstyle = f"{INFO}.TButton"
+            tooltip.text = os.path.basename(output.filepath.get())
+        else:
+            tooltip.bootstyle = f"{INFO}.{OUTLINE}.TButton"
+            tooltip.text = OUTPUT_UNAVAILABLE_TOOLTIP_TEXT
 
 
 class OutputsViewerFrame(ScrolledFrame):
@@ -225,18 +262,133 @@ class OutputsViewerFrame(ScrolledFrame):
         )
         self.table_output_viewer.insert_column(END, "Value", width=400, minwidth=400)
 
-        # Image viewer
+        # Image viewer, which fits plots to the space available and zooms them with
+        # Ctrl and the mouse wheel, resetting on double click.
         self.image_output_viewer = ttk.Label(self, text="")
-        self.photo_image: ttk.PhotoImage | None = None
+        self.photo_image: ImageTk.PhotoImage | None = None
+        self.plot_image_cache = PlotImageCache(self)
+        self.plot_zoom: float = 1
+
+        self._fit_after_id: str | None = None
+        self.container.bind("<Configure>", self._schedule_fit, "+")
+        self.image_output_viewer.bind("<Control-MouseWheel>", self._zoom_plot)
+        self.image_output_viewer.bind("<Control-Button-4>", self._zoom_plot)
+        self.image_output_viewer.bind("<Control-Button-5>", self._zoom_plot)
+        self.image_output_viewer.bind("<Double-Button-1>", self._reset_plot_zoom)
+
+        # Chart viewer, for the hourly outputs.
+        self.chart_output_viewer = HourlyOutputChart(self)
 
         # Table rows
         self.table_rows: list[tuple[str]] = []
 
+    def _display_plot(self) -> None:
+        """Display the plot currently open, fitted to the space available."""
+
+        self._fit_after_id = None
+        if not self.output_filepath.get().endswith(".png"):
+            return
+
+        # Fetch the image, decoded in the background where prefetched.
+        self.photo_image = self.plot_image_cache.get(
+            self.output_filepath.get(), self.plot_box(), self.plot_zoom
+        )
+
+        # Set the photo image to be the background of the label.
+        self.image_output_viewer.configure(
+            image=self.photo_image if self.photo_image is not None else ""
+        )
+
+    def _location_directory(self, filepath: str) -> str | None:
+        """
+        Return the directory of the location whose run saved an output.
+
+        :param: filepath
+            The path to the output.
+
+        :returns:
+            The directory of the location, or `None` if the output is not within the
+            locations directory.
+
+        """
+
+        locations_directory = os.path.abspath(get_locations_foldername())
+        relative_path = os.path.relpath(os.path.abspath(filepath), locations_directory)
+        if relative_path.startswith(os.pardir):
+            return None
+
+        return os.path.join(locations_directory, relative_path.split(os.sep)[0])
+
     def _open_file(self) -> None:
         """Opens the file that is currently open."""
 
         subprocess.Popen(["open", self.output_filepath.get()])
 
+    def _reset_plot_zoom(self, _=None) -> None:
+        """Fit the plot currently open to the space available."""
+
+        self.plot_zoom = 1
+        self._display_plot()
+
+    def _schedule_fit(self, _=None) -> None:
+        """Fit the plot to the viewer once it has finished being resized."""
+
+        if self._fit_after_id is not None:
+            self.after_cancel(self._fit_after_id)
+        self._fit_after_id = self.after(PLOT_FIT_DELAY, self._display_plot)
+
+    def _zoom_plot(self, event) -> None:
+        """
+        Zoom the plot currently open in or out.
+
+        :param: event
+            The mouse-wheel event.
+
+        """
+
+        zoom_in: bool = event.num == 4 or (event.num != 5 and event.delta > 0)
+
+        # Stop zooming in once the plot is displayed at its largest.
+        max_zoom = self.plot_image_cache.max_zoom(
+            self.output_filepath.get(), self.plot_box()
+        )
+        self.plot_zoom = min(
+            max(
+                self.plot_zoom * (PLOT_ZOOM_STEP if zoom_in else 1 / PLOT_ZOOM_STEP),
+                PLOT_ZOOM_RANGE[0],
+            ),
+            (
+                PLOT_ZOOM_RANGE[1]
+                if max_zoom is None
+                else min(max_zoom, PLOT_ZOOM_RANGE[1])
+            ),
+        )
+        self._display_plot()
+
+    def plot_box(self) -> tuple[int, int] | None:
+        """
+        Return the width and height available to display plots.
+
+        :returns:
+            The width and height available, or `None` if the viewer has not yet been
+            drawn.
+
+        """
+
+        if (width := self.container.winfo_width()) <= 1:
+            return None
+
+        return (
+            max(width - 40 - self.vscroll.winfo_reqwidth(), 1),
+            max(
+                self.container.winfo_height()
+                - self.output_name.winfo_reqheight()
+                - self.output_description.winfo_reqheight()
+                - 50,
+                1,
+            ),
+        )
+
     def display_output(self, output: Output) -> None:
         """
         Display the output requested.
@@ -248,11 +400,14 @@ class OutputsViewerFrame(ScrolledFrame):
 
         # Update the label for the output
         self.output_name.configure(text=output.title.get())
+        if output.filepath.get() != self.output_filepath.get():
+            self.plot_zoom = 1
         self.output_filepath.set(output.filepath.get())
 
         # If a CSV is being viewed, display the output as a table.
         if output.filepath.get().endswith(".json"):
-            # Remove the image output viewer from the screen.
+            # Remove the image and chart output viewers from the screen.
+            self.chart_output_viewer.grid_forget()
             self.image_output_viewer.grid_forget()
             self.table_output_viewer.grid(
                 row=1, column=0, columnspan=2, sticky="news", padx=20, pady=5
@@ -372,19 +527,27 @@ class OutputsViewerFrame(ScrolledFrame):
             # Display the table viewer on the screen.
             self.table_output_viewer.load_table_data()
 
+        # If the hourly outputs are being viewed, display them as a chart.
+        if output.filepath.get().endswith(".csv"):
+            # Remove the image and table output viewers from the screen.
+            self.image_output_viewer.grid_forget()
+            self.table_output_viewer.grid_forget()
+            self.chart_output_viewer.grid(
+                row=1, column=0, columnspan=2, sticky="news", padx=20, pady=5
+            )
+            self.chart_output_viewer.load(
+                output.filepath.get(), self._location_directory(output.filepath.get())
+            )
+
         # Otherwise, if an image is beind displayed, display these results.
         if output.filepath.get().endswith(".png"):
-            # Remove the tabl output viewer from the screen.
+            # Remove the tabl and chart output viewers from the screen.
+            self.chart_output_viewer.grid_forget()
             self.table_output_viewer.grid_forget()
             self.image_output_viewer.grid(
                 row=1, column=0, columnspan=2, sticky="news", padx=20, pady=5
             )
-
-            # Load the image from the file into a ttk PhotoImage.
-            self.photo_image = ttk.PhotoImage(file=output.filepath.get())
-
-            # Set the photo image to be the background of the label.
-            self.image_output_viewer.configure(image=self.photo_image)
+            self._display_plot()
 
 
 class PostRunScreen(BaseScreen, show_navigation=True):
@@ -428,6 +591,8 @@ class PostRunScreen(BaseScreen, show_navigation=True):
         super().__init__()
 
         self.output_directory_name: ttk.StringVar = output_directory_name
+        self.output_thumbnails: dict[str, ImageTk.PhotoImage] = {}
+        self.output_watcher = OutputWatcher(self, self._output_availability_changed)
 
         # Create the list of outputs available for viewing.
         self.outputs: list[Output] = [
@@ -654,27 +819,92 @@ class PostRunScreen(BaseScreen, show_navigation=True):
             output.filepath.set(new_output_name)
             button.configure(command=lambda output=output: self._select_output(output))
 
-    def update_outputs_availability(self) -> None:
-        """Update the buttons for toggling outputs based on their availability."""
+    def _set_thumbnail(self, filepath: str, thumbnail: ImageTk.PhotoImage) -> None:
+        """
+        Display the thumbnail of a plot on the button which selects it.
+
+        :param: filepath
+            The path to the plot.
+
+        :param: thumbnail
+            The thumbnail of the plot.
+
+        """
 
         for (
             output,
             button,
         ) in self.outputs_selection_frame.output_selected_buttons.items():
-            if not output.available:
-                button.configure(state=DISABLED)
-                ToolTip(
-                    button,
-                    bootstyle=f"{INFO}.{OUTLINE}.TButton",
-                    text=OUTPUT_UNAVAILABLE_TOOLTIP_TEXT,
-                )
-            else:
-                button.configure(state="enabled")
-                ToolTip(
-                    button,
-                    bootstyle=f"{INFO}.TButton",
-                    text="",
+            if output.filepath.get() == filepath:
+                self.output_thumbnails[filepath] = thumbnail
+                button.configure(compound=LEFT, image=thumbnail)
+
+    def _output_availability_changed(
+        self, appeared: list[str], disappeared: list[str]
+    ) -> None:
+        """
+        Update the buttons for the outputs whose availability has changed.
+
+        :param: appeared
+            The paths to the outputs which have become available.
+
+        :param: disappeared
+            The paths to the outputs which are no longer available.
+
+        """
+
+        for (
+            output,
+            button,
+        ) in self.outputs_selection_frame.output_selected_buttons.items():
+            if (filepath := output.filepath.get()) in appeared:
+                self.outputs_selection_frame.set_output_available(output, button, True)
+            elif filepath in disappeared:
+                self.outputs_selection_frame.set_output_available(
+                    output, button, False
                 )
+                button.configure(image="")
+                self.output_thumbnails.pop(filepath, None)
+
+        # Decode the plots which have appeared, and their thumbnails, in the background
+        # ready for viewing.
+        self.outputs_viewer_frame.plot_image_cache.prefetch(
+            (filepath for filepath in appeared if filepath.endswith(".png")),
+            self.outputs_viewer_frame.plot_box(),
+            self._set_thumbnail,
+        )
+
+        # Display the output being viewed again if it has only now been saved.
+        for output in self.outputs:
+            if (
+                output.filepath.get() in appeared
+                and output.filepath.get()
+                == self.outputs_viewer_frame.output_filepath.get()
+            ):
+                self._select_output(output)
+
+    def update_outputs_availability(self) -> None:
+        """
+        Watch the outputs of the run, enabling the button for each as it is saved.
+
+        Outputs which have already been saved are enabled straight away, whilst those
+        which CLOVER is still writing are enabled as they appear.
+
+        """
+
+        self.output_thumbnails = {}
+        self.outputs_viewer_frame.plot_image_cache.cancel_prefetch()
+        for (
+            output,
+            button,
+        ) in self.outputs_selection_frame.output_selected_buttons.items():
+            button.configure(image="")
+            self.outputs_selection_frame.set_output_available(output, button, False)
+
+        self.output_watcher.watch(
+            output.filepath.get()
+            for output in self.outputs_selection_frame.output_selected_buttons
+        )
 
         # Display the first output
         self._select_output(self.outputs[0])
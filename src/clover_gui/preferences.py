@@ -15,7 +15,6 @@ import tkinter as tk
 from typing import Callable
 
 import ttkbootstrap as ttk
-import yaml
 
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import *
@@ -38,6 +37,7 @@ from .__utils__ import (
     SYSTEM_LIFETIME,
     THEME,
 )
+from .yaml_io import dump_yaml
 
 __all__ = ("PreferencesWindow",)
 
@@ -411,7 +411,7 @@ class PreferencesWindow(tk.Toplevel):
         with open(
             GLOBAL_SETTINGS_FILEPATH, "w", encoding="utf-8"
         ) as global_settings_file:
-            yaml.dump(
+            dump_yaml(
                 {
                     END_YEAR: self.preferences_screen.end_year.get(),
                     FONTSIZE: self.preferences_screen.fontsize_combobox.get(),
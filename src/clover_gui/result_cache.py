@@ -0,0 +1,218 @@
+#!/usr/bin/python3.10
+########################################################################################
+# result_cache.py - The result-cache module for CLOVER-GUI application.                #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import hashlib
+import json
+import os
+
+from typing import Iterable
+
+__all__ = (
+    "compute_input_hash",
+    "RESULT_CACHE_DIRECTORY",
+    "ResultCache",
+)
+
+# Hash chunk size:
+#   The number of bytes read at a time when hashing a file.
+HASH_CHUNK_SIZE: int = 1 << 20
+
+# Output flag:
+#   The CLOVER flag which specifies the output name, which is excluded from hashes.
+OUTPUT_FLAG: str = "-o"
+
+# Output directory:
+#   Keyword used for saving the output directory of a cached run.
+OUTPUT_DIRECTORY: str = "output_directory"
+
+# Result cache directory:
+#   The name of the directory, within a location's outputs, holding the result cache.
+RESULT_CACHE_DIRECTORY: str = ".result_cache"
+
+# File digests:
+#   A memo of the digest of each file hashed, along with the size and modification time
+#   at which it was hashed, so that unchanged files are not read again.
+_FILE_DIGESTS: dict[str, tuple[int, int, str]] = {}
+
+
+def _file_digest(filepath: str) -> str:
+    """
+    Compute the digest of a file's contents, reusing the last digest if unchanged.
+
+    :param: filepath
+        The path to the file.
+
+    :returns:
+        The hex digest of the file, or an empty string if the file does not exist.
+
+    """
+
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return ""
+
+    if (memo := _FILE_DIGESTS.get(filepath)) is not None and memo[:2] == (
+        stat.st_size,
+        stat.st_mtime_ns,
+    ):
+        return memo[2]
+
+    file_hash = hashlib.sha256()
+    with open(filepath, "rb") as hash_file:
+        while chunk := hash_file.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+
+    digest = file_hash.hexdigest()
+    _FILE_DIGESTS[filepath] = (stat.st_size, stat.st_mtime_ns, digest)
+
+    return digest
+
+
+def compute_input_hash(
+    clover_args: list[str], filepaths: Iterable[str], directories: Iterable[str]
+) -> str:
+    """
+    Compute a canonical hash of the inputs to a CLOVER run.
+
+    The hash covers the arguments passed to CLOVER, other than the output name which
+    differs between every run, along with the contents of every input file and of every
+    file, other than hidden files, within the directories given.
+
+    :param: clover_args
+        The arguments passed to CLOVER.
+
+    :param: filepaths
+        The paths to the input files used by the run.
+
+    :param: directories
+        The paths to directories, e.g., of auto-generated profiles, used by the run.
+
+    :returns:
+        The hex digest of the inputs.
+
+    """
+
+    # Exclude the output name from the arguments.
+    hashed_args: list[str] = []
+    skip_next: bool = False
+    for arg in clover_args:
+        if skip_next or arg == OUTPUT_FLAG:
+            skip_next = not skip_next
+            continue
+        hashed_args.append(arg)
+
+    # Gather the files to hash, in a canonical order.
+    hashed_filepaths: set[str] = {
+        os.path.normpath(os.path.abspath(filepath)) for filepath in filepaths
+    }
+    for directory in directories:
+        for dirpath, dirnames, filenames in os.walk(directory):
+            # Hidden entries, e.g., caches and partially-written files, are not inputs.
+            dirnames[:] = [
+                dirname for dirname in dirnames if not dirname.startswith(".")
+            ]
+            hashed_filepaths.update(
+                os.path.normpath(os.path.abspath(os.path.join(dirpath, filename)))
+                for filename in filenames
+                if not filename.startswith(".")
+            )
+
+    input_hash = hashlib.sha256(json.dumps(hashed_args).encode("utf-8"))
+    for filepath in sorted(hashed_filepaths):
+        input_hash.update(f"\0{filepath}\0{_file_digest(filepath)}".encode("utf-8"))
+
+    return input_hash.hexdigest()
+
+
+class ResultCache:
+    """
+    Represents an index of completed CLOVER runs by the hash of their inputs.
+
+    Each entry is stored in its own small file, named by the hash and sharded by the
+    first two characters of the hash, so that a lookup is a single file read regardless
+    of how many runs have been cached.
+
+    .. attribute:: cache_directory
+        The directory in which the index is stored.
+
+    """
+
+    def __init__(self, cache_directory: str) -> None:
+        """
+        Instantiate a :class:`ResultCache` instance.
+
+        :param: cache_directory
+            The directory in which the index is stored.
+
+        """
+
+        self.cache_directory: str = cache_directory
+
+    def _entry_filepath(self, input_hash: str) -> str:
+        """
+        Return the path to the index entry for a hash.
+
+        :param: input_hash
+            The hash of the inputs to a run.
+
+        """
+
+        return os.path.join(self.cache_directory, input_hash[:2], f"{input_hash}.json")
+
+    def lookup(self, input_hash: str) -> str | None:
+        """
+        Look up a completed run with the given inputs.
+
+        :param: input_hash
+            The hash of the inputs to the run.
+
+        :returns:
+            The output directory of the completed run, or `None` if there is no such run
+            whose outputs still exist.
+
+        """
+
+        try:
+            with open(
+                self._entry_filepath(input_hash), "r", encoding="utf-8"
+            ) as entry_file:
+                output_directory: str = json.load(entry_file)[OUTPUT_DIRECTORY]
+        except (OSError, KeyError, TypeError, json.JSONDecodeError):
+            return None
+
+        # Only return runs whose outputs have not since been removed.
+        if not os.path.isdir(output_directory) or not os.listdir(output_directory):
+            return None
+
+        return output_directory
+
+    def register(self, input_hash: str, output_directory: str) -> None:
+        """
+        Register a completed run.
+
+        :param: input_hash
+            The hash of the inputs to the run.
+
+        :param: output_directory
+            The output directory of the run.
+
+        """
+
+        entry_filepath = self._entry_filepath(input_hash)
+        os.makedirs(os.path.dirname(entry_filepath), exist_ok=True)
+
+        # Write the entry atomically so that an interrupted write is never read.
+        with open(
+            temporary_filepath := f"{entry_filepath}.tmp", "w", encoding="utf-8"
+        ) as entry_file:
+            json.dump({OUTPUT_DIRECTORY: output_directory}, entry_file)
+        os.replace(temporary_filepath, entry_filepath)
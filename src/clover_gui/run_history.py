@@ -0,0 +1,496 @@
+#!/usr/bin/python3.10
+########################################################################################
+# run_history.py - The run-history module for CLOVER-GUI application.                  #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import datetime
+import json
+import os
+import sqlite3
+import tkinter as tk
+
+from typing import Callable
+
+import ttkbootstrap as ttk
+
+from clover import OperatingMode, OUTPUTS_FOLDER
+from clover.__utils__ import get_locations_foldername
+from ttkbootstrap.constants import *
+
+from .__utils__ import format_value, LOAD_LOCATION_GEOMETRY
+from .run_timings import RunTimings
+from .sweep import read_sweep_results, SWEEP_CRITERIA
+
+__all__ = (
+    "location_run_history",
+    "RUN_HISTORY_FILENAME",
+    "RunHistory",
+    "RunHistoryWindow",
+)
+
+# All:
+#   Keyword used to select all values of a filter.
+ALL_FILTER: str = "All"
+
+# History columns:
+#   The columns of the run-history table, mapped to the database column by which each
+#   is sorted.
+HISTORY_COLUMNS: dict[str, str] = {
+    "Launched": "launched",
+    "Mode": "operating_mode",
+    "Output": "output_name",
+    "Status": "return_code",
+    "Duration / s": "total_duration",
+    **{name: criterion.value for criterion, name in SWEEP_CRITERIA.items()},
+}
+
+# History display limit:
+#   The maximum number of runs displayed in the run-history table at once.
+HISTORY_DISPLAY_LIMIT: int = 500
+
+# History status filters:
+#   The status filters available, mapped to the condition which each applies.
+HISTORY_STATUS_FILTERS: dict[str, str] = {
+    "Succeeded": "return_code = 0",
+    "Failed": "return_code IS NOT 0",
+}
+
+# Run history filename:
+#   The name of the database, within a location's outputs, holding its run history.
+RUN_HISTORY_FILENAME: str = "run_history.sqlite3"
+
+# Run-history schema:
+#   The statements which create the run-history table along with an index on each of
+#   the columns by which runs can be filtered or sorted.
+RUN_HISTORY_SCHEMA: str = (
+    "CREATE TABLE IF NOT EXISTS runs ("
+    "id INTEGER PRIMARY KEY, launched REAL NOT NULL, finished REAL, "
+    "location_name TEXT, operating_mode TEXT, output_name TEXT, "
+    "output_directory TEXT, clover_args TEXT, input_hash TEXT, return_code INTEGER, "
+    "total_duration REAL, timings TEXT, "
+    + ", ".join(f"{criterion.value} REAL" for criterion in SWEEP_CRITERIA)
+    + ");\n"
+    "CREATE INDEX IF NOT EXISTS runs_input_hash ON runs (input_hash);\n"
+    + "".join(
+        f"CREATE INDEX IF NOT EXISTS runs_{column} ON runs ({column});\n"
+        for column in HISTORY_COLUMNS.values()
+    )
+)
+
+
+def location_run_history(location_name: str) -> "RunHistory":
+    """
+    Return the run history of a location.
+
+    :param: location_name
+        The name of the location.
+
+    :returns:
+        The :class:`RunHistory` held within the location's outputs.
+
+    """
+
+    return RunHistory(
+        os.path.join(
+            get_locations_foldername(),
+            location_name,
+            OUTPUTS_FOLDER,
+            RUN_HISTORY_FILENAME,
+        )
+    )
+
+
+class RunHistory:
+    """
+    Represents the index of past CLOVER runs for a location.
+
+    The index is held in a SQLite database within the location's outputs, with an index
+    on each column by which runs can be filtered or sorted, so that queries remain fast
+    however many runs have been carried out.
+
+    .. attribute:: database_filepath
+        The path to the database.
+
+    """
+
+    def __init__(self, database_filepath: str) -> None:
+        """
+        Instantiate a :class:`RunHistory` instance.
+
+        :param: database_filepath
+            The path to the database.
+
+        """
+
+        self.database_filepath: str = database_filepath
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database, creating it if it does not exist."""
+
+        os.makedirs(os.path.dirname(self.database_filepath), exist_ok=True)
+        connection = sqlite3.connect(self.database_filepath)
+        connection.row_factory = sqlite3.Row
+        connection.executescript(RUN_HISTORY_SCHEMA)
+
+        return connection
+
+    def query(
+        self,
+        operating_mode: OperatingMode | None = None,
+        status: str | None = None,
+        search: str = "",
+        sort_column: str = "launched",
+        descending: bool = True,
+        limit: int = HISTORY_DISPLAY_LIMIT,
+    ) -> tuple[int, list[sqlite3.Row]]:
+        """
+        Query the runs which match the filters given.
+
+        :param: operating_mode
+            If specified, only runs in this operating mode are returned.
+
+        :param: status
+            If specified, one of the :data:`HISTORY_STATUS_FILTERS`.
+
+        :param: search
+            Text which the output name of each run should contain.
+
+        :param: sort_column
+            The column by which to sort the runs.
+
+        :param: descending
+            Whether to sort the runs in descending order.
+
+        :param: limit
+            The maximum number of runs to return.
+
+        :returns:
+            A `tuple` containing:
+            - the total number of runs which match the filters;
+            - the matching runs, sorted, up to the limit given.
+
+        """
+
+        if sort_column not in HISTORY_COLUMNS.values():
+            raise ValueError(f"Cannot sort runs by unknown column '{sort_column}'.")
+
+        conditions: list[str] = []
+        parameters: list[str] = []
+        if operating_mode is not None:
+            conditions.append("operating_mode = ?")
+            parameters.append(operating_mode.value)
+        if status is not None:
+            conditions.append(HISTORY_STATUS_FILTERS[status])
+        if search != "":
+            conditions.append("output_name LIKE ? ESCAPE '\\'")
+            parameters.append(
+                "%"
+                + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                + "%"
+            )
+        where = f"WHERE {' AND '.join(conditions)}" if len(conditions) > 0 else ""
+
+        with self._connect() as connection:
+            count: int = connection.execute(
+                f"SELECT COUNT(*) FROM runs {where}", parameters
+            ).fetchone()[0]
+            runs = connection.execute(
+                f"SELECT * FROM runs {where} "
+                f"ORDER BY {sort_column} {'DESC' if descending else 'ASC'} LIMIT ?",
+                [*parameters, limit],
+            ).fetchall()
+        connection.close()
+
+        return count, runs
+
+    def record(
+        self,
+        clover_args: list[str],
+        input_hash: str | None,
+        location_name: str,
+        operating_mode: OperatingMode,
+        output_directory: str,
+        return_code: int | None,
+        run_timings: RunTimings,
+    ) -> None:
+        """
+        Record a run which has finished.
+
+        :param: clover_args
+            The arguments passed to CLOVER.
+
+        :param: input_hash
+            The hash of the inputs to the run, if computed.
+
+        :param: location_name
+            The name of the location which was run.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: output_directory
+            The directory into which CLOVER saved the outputs from the run.
+
+        :param: return_code
+            The return code of the run.
+
+        :param: run_timings
+            The timings of the run.
+
+        """
+
+        timings = run_timings.as_dict(return_code, output_directory)
+        results = (
+            read_sweep_results(output_directory) if return_code == 0 else None
+        ) or {}
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO runs (launched, finished, location_name, operating_mode, "
+                "output_name, output_directory, clover_args, input_hash, return_code, "
+                "total_duration, timings, "
+                f"{', '.join(criterion.value for criterion in SWEEP_CRITERIA)}) "
+                f"VALUES ({', '.join('?' * (11 + len(SWEEP_CRITERIA)))})",
+                (
+                    run_timings.launched,
+                    run_timings.finished,
+                    location_name,
+                    operating_mode.value,
+                    os.path.basename(output_directory),
+                    output_directory,
+                    json.dumps(clover_args),
+                    input_hash,
+                    return_code,
+                    timings["total_duration"],
+                    json.dumps(timings["stages"]),
+                    *(results.get(criterion) for criterion in SWEEP_CRITERIA),
+                ),
+            )
+        connection.close()
+
+    def summary(self) -> tuple[int, float | None]:
+        """
+        Summarise the runs which have been carried out.
+
+        The database is not created if it does not exist.
+
+        :returns:
+            A `tuple` containing:
+            - the number of runs;
+            - the time at which the latest run was launched, or `None` if there have
+              been no runs.
+
+        """
+
+        if not os.path.isfile(self.database_filepath):
+            return 0, None
+
+        with self._connect() as connection:
+            run_count, last_run = connection.execute(
+                "SELECT COUNT(*), MAX(launched) FROM runs"
+            ).fetchone()
+        connection.close()
+
+        return run_count, last_run
+
+
+class RunHistoryWindow(tk.Toplevel):
+    """
+    Represents the run-history popup window.
+
+    The run-history window lists the past runs of a location, which can be filtered and
+    sorted, and enables a user to open the outputs of a past run.
+
+    .. attribute:: run_history
+        The :class:`RunHistory` of the location.
+
+    """
+
+    def __init__(
+        self, location_name: str, open_run_outputs: Callable, run_history: RunHistory
+    ) -> None:
+        """
+        Instantiate a :class:`RunHistoryWindow` instance.
+
+        :param: location_name
+            The name of the location.
+
+        :param: open_run_outputs
+            Function which opens the outputs of a run in the post-run screen, given the
+            run's output directory.
+
+        :param: run_history
+            The :class:`RunHistory` of the location.
+
+        """
+
+        super().__init__()
+
+        self.title(f"CLOVER-GUI Run History: {location_name}")
+        self.geometry(LOAD_LOCATION_GEOMETRY)
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+        self.open_run_outputs = open_run_outputs
+        self.run_history = run_history
+
+        self._output_directories: dict[str, str] = {}
+        self._sort_column: str = "launched"
+        self._sort_descending: bool = True
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=10)
+        self.rowconfigure(2, weight=1)
+
+        # Filters
+        self.filters_frame = ttk.Frame(self)
+        self.filters_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
+        self.filters_frame.columnconfigure(5, weight=1)
+
+        self.operating_mode = ttk.StringVar(self, ALL_FILTER, "history_operating_mode")
+        self.status = ttk.StringVar(self, ALL_FILTER, "history_status")
+        self.search = ttk.StringVar(self, "", "history_search")
+
+        for column, (text, variable, values) in enumerate(
+            [
+                (
+                    "Mode",
+                    self.operating_mode,
+                    [ALL_FILTER, *(mode.value.capitalize() for mode in OperatingMode)],
+                ),
+                ("Status", self.status, [ALL_FILTER, *HISTORY_STATUS_FILTERS]),
+            ]
+        ):
+            ttk.Label(self.filters_frame, text=text).grid(
+                row=0, column=2 * column, padx=10, sticky="w"
+            )
+            combobox = ttk.Combobox(
+                self.filters_frame,
+                bootstyle=INFO,
+                state=READONLY,
+                textvariable=variable,
+                values=values,
+                width=15,
+            )
+            combobox.grid(row=0, column=2 * column + 1, padx=10, sticky="w")
+            combobox.bind("<<ComboboxSelected>>", lambda _: self.refresh())
+
+        self.search_label = ttk.Label(self.filters_frame, text="Output name")
+        self.search_label.grid(row=0, column=4, padx=10, sticky="w")
+        self.search_entry = ttk.Entry(
+            self.filters_frame, bootstyle=INFO, textvariable=self.search
+        )
+        self.search_entry.grid(row=0, column=5, padx=10, sticky="ew")
+        self.search_entry.bind("<Return>", lambda _: self.refresh())
+
+        # Runs table
+        self.runs_treeview = ttk.Treeview(
+            self,
+            bootstyle=INFO,
+            columns=list(HISTORY_COLUMNS),
+            selectmode=BROWSE,
+            show="headings",
+        )
+        for column, database_column in HISTORY_COLUMNS.items():
+            self.runs_treeview.heading(
+                column,
+                text=column,
+                anchor=W,
+                command=lambda column=database_column: self._sort_by(column),
+            )
+            self.runs_treeview.column(column, width=110, minwidth=80, stretch=True)
+        self.runs_treeview.grid(row=1, column=0, sticky="news", padx=20, pady=5)
+        self.runs_treeview.bind("<Double-1>", lambda _: self._view_selected_outputs())
+
+        # Buttons
+        self.buttons_frame = ttk.Frame(self)
+        self.buttons_frame.grid(row=2, column=0, sticky="ew", padx=20)
+        self.buttons_frame.columnconfigure(0, weight=1)
+
+        self.count_label = ttk.Label(self.buttons_frame, bootstyle=SECONDARY, text="")
+        self.count_label.grid(row=0, column=0, sticky="w", pady=10)
+
+        self.view_outputs_button = ttk.Button(
+            self.buttons_frame,
+            bootstyle=f"{INFO}-{OUTLINE}",
+            command=self._view_selected_outputs,
+            text="View outputs",
+        )
+        self.view_outputs_button.grid(row=0, column=1, pady=10, sticky="e")
+
+        self.refresh()
+
+    def _sort_by(self, column: str) -> None:
+        """
+        Sort the runs by a column, reversing the order if already sorted by it.
+
+        :param: column
+            The database column to sort by.
+
+        """
+
+        self._sort_descending = column != self._sort_column or not self._sort_descending
+        self._sort_column = column
+        self.refresh()
+
+    def _view_selected_outputs(self) -> None:
+        """Open the outputs of the run currently selected in the post-run screen."""
+
+        if len(selection := self.runs_treeview.selection()) == 0:
+            return
+
+        if os.path.isdir(output_directory := self._output_directories[selection[0]]):
+            self.open_run_outputs(output_directory)
+
+    def refresh(self) -> None:
+        """Query the runs which match the filters and refresh the table."""
+
+        count, runs = self.run_history.query(
+            (
+                OperatingMode(self.operating_mode.get().lower())
+                if self.operating_mode.get() != ALL_FILTER
+                else None
+            ),
+            self.status.get() if self.status.get() != ALL_FILTER else None,
+            self.search.get(),
+            self._sort_column,
+            self._sort_descending,
+        )
+
+        self.runs_treeview.delete(*self.runs_treeview.get_children())
+        self._output_directories = {}
+        for run in runs:
+            self._output_directories[iid := str(run["id"])] = run["output_directory"]
+            self.runs_treeview.insert(
+                "",
+                END,
+                iid=iid,
+                values=(
+                    datetime.datetime.fromtimestamp(run["launched"]).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                    run["operating_mode"].capitalize(),
+                    run["output_name"],
+                    (
+                        "Succeeded"
+                        if run["return_code"] == 0
+                        else f"Failed ({run['return_code']})"
+                    ),
+                    format_value(run["total_duration"]),
+                    *(
+                        format_value(run[criterion.value])
+                        for criterion in SWEEP_CRITERIA
+                    ),
+                ),
+            )
+
+        self.count_label.configure(
+            text=f"Showing {len(runs)} of {count} runs"
+            + (" - refine the filters to see more" if count > len(runs) else "")
+        )
@@ -0,0 +1,305 @@
+#!/usr/bin/python3.10
+########################################################################################
+# run_log.py - The run-log module for CLOVER-GUI application.                          #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import array
+import collections
+import itertools
+import os
+import tkinter as tk
+
+from tkinter import font as tkfont
+from typing import BinaryIO
+
+import ttkbootstrap as ttk
+
+from ttkbootstrap.constants import *
+
+__all__ = (
+    "RUN_LOGS_DIRECTORY",
+    "RunLog",
+    "RunLogViewer",
+)
+
+# Run-log index stride:
+#   The number of lines between successive entries in the on-disk line index.
+RUN_LOG_INDEX_STRIDE: int = 128
+
+# Run-log ring size:
+#   The number of the most recent lines which are held in memory.
+RUN_LOG_RING_SIZE: int = 2000
+
+# Run logs directory:
+#   The name of the directory, within a location's outputs, where run logs are saved.
+RUN_LOGS_DIRECTORY: str = "run_logs"
+
+
+class RunLog:
+    """
+    Represents the stdout log of a single CLOVER run.
+
+    Every line is written to a log file on disk whilst only the most recent lines are
+    held in memory. A sparse index of line offsets within the file is kept so that any
+    line can be read back without holding the whole log in memory.
+
+    .. attribute:: filepath
+        The path to the log file.
+
+    .. attribute:: line_count
+        The number of lines in the log.
+
+    """
+
+    def __init__(self, filepath: str, ring_size: int = RUN_LOG_RING_SIZE) -> None:
+        """
+        Instantiate a :class:`RunLog` instance.
+
+        :param: filepath
+            The path to the log file to create.
+
+        :param: ring_size
+            The number of recent lines to hold in memory.
+
+        """
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        self.filepath: str = filepath
+        self.line_count: int = 0
+
+        self._file_size: int = 0
+        self._line_offsets: array.array = array.array("Q")
+        self._log_file: BinaryIO = open(filepath, "wb")
+        self._reader: BinaryIO | None = None
+        self._ring: collections.deque[str] = collections.deque(maxlen=ring_size)
+
+    def append(self, lines: list[str]) -> None:
+        """
+        Append lines to the log.
+
+        :param: lines
+            The lines to append, without trailing newline characters.
+
+        """
+
+        if self._log_file.closed:
+            return
+
+        encoded_lines: list[bytes] = []
+        for line in lines:
+            if self.line_count % RUN_LOG_INDEX_STRIDE == 0:
+                self._line_offsets.append(self._file_size)
+
+            encoded_lines.append(encoded_line := line.encode("utf-8", "replace") + b"\n")
+            self._file_size += len(encoded_line)
+            self._ring.append(line)
+            self.line_count += 1
+
+        self._log_file.write(b"".join(encoded_lines))
+
+    def close(self) -> None:
+        """Close the log, flushing any lines not yet written to disk."""
+
+        self._log_file.close()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def lines(self, start: int, count: int) -> list[str]:
+        """
+        Return a window of lines from the log.
+
+        :param: start
+            The index of the first line to return.
+
+        :param: count
+            The maximum number of lines to return.
+
+        :returns:
+            The lines requested, without trailing newline characters.
+
+        """
+
+        start = max(start, 0)
+        end = min(start + count, self.line_count)
+        if start >= end:
+            return []
+
+        # Use the in-memory lines where possible.
+        if start >= (ring_start := self.line_count - len(self._ring)):
+            return list(
+                itertools.islice(self._ring, start - ring_start, end - ring_start)
+            )
+
+        # Otherwise, seek to the nearest indexed line in the file and read forwards.
+        if not self._log_file.closed:
+            self._log_file.flush()
+        if self._reader is None:
+            self._reader = open(self.filepath, "rb")
+
+        self._reader.seek(self._line_offsets[start // RUN_LOG_INDEX_STRIDE])
+        for _ in range(start % RUN_LOG_INDEX_STRIDE):
+            self._reader.readline()
+
+        return [
+            self._reader.readline().rstrip(b"\n").decode("utf-8", "replace")
+            for _ in range(end - start)
+        ]
+
+
+class RunLogViewer(ttk.Frame):
+    """
+    Represents a viewer for a :class:`RunLog`.
+
+    Only the lines which are visible are rendered, so that the cost of drawing the log
+    is independent of its length.
+
+    .. attribute:: first_line
+        The index of the first line being displayed.
+
+    .. attribute:: follow
+        Whether the viewer should keep the most recent lines in view.
+
+    .. attribute:: run_log
+        The :class:`RunLog` being displayed, if any.
+
+    """
+
+    def __init__(self, parent, **text_kwargs) -> None:
+        """
+        Instantiate a :class:`RunLogViewer` instance.
+
+        :param: parent
+            The parent frame.
+
+        :param: text_kwargs
+            Keyword arguments used for styling the underlying text widget.
+
+        """
+
+        super().__init__(parent)
+
+        self.first_line: int = 0
+        self.follow: bool = True
+        self.run_log: RunLog | None = None
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.text = tk.Text(self, state=DISABLED, wrap="none", **text_kwargs)
+        self.text.grid(row=0, column=0, sticky="news")
+
+        self.vertical_scrollbar = ttk.Scrollbar(
+            self, orient=VERTICAL, command=self._scroll
+        )
+        self.vertical_scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.horizontal_scrollbar = ttk.Scrollbar(
+            self, orient=HORIZONTAL, command=self.text.xview
+        )
+        self.horizontal_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.text.configure(xscrollcommand=self.horizontal_scrollbar.set)
+
+        self._line_height: int = tkfont.Font(font=self.text.cget("font")).metrics(
+            "linespace"
+        )
+
+        self.text.bind("<Configure>", lambda _: self.render())
+        self.text.bind("<MouseWheel>", self._on_mousewheel)
+        self.text.bind("<Button-4>", lambda _: self._scroll(SCROLL, -3, UNITS))
+        self.text.bind("<Button-5>", lambda _: self._scroll(SCROLL, 3, UNITS))
+
+    @property
+    def visible_lines(self) -> int:
+        """The number of lines which fit within the viewer."""
+
+        return max(self.text.winfo_height() // max(self._line_height, 1), 1)
+
+    def _on_mousewheel(self, event) -> None:
+        """
+        Scroll the viewer in response to the mouse wheel.
+
+        :param: event
+            The mouse-wheel event.
+
+        """
+
+        self._scroll(SCROLL, -3 if event.delta > 0 else 3, UNITS)
+
+    def _scroll(self, action: str, value: str | int, units: str | None = None) -> None:
+        """
+        Scroll the viewer, following the protocol of a scrollbar command.
+
+        :param: action
+            Either "moveto" or "scroll".
+
+        :param: value
+            The fraction to move to, or the number of units to scroll by.
+
+        :param: units
+            The units to scroll by, either "units" or "pages".
+
+        """
+
+        if self.run_log is None:
+            return
+
+        visible_lines = self.visible_lines
+        last_first_line = max(self.run_log.line_count - visible_lines, 0)
+
+        if action == MOVETO:
+            first_line = int(float(value) * self.run_log.line_count)
+        else:
+            first_line = self.first_line + int(value) * (
+                visible_lines if units == PAGES else 1
+            )
+
+        self.first_line = min(max(first_line, 0), last_first_line)
+        self.follow = self.first_line >= last_first_line
+        self.render()
+
+    def render(self) -> None:
+        """Render the visible window of lines."""
+
+        self.text.configure(state=NORMAL)
+        self.text.delete("1.0", END)
+
+        if self.run_log is None or (total_lines := self.run_log.line_count) == 0:
+            self.text.configure(state=DISABLED)
+            self.vertical_scrollbar.set(0, 1)
+            return
+
+        visible_lines = self.visible_lines
+        if self.follow:
+            self.first_line = max(total_lines - visible_lines, 0)
+
+        self.text.insert(
+            END, "\n".join(self.run_log.lines(self.first_line, visible_lines))
+        )
+        self.text.configure(state=DISABLED)
+
+        self.vertical_scrollbar.set(
+            self.first_line / total_lines,
+            min((self.first_line + visible_lines) / total_lines, 1),
+        )
+
+    def set_run_log(self, run_log: RunLog | None) -> None:
+        """
+        Set the run log to display.
+
+        :param: run_log
+            The :class:`RunLog` to display, or `None` to clear the viewer.
+
+        """
+
+        self.run_log = run_log
+        self.first_line = 0
+        self.follow = True
+        self.render()
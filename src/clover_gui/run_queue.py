@@ -0,0 +1,691 @@
+#!/usr/bin/python3.10
+########################################################################################
+# run_queue.py - The run-queue module for CLOVER-GUI application.                      #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import enum
+import itertools
+import os
+import time
+import tkinter as tk
+
+from dataclasses import dataclass, field
+from subprocess import Popen
+from threading import Thread
+from typing import Callable
+
+import ttkbootstrap as ttk
+
+from clover import OperatingMode
+from ttkbootstrap.constants import *
+
+from .__utils__ import clover_thread, LOAD_LOCATION_GEOMETRY
+from .run_log import RunLog
+from .run_timings import RunTimings, run_timings_filepath
+from .stdout_parser import CloverStdoutParser, PROGRESS_INCREMENTS, ProgressStatus
+from .worker_pool import CloverWorkerRun
+
+__all__ = (
+    "JobStatus",
+    "physical_core_count",
+    "RunJob",
+    "RunQueueWindow",
+    "RunScheduler",
+)
+
+# CPU info filepath:
+#   The path to the file containing CPU information on Linux systems.
+CPU_INFO_FILEPATH: str = os.path.join(os.path.sep, "proc", "cpuinfo")
+
+# Run-queue poll interval:
+#   The interval, in milliseconds, at which the run queue is checked for finished runs.
+RUN_QUEUE_POLL_INTERVAL: int = 500
+
+# Run-queue columns:
+#   The columns to display in the run-queue table, along with their widths.
+RUN_QUEUE_COLUMNS: dict[str, int] = {
+    "#": 40,
+    "Location": 120,
+    "Mode": 100,
+    "Output": 240,
+    "Status": 100,
+    "Stage": 160,
+    "Progress": 80,
+}
+
+
+def physical_core_count() -> int:
+    """
+    Determine the number of physical CPU cores available.
+
+    On Linux, hyperthreaded siblings are excluded by counting the unique physical-id and
+    core-id pairs. Elsewhere, the logical core count is used.
+
+    :returns:
+        The number of cores.
+
+    """
+
+    try:
+        with open(CPU_INFO_FILEPATH, "r", encoding="utf-8") as cpu_info_file:
+            cpu_info = cpu_info_file.read()
+    except OSError:
+        return os.cpu_count() or 1
+
+    cores: set[tuple[str, str]] = set()
+    physical_id: str = ""
+    for line in cpu_info.splitlines():
+        key, _, value = line.partition(":")
+        if (key := key.strip()) == "physical id":
+            physical_id = value.strip()
+        elif key == "core id":
+            cores.add((physical_id, value.strip()))
+
+    return len(cores) if len(cores) > 0 else (os.cpu_count() or 1)
+
+
+class JobStatus(enum.Enum):
+    """
+    Represents the status of a queued CLOVER run.
+
+    - QUEUED:
+        The run is waiting to be launched.
+
+    - RUNNING:
+        The run is in progress.
+
+    - COMPLETED:
+        The run completed successfully.
+
+    - FAILED:
+        The run exited with an error.
+
+    - CANCELLED:
+        The run was cancelled by the user.
+
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class RunJob:
+    """
+    Represents a CLOVER run within the run queue.
+
+    .. attribute:: clover_args
+        The arguments to pass to CLOVER.
+
+    .. attribute:: job_id
+        A unique identifier for the job.
+
+    .. attribute:: location_name
+        The name of the location being run.
+
+    .. attribute:: operating_mode
+        The operating mode of the run.
+
+    .. attribute:: output_directory
+        The directory into which CLOVER will save the outputs from the run.
+
+    .. attribute:: run_log_filepath
+        The path to the file in which to save the stdout from the run.
+
+    .. attribute:: hash_inputs
+        A callable function which computes the hash of the inputs to the run, called
+        as the run is launched and so reads the inputs as CLOVER does.
+
+    .. attribute:: input_hash
+        The hash of the inputs to the run, once launched, if computed.
+
+    .. attribute:: process
+        The process in which CLOVER is running, if launched.
+
+    .. attribute:: progress
+        The progress of the run, as a percentage.
+
+    .. attribute:: stage
+        A description of the current stage of the run.
+
+    .. attribute:: status
+        The status of the job.
+
+    .. attribute:: timings
+        The time taken by each stage of the run, once launched.
+
+    """
+
+    clover_args: list[str]
+    job_id: int
+    location_name: str
+    operating_mode: OperatingMode
+    output_directory: str
+    run_log_filepath: str
+    hash_inputs: Callable[[], str] | None = field(default=None, repr=False)
+    input_hash: str | None = None
+    process: CloverWorkerRun | Popen | None = None
+    progress: float = 0
+    stage: str = ""
+    status: JobStatus = JobStatus.QUEUED
+    timings: RunTimings | None = None
+    _reading_thread: Thread | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has finished, whether successfully or not."""
+
+        return self.status in (
+            JobStatus.CANCELLED,
+            JobStatus.COMPLETED,
+            JobStatus.FAILED,
+        )
+
+
+class RunScheduler:
+    """
+    Schedules queued CLOVER runs, running a limited number concurrently.
+
+    .. attribute:: job_finished_callback
+        A callable function to call, with the job and its return code, once a job has
+        finished running.
+
+    .. attribute:: jobs
+        The jobs, in the order in which they will be launched.
+
+    .. attribute:: launched_jobs
+        The jobs which have been launched, including any since cancelled, whose process
+        has not yet been found to have finished.
+
+    .. attribute:: max_concurrent_runs
+        The maximum number of runs which can take place at any one time.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrent_runs: int | None = None,
+        job_finished_callback: Callable | None = None,
+    ) -> None:
+        """
+        Instantiate a :class:`RunScheduler` instance.
+
+        :param: max_concurrent_runs
+            The maximum number of concurrent runs. Defaults to the number of physical
+            cores.
+
+        :param: job_finished_callback
+            A callable function to call, with the job and its return code, once a job
+            has finished running.
+
+        """
+
+        self.job_finished_callback = job_finished_callback
+        self.jobs: list[RunJob] = []
+        self.launched_jobs: list[RunJob] = []
+        self.max_concurrent_runs: int = (
+            max_concurrent_runs
+            if max_concurrent_runs is not None
+            else physical_core_count()
+        )
+
+        self._job_ids = itertools.count(1)
+
+    def _launch(self, job: RunJob) -> None:
+        """
+        Launch a job.
+
+        :param: job
+            The job to launch.
+
+        """
+
+        # The inputs are hashed as the run is launched, as CLOVER reads them then.
+        if job.hash_inputs is not None:
+            job.input_hash = job.hash_inputs()
+
+        job.process = clover_thread(job.clover_args)
+        job.status = JobStatus.RUNNING
+        self.launched_jobs.append(job)
+        job.timings = RunTimings()
+        job._reading_thread = Thread(
+            target=self._read_output, args=(job,), daemon=True
+        )
+        job._reading_thread.start()
+
+    def _read_output(self, job: RunJob) -> None:
+        """
+        Read the output of a job, logging it and tracking the job's progress.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+
+        :param: job
+            The job whose output should be read.
+
+        """
+
+        stdout_parser = CloverStdoutParser()
+        run_log = RunLog(job.run_log_filepath)
+
+        while True:
+            if data := os.read(job.process.stdout.fileno(), 1 << 20):
+                lines, events = stdout_parser.feed(data)
+            else:
+                lines, events = stdout_parser.finish()
+
+            run_log.append(lines)
+            job.timings.record(events, time.time())
+            for event in events:
+                job.progress += PROGRESS_INCREMENTS.get(event, 0)
+                job.stage = event.stage.value.replace("_", " ").capitalize() + (
+                    " failed" if event.status == ProgressStatus.FAILED else ""
+                )
+
+            if not data:
+                job.timings.finish()
+                run_log.close()
+                return
+
+    def add(
+        self,
+        clover_args: list[str],
+        location_name: str,
+        operating_mode: OperatingMode,
+        output_directory: str,
+        run_log_filepath: str,
+        hash_inputs: Callable[[], str] | None = None,
+    ) -> RunJob:
+        """
+        Add a run to the back of the queue.
+
+        :param: clover_args
+            The arguments to pass to CLOVER.
+
+        :param: location_name
+            The name of the location being run.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: output_directory
+            The directory into which CLOVER will save the outputs from the run.
+
+        :param: run_log_filepath
+            The path to the file in which to save the stdout from the run.
+
+        :param: hash_inputs
+            A callable function which computes the hash of the inputs to the run, if
+            they should be hashed as the run is launched.
+
+        :returns:
+            The job created.
+
+        """
+
+        self.jobs.append(
+            job := RunJob(
+                clover_args,
+                next(self._job_ids),
+                location_name,
+                operating_mode,
+                output_directory,
+                run_log_filepath,
+                hash_inputs,
+            )
+        )
+        self.poll()
+
+        return job
+
+    def cancel(self, job: RunJob) -> None:
+        """
+        Cancel a job, stopping it if it is running.
+
+        A job which was running is recorded as finished once its process has exited.
+
+        :param: job
+            The job to cancel.
+
+        """
+
+        if job.finished:
+            return
+
+        if job.process is not None:
+            job.process.kill()
+
+        job.status = JobStatus.CANCELLED
+
+    def cancel_all(self) -> None:
+        """Cancel all jobs which have not yet finished."""
+
+        for job in self.jobs:
+            self.cancel(job)
+
+    @property
+    def idle(self) -> bool:
+        """Whether there are no jobs waiting to be launched or to finish."""
+
+        return len(self.launched_jobs) == 0 and not any(
+            job.status == JobStatus.QUEUED for job in self.jobs
+        )
+
+    def move(self, job: RunJob, offset: int) -> None:
+        """
+        Move a queued job forwards or backwards within the queue.
+
+        :param: job
+            The job to move.
+
+        :param: offset
+            The number of positions to move the job by, negative values move the job
+            towards the front of the queue.
+
+        """
+
+        if job.status != JobStatus.QUEUED:
+            return
+
+        index = self.jobs.index(job)
+        self.jobs.remove(job)
+        self.jobs.insert(min(max(index + offset, 0), len(self.jobs)), job)
+
+    def poll(self) -> None:
+        """Update the status of running jobs and launch queued jobs where possible."""
+
+        for job in list(self.launched_jobs):
+            if (return_code := job.process.poll()) is None:
+                continue
+            if job._reading_thread is not None and job._reading_thread.is_alive():
+                continue
+
+            # Cancelled jobs are recorded too, with the return code of their process.
+            self.launched_jobs.remove(job)
+            if job.status == JobStatus.RUNNING:
+                if return_code == 0:
+                    job.progress = 100
+                    job.status = JobStatus.COMPLETED
+                else:
+                    job.status = JobStatus.FAILED
+
+            job.timings.save(
+                run_timings_filepath(job.run_log_filepath),
+                return_code,
+                job.output_directory,
+            )
+
+            if self.job_finished_callback is not None:
+                self.job_finished_callback(job, return_code)
+
+        running_jobs = sum(job.status == JobStatus.RUNNING for job in self.jobs)
+        for job in self.jobs:
+            if running_jobs >= self.max_concurrent_runs:
+                break
+            if job.status == JobStatus.QUEUED:
+                self._launch(job)
+                running_jobs += 1
+
+
+class RunQueueWindow(tk.Toplevel):
+    """
+    Represents the run-queue popup window.
+
+    The run-queue window displays the status and progress of each queued CLOVER run and
+    enables a user to reorder, cancel and view the outputs of runs.
+
+    .. attribute:: scheduler
+        The :class:`RunScheduler` managing the queued runs.
+
+    """
+
+    def __init__(
+        self, job_finished_callback: Callable, open_run_outputs: Callable
+    ) -> None:
+        """
+        Instantiate a :class:`RunQueueWindow` instance.
+
+        :param: job_finished_callback
+            A callable function to call, with the job and its return code, once a job
+            has finished running.
+
+        :param: open_run_outputs
+            Function which opens the outputs of a run in the post-run screen, given the
+            run's output directory.
+
+        """
+
+        super().__init__()
+
+        self.title("CLOVER-GUI Run Queue")
+        self.geometry(LOAD_LOCATION_GEOMETRY)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+        self.open_run_outputs = open_run_outputs
+        self.scheduler = RunScheduler(job_finished_callback=job_finished_callback)
+        self._poll_after_id: str | None = None
+
+        self.columnconfigure(0, weight=1)
+        self.columnconfigure(1, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=10)
+        self.rowconfigure(2, weight=1)
+
+        self.run_queue_label = ttk.Label(
+            self,
+            bootstyle=INFO,
+            text="Run queue",
+            font=("TkDefaultFont", "16", "bold"),
+        )
+        self.run_queue_label.grid(row=0, column=0, sticky="w", padx=20, pady=10)
+
+        # Concurrent runs
+        self.concurrent_runs_frame = ttk.Frame(self)
+        self.concurrent_runs_frame.grid(row=0, column=1, sticky="e", padx=20, pady=10)
+
+        self.concurrent_runs_label = ttk.Label(
+            self.concurrent_runs_frame, text="Concurrent runs"
+        )
+        self.concurrent_runs_label.grid(row=0, column=0, padx=10, sticky="e")
+
+        self.concurrent_runs: ttk.IntVar = ttk.IntVar(
+            self, self.scheduler.max_concurrent_runs
+        )
+        self.concurrent_runs_spinbox = ttk.Spinbox(
+            self.concurrent_runs_frame,
+            bootstyle=INFO,
+            from_=1,
+            to=os.cpu_count() or 1,
+            increment=1,
+            textvariable=self.concurrent_runs,
+            command=self._set_concurrent_runs,
+            width=5,
+        )
+        self.concurrent_runs_spinbox.grid(row=0, column=1, sticky="e")
+        self.concurrent_runs_spinbox.bind("<Return>", self._set_concurrent_runs)
+
+        # Jobs table
+        self.jobs_treeview = ttk.Treeview(
+            self,
+            bootstyle=INFO,
+            columns=list(RUN_QUEUE_COLUMNS),
+            selectmode=BROWSE,
+            show="headings",
+        )
+        for column, width in RUN_QUEUE_COLUMNS.items():
+            self.jobs_treeview.heading(column, text=column, anchor=W)
+            self.jobs_treeview.column(column, width=width, minwidth=width, stretch=True)
+        self.jobs_treeview.grid(
+            row=1, column=0, columnspan=2, sticky="news", padx=20, pady=5
+        )
+
+        # Buttons
+        self.buttons_frame = ttk.Frame(self)
+        self.buttons_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=20)
+
+        for index, (text, command) in enumerate(
+            [
+                ("Move up", lambda: self._move_selected_job(-1)),
+                ("Move down", lambda: self._move_selected_job(1)),
+                ("Cancel", self._cancel_selected_job),
+                ("View outputs", self._view_selected_job_outputs),
+            ]
+        ):
+            self.buttons_frame.columnconfigure(index, weight=1)
+            ttk.Button(
+                self.buttons_frame,
+                bootstyle=f"{INFO}-{OUTLINE}",
+                command=command,
+                text=text,
+            ).grid(row=0, column=index, padx=5, pady=10, sticky="ew")
+
+    def _job_by_iid(self, iid: str) -> RunJob:
+        """
+        Return the job corresponding to a row in the table.
+
+        :param: iid
+            The id of the row within the table.
+
+        """
+
+        return [job for job in self.scheduler.jobs if str(job.job_id) == iid][0]
+
+    def _poll(self) -> None:
+        """Poll the scheduler and refresh the table of jobs until all have finished."""
+
+        self.scheduler.poll()
+        self.refresh()
+
+        if self.scheduler.idle:
+            self._poll_after_id = None
+            return
+
+        self._poll_after_id = self.after(RUN_QUEUE_POLL_INTERVAL, self._poll)
+
+    def _selected_job(self) -> RunJob | None:
+        """Return the job currently selected, if any."""
+
+        if len(selection := self.jobs_treeview.selection()) == 0:
+            return None
+
+        return self._job_by_iid(selection[0])
+
+    def _cancel_selected_job(self) -> None:
+        """Cancel the job currently selected."""
+
+        if (job := self._selected_job()) is not None:
+            self.scheduler.cancel(job)
+            self.refresh()
+
+    def _move_selected_job(self, offset: int) -> None:
+        """
+        Move the job currently selected within the queue.
+
+        :param: offset
+            The number of positions by which to move the job.
+
+        """
+
+        if (job := self._selected_job()) is not None:
+            self.scheduler.move(job, offset)
+            self.refresh()
+
+    def _set_concurrent_runs(self, _=None) -> None:
+        """Set the maximum number of concurrent runs from the spinbox."""
+
+        try:
+            self.scheduler.max_concurrent_runs = max(int(self.concurrent_runs.get()), 1)
+        except (tk.TclError, ValueError):
+            self.concurrent_runs.set(self.scheduler.max_concurrent_runs)
+            return
+
+        self.scheduler.poll()
+        self.refresh()
+
+    def _view_selected_job_outputs(self) -> None:
+        """Open the outputs of the job currently selected in the post-run screen."""
+
+        if (job := self._selected_job()) is None or job.status != JobStatus.COMPLETED:
+            return
+
+        self.open_run_outputs(job.output_directory)
+
+    def add_run(
+        self,
+        clover_args: list[str],
+        location_name: str,
+        operating_mode: OperatingMode,
+        output_directory: str,
+        run_log_filepath: str,
+        hash_inputs: Callable[[], str] | None = None,
+    ) -> RunJob:
+        """
+        Add a run to the queue.
+
+        :param: clover_args
+            The arguments to pass to CLOVER.
+
+        :param: location_name
+            The name of the location being run.
+
+        :param: operating_mode
+            The operating mode of the run.
+
+        :param: output_directory
+            The directory into which CLOVER will save the outputs from the run.
+
+        :param: run_log_filepath
+            The path to the file in which to save the stdout from the run.
+
+        :param: hash_inputs
+            A callable function which computes the hash of the inputs to the run, if
+            they should be hashed as the run is launched.
+
+        :returns:
+            The job created.
+
+        """
+
+        job = self.scheduler.add(
+            clover_args,
+            location_name,
+            operating_mode,
+            output_directory,
+            run_log_filepath,
+            hash_inputs,
+        )
+
+        # Poll the jobs, unless already polling, until they have all finished.
+        if self._poll_after_id is None:
+            self._poll()
+        else:
+            self.refresh()
+
+        return job
+
+    def refresh(self) -> None:
+        """Refresh the table of jobs."""
+
+        for index, job in enumerate(self.scheduler.jobs):
+            values = (
+                job.job_id,
+                job.location_name,
+                job.operating_mode.value.capitalize(),
+                os.path.basename(job.output_directory),
+                job.status.value.capitalize(),
+                job.stage,
+                f"{int(job.progress)}%",
+            )
+            if self.jobs_treeview.exists(iid := str(job.job_id)):
+                self.jobs_treeview.item(iid, values=values)
+            else:
+                self.jobs_treeview.insert("", END, iid=iid, values=values)
+            self.jobs_treeview.move(iid, "", index)
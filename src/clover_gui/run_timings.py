@@ -0,0 +1,235 @@
+#!/usr/bin/python3.10
+########################################################################################
+# run_timings.py - The run-timings module for CLOVER-GUI application.                  #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import datetime
+import json
+import os
+import time
+
+from typing import Any
+
+from .stdout_parser import (
+    PROGRESS_PATTERNS,
+    ProgressEvent,
+    ProgressStage,
+    ProgressStatus,
+)
+
+__all__ = (
+    "RunTimings",
+    "run_timings_filepath",
+)
+
+# Marked stages:
+#   Stages whose end is reported by a `[ DONE ]` or `[ FAILED ]` marker. All other
+#   stages end when the next stage starts.
+MARKED_STAGES: set[ProgressStage] = {
+    stage for _, stage, status in PROGRESS_PATTERNS if status is None
+}
+
+# Run-timings extension:
+#   The extension used for run-timings files, which are saved alongside run logs.
+RUN_TIMINGS_EXTENSION: str = ".timings.json"
+
+
+def run_timings_filepath(run_log_filepath: str) -> str:
+    """
+    Return the path to the timings file for a run.
+
+    :param: run_log_filepath
+        The path to the file in which the stdout from the run is saved.
+
+    :returns:
+        The path to the file in which to save the timings of the run.
+
+    """
+
+    return os.path.splitext(run_log_filepath)[0] + RUN_TIMINGS_EXTENSION
+
+
+class RunTimings:
+    """
+    Records the time at which each stage of a CLOVER run starts and finishes.
+
+    .. attribute:: finished
+        The time at which the run finished, if it has finished.
+
+    .. attribute:: launched
+        The time at which the run was launched.
+
+    """
+
+    def __init__(self, launched: float | None = None) -> None:
+        """
+        Instantiate a :class:`RunTimings` instance.
+
+        :param: launched
+            The time at which the run was launched, defaults to now.
+
+        """
+
+        self.finished: float | None = None
+        self.launched: float = launched if launched is not None else time.time()
+
+        self._stage_ends: dict[ProgressStage, tuple[float, ProgressStatus]] = {}
+        self._stage_starts: dict[ProgressStage, float] = {}
+
+    def _end_open_stages(self, timestamp: float, marked: bool = False) -> None:
+        """
+        End the stages which are in progress.
+
+        :param: timestamp
+            The time at which the stages ended.
+
+        :param: marked
+            Whether to also end stages whose end is reported by a marker.
+
+        """
+
+        for stage in self._stage_starts:
+            if stage in self._stage_ends or (stage in MARKED_STAGES and not marked):
+                continue
+            self._stage_ends[stage] = (timestamp, ProgressStatus.DONE)
+
+    def durations(self, timestamp: float | None = None) -> dict[ProgressStage, float]:
+        """
+        Return the duration of each stage which has started.
+
+        :param: timestamp
+            The current time, used for stages which are still in progress.
+
+        :returns:
+            A mapping between each stage and its duration in seconds.
+
+        """
+
+        timestamp = timestamp if timestamp is not None else time.time()
+        return {
+            stage: (
+                self._stage_ends[stage][0] if stage in self._stage_ends else timestamp
+            )
+            - start
+            for stage, start in self._stage_starts.items()
+        }
+
+    def finish(self, timestamp: float | None = None) -> None:
+        """
+        Record that the run has finished, ending any stages still in progress.
+
+        :param: timestamp
+            The time at which the run finished, defaults to now.
+
+        """
+
+        if self.finished is not None:
+            return
+
+        self.finished = timestamp if timestamp is not None else time.time()
+        self._end_open_stages(self.finished, marked=True)
+
+    def record(self, events: list[ProgressEvent], timestamp: float) -> None:
+        """
+        Record the progress events which occurred at a given time.
+
+        :param: events
+            The progress events.
+
+        :param: timestamp
+            The time at which the events occurred.
+
+        """
+
+        for event in events:
+            if event.status == ProgressStatus.STARTED:
+                self._end_open_stages(timestamp)
+                self._stage_starts.setdefault(event.stage, timestamp)
+                continue
+
+            if event.stage in self._stage_starts:
+                self._end_open_stages(timestamp)
+                self._stage_ends.setdefault(event.stage, (timestamp, event.status))
+
+    def as_dict(
+        self, return_code: int | None, output_directory: str | None
+    ) -> dict[str, Any]:
+        """
+        Return the timings as a `dict`, finishing the run if not already finished.
+
+        :param: return_code
+            The return code of the run.
+
+        :param: output_directory
+            The directory into which CLOVER saved the outputs from the run, if known.
+
+        :returns:
+            The timings, with the time at which each stage started and finished given
+            in seconds since the run was launched.
+
+        """
+
+        self.finish()
+
+        return {
+            "launched": datetime.datetime.fromtimestamp(self.launched).isoformat(),
+            "finished": datetime.datetime.fromtimestamp(self.finished).isoformat(),
+            "output_directory": output_directory,
+            "return_code": return_code,
+            "total_duration": self.finished - self.launched,
+            "stages": {
+                stage.value: {
+                    "started": self._stage_starts[stage] - self.launched,
+                    "finished": self._stage_ends[stage][0] - self.launched,
+                    "duration": duration,
+                    "status": self._stage_ends[stage][1].value,
+                }
+                for stage, duration in self.durations(self.finished).items()
+            },
+        }
+
+    def save(
+        self, filepath: str, return_code: int | None, output_directory: str | None
+    ) -> None:
+        """
+        Save the timings to a JSON file.
+
+        :param: filepath
+            The path to the file to save.
+
+        :param: return_code
+            The return code of the run.
+
+        :param: output_directory
+            The directory into which CLOVER saved the outputs from the run, if known.
+
+        """
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as timings_file:
+            json.dump(
+                self.as_dict(return_code, output_directory), timings_file, indent=4
+            )
+
+    def summary(self, timestamp: float | None = None) -> str:
+        """
+        Return a summary of the stage durations for display.
+
+        :param: timestamp
+            The current time, used for stages which are still in progress.
+
+        :returns:
+            The duration of each stage, in the order in which the stages started.
+
+        """
+
+        return "  ·  ".join(
+            f"{stage.value.replace('_', ' ').capitalize()} {duration:.1f} s"
+            for stage, duration in self.durations(timestamp).items()
+        )
@@ -10,17 +10,17 @@
 ########################################################################################
 
 import os
-import re
+import time
 import tkinter as tk
 
 from io import TextIOWrapper
+from queue import Empty, Queue
 from subprocess import Popen
-from threading import Event, Thread
-from typing import Callable, Pattern
+from threading import Thread
+from typing import Callable
 
 import ttkbootstrap as ttk
 
-from clover.scripts.clover import clover_main
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import *
 
@@ -30,85 +30,36 @@ from .__utils__ import (
     IMAGES_DIRECTORY,
     MAIN_TEXT_FONTSIZE,
 )
-
-__all__ = ("RunScreen",)
-
-# Beginning CLOVER simulation runs regex:
-#   Regex used for determining whether CLOVER simulation runs are finished.
-BEGINNING_CLOVER_RUNS_REGEX: Pattern[str] = re.compile(
-    r"Beginning CLOVER (simulation|optimisation) runs \.*\s*\[\s*(?P<donefail>DONE|FAILED)\s*\]"
-)
-
-# CLOVER Optimisation regex:
-#   Regex used for determining whether CLOVER is running an optimisation.
-CLOVER_OPTIMISATION_REGEX: Pattern[str] = re.compile(
-    r"Beginning CLOVER optimisation runs"
-)
-
-# Done-fail:
-#   Match name for done-fail group.
-DONE_FAIL: str = "donefail"
-
-# Fail:
-#   Keyword used for matching failed steps.
-FAILED: str = "FAILED"
-
-# Inputs file parsing regex:
-#   Regx used for determining whether the input files were parsed successfully or not.
-INPUTS_FILE_PARSING_REGEX: Pattern[str] = re.compile(
-    r"Parsing input files \.*\s*\[\s*(?P<donefail>DONE|FAILED)\s*\]"
-)
-
-# Location verification regex:
-#   Regex used for determining whether the location verification was successful or not.
-LOCATION_VERIFICATION_REGEX: Pattern[str] = re.compile(
-    r"Verifying location information \.*\s*\[\s*(?P<donefail>DONE|FAILED)\s*\]"
-)
-
-# Optimisation regex:
-#   Regex used for determining whether CLOVER is running an optimisation.
-OPTIMISATION_REGEX: Pattern[str] = re.compile(r"optimisations\:")
-
-# Plots regex:
-#   Regex used for determining whether the plots are being generated.
-PLOTS_REGEX: Pattern[str] = re.compile(r"plots\:")
-
-# Profile generation regex:
-#   Regex used for determining whether the profile generation was successful or not.
-PROFILE_GENERATION_REGEX: Pattern[str] = re.compile(
-    r"Generating necessary profiles \.*\s*\[\s*(?P<donefail>DONE|FAILED)\s*\]"
+from .run_log import RunLog, RunLogViewer
+from .run_timings import RunTimings, run_timings_filepath
+from .stdout_parser import (
+    CloverStdoutParser,
+    PROGRESS_INCREMENTS,
+    ProgressEvent,
+    ProgressStage,
+    ProgressStatus,
 )
+from .worker_pool import CloverWorkerRun
 
-# Renewables ninja error regex:
-#   Regex used for determining whether a renewables.ninja error has occurred.
-RENEWABLES_NINJA_ERROR_REGEX: Pattern[str] = re.compile(r"RenewablesNinjaError\(")
-
-# Saving ouptut files regex:
-#   Regec used for determinng whether CLOVER has begun saving ouptut files.
-SAVING_OUTPUT_FILES_REGEX: Pattern[str] = re.compile(r"saving output files:")
-
-# Simulation regex:
-#   Regex used for determining whether CLOVER is running a simulation.
-SIMULATION_REGEX: Pattern[str] = re.compile(r"Running a simulation with\:")
-
-
-class StoppableThread(Thread):
-    """
-    Thread class with a stop() method.
-
-    The thread itself has to check regularly for the stopped() condition.
+__all__ = ("RunScreen",)
 
-    """
+# Run-timings refresh interval:
+#   The interval, in milliseconds, at which the duration of the stage in progress is
+#   updated on the run screen.
+RUN_TIMINGS_REFRESH_INTERVAL: int = 1000
 
-    def __init__(self, *args, **kwargs):
-        super(StoppableThread, self).__init__(*args, **kwargs)
-        self._stop_event = Event()
+# Stdout refresh rate:
+#   The maximum rate, in Hz, at which new stdout lines are drawn on the run screen.
+STDOUT_REFRESH_RATE: int = 25
 
-    def stop(self):
-        self._stop_event.set()
+# Stdout idle interval:
+#   The longest interval, in milliseconds, to which checks for new stdout back off
+#   whilst a run produces no output.
+STDOUT_IDLE_INTERVAL: int = 500
 
-    def stopped(self):
-        return self._stop_event.is_set()
+# Stdout refresh interval:
+#   The interval, in milliseconds, between successive redraws of the stdout.
+STDOUT_REFRESH_INTERVAL: int = 1000 // STDOUT_REFRESH_RATE
 
 
 class RunScreen(BaseScreen, show_navigation=True):
@@ -163,7 +114,8 @@ class RunScreen(BaseScreen, show_navigation=True):
         self.image_label = ttk.Label(self, image=self.running_image)
         self.image_label.grid(row=0, column=0, columnspan=5, sticky="news")
 
-        self.clover_thread: Popen | None = None
+        self.clover_thread: CloverWorkerRun | Popen | None = None
+        self.run_finished_callback: Callable | None = None
 
         self.courier_style.configure("Courier.Label", font=("Courier New", 16))
         self.courier_style.configure(
@@ -212,26 +164,17 @@ class RunScreen(BaseScreen, show_navigation=True):
             row=1, column=4, rowspan=2, padx=20, pady=5, ipadx=80, ipady=30, sticky="e"
         )
 
-        self.sub_process_frame = ScrolledFrame(self)
-        self.sub_process_frame.grid(
-            row=3, column=0, columnspan=5, sticky="news", padx=10, pady=5
-        )
-
-        self.monospace_style.configure("Monospace.Label", font=("TkFixedFont", 11))
-        self.monospace_style.configure(
-            "MonospaceDark.TLabel",
+        # Display the stdout in a viewer which only renders the visible lines so that
+        # the cost of drawing the output doesn't grow with the length of the run.
+        self.run_log: RunLog | None = None
+        self.sub_process_viewer = RunLogViewer(
+            self,
             font=("TkFixedFont", 16),
             foreground=self.courier_style.colors.light,  # Use light text
             background=self.courier_style.colors.dark,  # Use dark background
         )
-        self.sub_process_label = ttk.Label(
-            self.sub_process_frame,
-            style="MonospaceDark.TLabel",
-            text="",
-            width=300,
-        )
-        self.sub_process_label.grid(
-            row=0, column=0, sticky="news", padx=10, pady=5, ipadx=300
+        self.sub_process_viewer.grid(
+            row=3, column=0, columnspan=5, sticky="news", padx=10, pady=5
         )
 
         # Add navigation buttons
@@ -308,167 +251,278 @@ class RunScreen(BaseScreen, show_navigation=True):
             row=0, column=4, sticky="e", padx=20, pady=5, ipadx=80, ipady=20
         )
 
-        # Create a buffer for the stdout
-        self.stdout_data: str = " " * 180
-
-    def _update_progress_bar_and_text(self, new_data: str) -> None:
+        # Display how long each stage of the run has taken.
+        self.output_directory: str | None = None
+        self.run_log_filepath: str | None = None
+        self.run_timings: RunTimings | None = None
+        self.run_timings_label = ttk.Label(
+            self.bottom_bar_frame, bootstyle=SECONDARY, text="", wraplength=600
+        )
+        self.run_timings_label.grid(row=0, column=3, sticky="w", padx=20, pady=5)
+
+        # Create a thread-safe queue for passing stdout, and the time at which it was
+        # read, from the reading thread.
+        self.stdout_queue: Queue[
+            tuple[list[str], list[ProgressEvent], float] | None
+        ] = Queue()
+        self._drain_stdout_after_id: str | None = None
+        self._drain_stdout_interval: int = STDOUT_REFRESH_INTERVAL
+        self._refresh_run_timings_after_id: str | None = None
+
+    def _update_progress_bar_and_text(self, events: list[ProgressEvent]) -> None:
         """
-        Update the progress bar and explainer text based on the stdout data.
+        Update the progress bar and explainer text based on the stdout progress events.
 
-        :param: new_data
-            The stdout output text.
+        :param: events
+            The progress events parsed from the stdout.
 
         """
 
-        if "Copyright" in new_data:
-            self.message_text_label.configure(text="Verifying location")
-            self.clover_progress_bar.configure(bootstyle=f"{SUCCESS}-striped")
+        for event in events:
+            self.push_progress_bar(PROGRESS_INCREMENTS.get(event, 0))
 
-        # Move the progress bar if location verification completed.
-        if (
-            location_verification_match := re.search(
-                LOCATION_VERIFICATION_REGEX, new_data
-            )
-        ) is not None:
-            if location_verification_match.group(DONE_FAIL) == FAILED:
-                self.message_text_label.configure(
-                    text="Location verification failed. Please check that all input\n"
-                    "files are present. See below for more information",
-                    style=DANGER,
-                )
-            else:
-                self.push_progress_bar(20)
-                self.message_text_label.configure(
-                    text="Parsing input files",
-                )
-
-        # Move the progress bar if input files were successfully parsed.
-        if (
-            input_file_parsing_match := re.search(INPUTS_FILE_PARSING_REGEX, new_data)
-        ) is not None:
-            if input_file_parsing_match.group(DONE_FAIL) == FAILED:
-                self.message_text_label.configure(
-                    text="Input file parsing failed. Please check that all input \n"
-                    "files are of the correct format. See below for more information",
-                    style=DANGER,
-                )
-            else:
-                self.push_progress_bar(20)
-                self.message_text_label.configure(
-                    text="Generating load profiles and fetching solar data",
-                )
-
-        # Move the progress bar if profiles were generated and fetched correctly.
-        if (
-            profile_generation_match := re.search(PROFILE_GENERATION_REGEX, new_data)
-        ) is not None:
-            if profile_generation_match.group(DONE_FAIL) == FAILED:
-                self.message_text_label.configure(
-                    text="Failed to generate load profiles. See below for more "
-                    "information",
-                    style=DANGER,
-                )
-            else:
-                self.push_progress_bar(20)
-                self.message_text_label.configure(text="Running CLOVER")
-
-        # If renewables ninja failed, display an error.
-        if re.search(RENEWABLES_NINJA_ERROR_REGEX, new_data) is not None:
-            self.message_text_label.configure(
-                text="Error fetching data from renewables.ninja. Please check your "
-                "API \nkey under 'edit > preferences'.",
-            )
+            match (event.stage, event.status):
+                case (ProgressStage.LAUNCH, ProgressStatus.STARTED):
+                    self.message_text_label.configure(text="Verifying location")
+                    self.clover_progress_bar.configure(bootstyle=f"{SUCCESS}-striped")
 
-        # Update the message if a simulation is being run.
-        if re.search(SIMULATION_REGEX, new_data) is not None:
-            self.message_text_label.configure(
-                text="Running a CLOVER simulation",
-            )
+                # Location verification completed.
+                case (ProgressStage.LOCATION_VERIFICATION, ProgressStatus.DONE):
+                    self.message_text_label.configure(
+                        text="Parsing input files",
+                    )
+                case (ProgressStage.LOCATION_VERIFICATION, ProgressStatus.FAILED):
+                    self.message_text_label.configure(
+                        text="Location verification failed. Please check that all "
+                        "input\nfiles are present. See below for more information",
+                        style=DANGER,
+                    )
 
-        # Update the message if an optimisation is being run.
-        if re.search(OPTIMISATION_REGEX, new_data) is not None:
-            self.message_text_label.configure(
-                text="Running a CLOVER optimisation",
-            )
+                # Input files were successfully parsed.
+                case (ProgressStage.INPUT_FILE_PARSING, ProgressStatus.DONE):
+                    self.message_text_label.configure(
+                        text="Generating load profiles and fetching solar data",
+                    )
+                case (ProgressStage.INPUT_FILE_PARSING, ProgressStatus.FAILED):
+                    self.message_text_label.configure(
+                        text="Input file parsing failed. Please check that all input "
+                        "\nfiles are of the correct format. See below for more "
+                        "information",
+                        style=DANGER,
+                    )
 
-        # If CLOVER is generating plots, update the output
-        if re.search(PLOTS_REGEX, new_data) is not None:
-            self.message_text_label.configure(text="Generating plots")
-
-        if re.search(SAVING_OUTPUT_FILES_REGEX, new_data) is not None:
-            self.push_progress_bar(20)
-            self.message_text_label.configure(text="Saving output files")
-
-        if (
-            clover_runs_match := re.search(BEGINNING_CLOVER_RUNS_REGEX, new_data)
-        ) is not None:
-            if clover_runs_match.group(DONE_FAIL) == FAILED:
-                self.message_text_label.configure(
-                    text="CLOVER runs failed. See below for more information.",
-                )
-            else:
-                self.push_progress_bar(20)
-                self.message_text_label.configure(
-                    text="CLOVER runs completed",
-                )
-
-    def read_output(self, pipe: TextIOWrapper):
+                # Profiles were generated and fetched correctly.
+                case (ProgressStage.PROFILE_GENERATION, ProgressStatus.DONE):
+                    self.message_text_label.configure(text="Running CLOVER")
+                case (ProgressStage.PROFILE_GENERATION, ProgressStatus.FAILED):
+                    self.message_text_label.configure(
+                        text="Failed to generate load profiles. See below for more "
+                        "information",
+                        style=DANGER,
+                    )
+
+                # If renewables ninja failed, display an error.
+                case (ProgressStage.RENEWABLES_NINJA, ProgressStatus.FAILED):
+                    self.message_text_label.configure(
+                        text="Error fetching data from renewables.ninja. Please check "
+                        "your API \nkey under 'edit > preferences'.",
+                    )
+
+                # Update the message if a simulation is being run.
+                case (ProgressStage.SIMULATION, ProgressStatus.STARTED):
+                    self.message_text_label.configure(
+                        text="Running a CLOVER simulation",
+                    )
+
+                # Update the message if an optimisation is being run.
+                case (ProgressStage.OPTIMISATION, ProgressStatus.STARTED):
+                    self.message_text_label.configure(
+                        text="Running a CLOVER optimisation",
+                    )
+
+                # If CLOVER is generating plots, update the output
+                case (ProgressStage.PLOTTING, ProgressStatus.STARTED):
+                    self.message_text_label.configure(text="Generating plots")
+
+                    # The outputs can be viewed as each plot is saved.
+                    self.post_run_button.configure(state="enabled")
+
+                case (ProgressStage.SAVING, ProgressStatus.STARTED):
+                    self.message_text_label.configure(text="Saving output files")
+
+                case (ProgressStage.CLOVER_RUNS, ProgressStatus.DONE):
+                    self.message_text_label.configure(
+                        text="CLOVER runs completed",
+                    )
+                case (ProgressStage.CLOVER_RUNS, ProgressStatus.FAILED):
+                    self.message_text_label.configure(
+                        text="CLOVER runs failed. See below for more information.",
+                    )
+
+    def _drain_stdout_queue(self) -> None:
         """
-        Read subprocess' output and store it in `self.stdout_data`.
+        Drain the stdout queue and display any new lines.
+
+        Called on the main thread at most :data:`STDOUT_REFRESH_RATE` times a second.
+        All of the lines which have arrived since the last call are appended to the
+        output in a single batch. Whilst no output arrives, the interval between calls
+        doubles, up to :data:`STDOUT_IDLE_INTERVAL`, so that an idle run costs almost
+        nothing, and is reset once output arrives.
 
         """
+
+        self._drain_stdout_after_id = None
+
+        new_lines: list[str] = []
+        new_events: list[ProgressEvent] = []
+        finished: bool = False
+
         while True:
-            data = os.read(pipe.fileno(), 1 << 20)
-            # Windows uses: "\r\n" instead of "\n" for new lines.
-            data = data.replace(b"\r\n", b"\n")
-            if data:
-                self.stdout_data += (
-                    new_data := "\n".join(
-                        [
-                            entry
-                            for entry in (data.decode().split("\n"))
-                            if (
-                                "hourly computation" not in entry
-                                and "FutureWarning" not in entry
-                                and "return float(" not in entry
-                                and entry != "\n"
-                                and entry != ""
-                            )
-                        ]
-                    )
-                )
+            try:
+                entry = self.stdout_queue.get_nowait()
+            except Empty:
+                break
+            if entry is None:
+                finished = True
+                break
+            new_lines.extend(entry[0])
+            new_events.extend(entry[1])
+            self.run_timings.record(entry[1], entry[2])
+
+        if len(new_events) > 0:
+            self._update_progress_bar_and_text(new_events)
+            self.run_timings_label.configure(text=self.run_timings.summary(time.time()))
+
+        if len(new_lines) > 0:
+            self.run_log.append(new_lines)
+
+            # Redraw the visible lines, scrolling to the bottom if following the output.
+            self.sub_process_viewer.render()
+
+        if finished:
+            self._stop_refreshing_run_timings()
+            self.run_timings.finish()
+            self.run_log.close()
+            self.after(1000, self.stop)
+            return
+
+        self._drain_stdout_interval = (
+            STDOUT_REFRESH_INTERVAL
+            if len(new_lines) > 0 or len(new_events) > 0
+            else min(2 * self._drain_stdout_interval, STDOUT_IDLE_INTERVAL)
+        )
+        self._drain_stdout_after_id = self.after(
+            self._drain_stdout_interval, self._drain_stdout_queue
+        )
+
+    def _refresh_run_timings(self) -> None:
+        """Update the duration of the stage in progress, once a second."""
+
+        self.run_timings_label.configure(text=self.run_timings.summary(time.time()))
+        self._refresh_run_timings_after_id = self.after(
+            RUN_TIMINGS_REFRESH_INTERVAL, self._refresh_run_timings
+        )
+
+    def _stop_refreshing_run_timings(self) -> None:
+        """Stop updating the duration of the stage in progress."""
+
+        if self._refresh_run_timings_after_id is not None:
+            self.after_cancel(self._refresh_run_timings_after_id)
+            self._refresh_run_timings_after_id = None
+
+    def clear_stdout(self) -> None:
+        """Clear the stdout displayed and any lines still waiting to be displayed."""
+
+        if self._drain_stdout_after_id is not None:
+            self.after_cancel(self._drain_stdout_after_id)
+            self._drain_stdout_after_id = None
+        self._stop_refreshing_run_timings()
 
-                self._update_progress_bar_and_text(new_data)
+        self.stdout_queue = Queue()
 
-                # Scroll to the bottom
-                self.sub_process_frame.yview_moveto(1)
+        if self.run_log is not None:
+            self.run_log.close()
+            self.run_log = None
+        self.sub_process_viewer.set_run_log(None)
+        self.run_timings_label.configure(text="")
+
+    def read_output(self, pipe: TextIOWrapper, stdout_queue: Queue) -> None:
+        """
+        Read subprocess' output, parse it and pass the results to the stdout queue.
+
+        This is run in a background thread and so must not make any calls to tkinter.
+        The main thread drains the queue on its own schedule.
+
+        :param: pipe
+            The pipe from which to read the output.
+
+        :param: stdout_queue
+            The queue to which to pass the lines and progress events parsed.
+
+        """
+
+        stdout_parser = CloverStdoutParser()
+
+        while True:
+            if data := os.read(pipe.fileno(), 1 << 20):
+                stdout_queue.put((*stdout_parser.feed(data), time.time()))
             else:  # clean up
-                self.after(1000, self.stop)  # stop in 5 seconds
+                stdout_queue.put((*stdout_parser.finish(), time.time()))
+                stdout_queue.put(None)
                 return None
 
-            # Reduce the length of the data to contain 20 lines only.
-            # self.stdout_data = "\n".join(self.stdout_data.split("\n")[-20:])
-
-    def run_with_clover(self, clover_thread: Popen) -> None:
+    def run_with_clover(
+        self,
+        clover_thread: CloverWorkerRun | Popen,
+        output_directory: str | None,
+        run_log_filepath: str,
+        run_finished_callback: Callable | None = None,
+    ) -> None:
         """
         Create a new thread that will read stdout and write the data to the buffer.
 
         :param: clover_thread
             A thread in which CLOVER runs.
 
+        :param: output_directory
+            The directory into which CLOVER will save the outputs from the run.
+
+        :param: run_log_filepath
+            The path to the file in which to save the stdout from the run.
+
+        :param: run_finished_callback
+            A callable function to call, with the return code and timings of the run,
+            once the run has finished.
+
         """
 
         self.clover_thread = clover_thread
+        self.output_directory = output_directory
+        self.run_log_filepath = run_log_filepath
+        self.run_finished_callback = run_finished_callback
+        self.run_timings = RunTimings()
+
+        # Create a log for the run and display it.
+        self.run_log = RunLog(run_log_filepath)
+        self.sub_process_viewer.set_run_log(self.run_log)
 
         # Create a thread with the target to read the output.
         self.reading_thread = Thread(
-            target=self.read_output, args=(clover_thread.stdout,)
+            target=self.read_output,
+            args=(clover_thread.stdout, self.stdout_queue),
+            daemon=True,
         )
         self.reading_thread.start()
 
-        # A tkinter loop that will show `self.stdout_data` on the screen
-        self.screen_thread = StoppableThread(target=self.show_stdout)
-        self.screen_thread.start()
+        # The output is drawn as it arrives, whilst the duration of the stage in
+        # progress is updated once a second.
+        if self._drain_stdout_after_id is not None:
+            self.after_cancel(self._drain_stdout_after_id)
+        self._drain_stdout_interval = STDOUT_REFRESH_INTERVAL
+        self._drain_stdout_after_id = self.after(
+            STDOUT_REFRESH_INTERVAL, self._drain_stdout_queue
+        )
+        self._refresh_run_timings()
 
     def push_progress_bar(self, value: float) -> None:
         """
@@ -481,21 +535,25 @@ class RunScreen(BaseScreen, show_navigation=True):
 
         self.clover_progress_bar["value"] += value
 
-    def show_stdout(self):
-        """Read `self.stdout_data` and put the data in the GUI."""
-        self.sub_process_label.config(
-            text=self.stdout_data.strip("\n"),
-            # bootstyle=f"dark-inverse",
-        )
-        self.after(1, self.show_stdout)
-
     def stop(self, stopping=[]):
         """Stop subprocess and quit GUI."""
         clover_return_code = self.clover_thread.poll()
 
         self.clover_thread.kill()  # tell the subprocess to exit
-        self.screen_thread.stop()
-        self.sub_process_frame.enable_scrolling()
+        self._stop_refreshing_run_timings()
+
+        # Save the time taken by each stage of the run.
+        self.run_timings.save(
+            run_timings_filepath(self.run_log_filepath),
+            clover_return_code,
+            self.output_directory,
+        )
+        self.run_timings_label.configure(text=self.run_timings.summary())
+
+        # Report the run as finished, only once, once its return code is known.
+        if clover_return_code is not None and self.run_finished_callback is not None:
+            self.run_finished_callback(clover_return_code, self.run_timings)
+            self.run_finished_callback = None
 
         # Enable the post-run button if the run completed successfully.
         if clover_return_code == 0:
@@ -0,0 +1,362 @@
+#!/usr/bin/python3.10
+########################################################################################
+# stdout_parser.py - The stdout-parsing module for CLOVER-GUI application.             #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import codecs
+import enum
+import re
+
+from dataclasses import dataclass
+from typing import Pattern
+
+__all__ = (
+    "CloverStdoutParser",
+    "PROGRESS_INCREMENTS",
+    "PROGRESS_PATTERNS",
+    "ProgressEvent",
+    "ProgressStage",
+    "ProgressStatus",
+)
+
+# Display filters:
+#   Lines containing any of these are not displayed to the user.
+DISPLAY_FILTERS: tuple[str, ...] = (
+    "hourly computation",
+    "FutureWarning",
+    "return float(",
+)
+
+# Status:
+#   Suffix used for naming the groups which capture a `[ DONE ]` or `[ FAILED ]` marker.
+_STATUS: str = "_status"
+
+
+class ProgressStage(enum.Enum):
+    """
+    Represents a stage of a CLOVER run which is reported in the stdout.
+
+    - LAUNCH:
+        CLOVER has started and printed its header.
+
+    - LOCATION_VERIFICATION:
+        CLOVER is verifying the location information.
+
+    - INPUT_FILE_PARSING:
+        CLOVER is parsing the input files.
+
+    - PROFILE_GENERATION:
+        CLOVER is generating load profiles and fetching solar data.
+
+    - RENEWABLES_NINJA:
+        CLOVER is communicating with renewables.ninja.
+
+    - SIMULATION:
+        CLOVER is running a simulation.
+
+    - OPTIMISATION:
+        CLOVER is running an optimisation.
+
+    - CLOVER_RUNS:
+        CLOVER is carrying out its simulation or optimisation runs.
+
+    - PLOTTING:
+        CLOVER is generating plots.
+
+    - SAVING:
+        CLOVER is saving its output files.
+
+    """
+
+    LAUNCH = "launch"
+    LOCATION_VERIFICATION = "location_verification"
+    INPUT_FILE_PARSING = "input_file_parsing"
+    PROFILE_GENERATION = "profile_generation"
+    RENEWABLES_NINJA = "renewables_ninja"
+    SIMULATION = "simulation"
+    OPTIMISATION = "optimisation"
+    CLOVER_RUNS = "clover_runs"
+    PLOTTING = "plotting"
+    SAVING = "saving"
+
+
+class ProgressStatus(enum.Enum):
+    """
+    Represents the status of a :class:`ProgressStage`.
+
+    - STARTED:
+        The stage has begun.
+
+    - DONE:
+        The stage completed successfully.
+
+    - FAILED:
+        The stage failed.
+
+    """
+
+    STARTED = "started"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    Represents a change in the progress of a CLOVER run.
+
+    .. attribute:: stage
+        The stage of the run which changed.
+
+    .. attribute:: status
+        The new status of the stage.
+
+    """
+
+    stage: ProgressStage
+    status: ProgressStatus
+
+
+# Progress increments:
+#   The percentage by which a run's progress is advanced when each event occurs.
+PROGRESS_INCREMENTS: dict[ProgressEvent, float] = {
+    ProgressEvent(ProgressStage.LOCATION_VERIFICATION, ProgressStatus.DONE): 20,
+    ProgressEvent(ProgressStage.INPUT_FILE_PARSING, ProgressStatus.DONE): 20,
+    ProgressEvent(ProgressStage.PROFILE_GENERATION, ProgressStatus.DONE): 20,
+    ProgressEvent(ProgressStage.SAVING, ProgressStatus.STARTED): 20,
+    ProgressEvent(ProgressStage.CLOVER_RUNS, ProgressStatus.DONE): 20,
+}
+
+# Progress patterns:
+#   The table of patterns used to classify lines of stdout. Each entry contains the
+#   regex, the stage that it corresponds to and the status it indicates. Where the
+#   status is `None`, it is read from the `[ DONE ]` or `[ FAILED ]` marker captured
+#   by the regex. Entries which capture a marker must come before the corresponding
+#   entry which matches the start of the same line.
+PROGRESS_PATTERNS: list[tuple[str, ProgressStage, ProgressStatus | None]] = [
+    (r"Copyright", ProgressStage.LAUNCH, ProgressStatus.STARTED),
+    (
+        r"Verifying location information \.*\s*\[\s*({status})\s*\]",
+        ProgressStage.LOCATION_VERIFICATION,
+        None,
+    ),
+    (
+        r"Verifying location information",
+        ProgressStage.LOCATION_VERIFICATION,
+        ProgressStatus.STARTED,
+    ),
+    (
+        r"Parsing input files \.*\s*\[\s*({status})\s*\]",
+        ProgressStage.INPUT_FILE_PARSING,
+        None,
+    ),
+    (
+        r"Parsing input files",
+        ProgressStage.INPUT_FILE_PARSING,
+        ProgressStatus.STARTED,
+    ),
+    (
+        r"Generating necessary profiles \.*\s*\[\s*({status})\s*\]",
+        ProgressStage.PROFILE_GENERATION,
+        None,
+    ),
+    (
+        r"Generating necessary profiles",
+        ProgressStage.PROFILE_GENERATION,
+        ProgressStatus.STARTED,
+    ),
+    (
+        r"RenewablesNinjaError\(",
+        ProgressStage.RENEWABLES_NINJA,
+        ProgressStatus.FAILED,
+    ),
+    (
+        r"Beginning CLOVER (?:simulation|optimisation) runs \.*\s*\[\s*({status})\s*\]",
+        ProgressStage.CLOVER_RUNS,
+        None,
+    ),
+    (
+        r"Beginning CLOVER (?:simulation|optimisation) runs",
+        ProgressStage.CLOVER_RUNS,
+        ProgressStatus.STARTED,
+    ),
+    (r"Running a simulation with\:", ProgressStage.SIMULATION, ProgressStatus.STARTED),
+    (r"optimisations\:", ProgressStage.OPTIMISATION, ProgressStatus.STARTED),
+    (r"plots\:", ProgressStage.PLOTTING, ProgressStatus.STARTED),
+    (r"saving output files\:", ProgressStage.SAVING, ProgressStatus.STARTED),
+]
+
+# Progress regex:
+#   A single regex, combining all of the progress patterns, which is used to classify
+#   each line of stdout in one pass.
+PROGRESS_REGEX: Pattern[str] = re.compile(
+    "|".join(
+        f"(?P<p{index}>"
+        + pattern.format(
+            status=f"?P<p{index}{_STATUS}>"
+            + "|".join(
+                status.name for status in (ProgressStatus.DONE, ProgressStatus.FAILED)
+            )
+        )
+        + ")"
+        for index, (pattern, _, _) in enumerate(PROGRESS_PATTERNS)
+    )
+)
+
+
+class CloverStdoutParser:
+    """
+    Incrementally parses the stdout of a CLOVER run.
+
+    Arbitrary chunks of bytes are fed into the parser. Partial lines are buffered until
+    they are completed so that markers which are split across reads are still detected.
+    Each line is classified once against :data:`PROGRESS_REGEX` and progress events are
+    emitted the first time that each stage reaches each status.
+
+    """
+
+    def __init__(self) -> None:
+        """Instantiate a :class:`CloverStdoutParser` instance."""
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._emitted: set[ProgressEvent] = set()
+        self._pending: str = ""
+
+    def _classify(self, segment: str) -> list[ProgressEvent]:
+        """
+        Classify a segment of a line of stdout.
+
+        :param: segment
+            The text to classify.
+
+        :returns:
+            The new progress events which the segment indicates.
+
+        """
+
+        events: list[ProgressEvent] = []
+
+        for match in PROGRESS_REGEX.finditer(segment):
+            _, stage, status = PROGRESS_PATTERNS[int(match.lastgroup[1:])]
+
+            # Stages which report a marker are implicitly started.
+            if status is None:
+                status = ProgressStatus[match.group(f"{match.lastgroup}{_STATUS}")]
+                events.extend(self._emit(ProgressEvent(stage, ProgressStatus.STARTED)))
+
+            events.extend(self._emit(ProgressEvent(stage, status)))
+
+        return events
+
+    def _emit(self, event: ProgressEvent) -> list[ProgressEvent]:
+        """
+        Emit an event if it has not already been emitted.
+
+        :param: event
+            The event to emit.
+
+        :returns:
+            A `list` containing the event if it is new, or an empty `list` otherwise.
+
+        """
+
+        if event in self._emitted:
+            return []
+
+        self._emitted.add(event)
+        return [event]
+
+    def _process_line(self, line: str) -> tuple[str | None, list[ProgressEvent]]:
+        """
+        Process a complete line of stdout.
+
+        Carriage returns are used, e.g., by progress bars, to overwrite the current
+        line. Every segment of the line is classified, but only the final one, i.e.,
+        what would remain visible in a terminal, is displayed.
+
+        :param: line
+            The line to process.
+
+        :returns:
+            A `tuple` containing:
+            - the text to display, or `None` if the line should not be displayed;
+            - the progress events which the line indicates.
+
+        """
+
+        events: list[ProgressEvent] = []
+        segments = [segment for segment in line.split("\r") if segment != ""]
+        for segment in segments:
+            events.extend(self._classify(segment))
+
+        if len(segments) == 0 or any(
+            entry in (display_line := segments[-1]) for entry in DISPLAY_FILTERS
+        ):
+            return None, events
+
+        return display_line, events
+
+    def feed(self, data: bytes) -> tuple[list[str], list[ProgressEvent]]:
+        """
+        Feed a chunk of stdout into the parser.
+
+        :param: data
+            The bytes read from the stdout.
+
+        :returns:
+            A `tuple` containing:
+            - the lines which were completed and should be displayed;
+            - the progress events which have occurred.
+
+        """
+
+        # Windows uses: "\r\n" instead of "\n" for new lines.
+        *complete_lines, self._pending = (
+            (self._pending + self._decoder.decode(data)).replace("\r\n", "\n").split("\n")
+        )
+
+        lines: list[str] = []
+        events: list[ProgressEvent] = []
+
+        for line in complete_lines:
+            display_line, line_events = self._process_line(line)
+            if display_line is not None:
+                lines.append(display_line)
+            events.extend(line_events)
+
+        # Classify, then discard, any segments of the partial line which have been
+        # overwritten. A trailing carriage return is kept as it may be the first half of
+        # a Windows line ending.
+        if "\r" in self._pending[:-1]:
+            *overwritten_segments, final_segment = self._pending[:-1].split("\r")
+            for segment in overwritten_segments:
+                events.extend(self._classify(segment))
+            self._pending = final_segment + self._pending[-1]
+
+        # Classify the partial line so that stages are reported as soon as they start.
+        events.extend(self._classify(self._pending))
+
+        return lines, events
+
+    def finish(self) -> tuple[list[str], list[ProgressEvent]]:
+        """
+        Flush any partial line once the end of the stdout has been reached.
+
+        :returns:
+            A `tuple` containing:
+            - the lines which should be displayed;
+            - the progress events which have occurred.
+
+        """
+
+        line = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+
+        display_line, events = self._process_line(line.rstrip("\r"))
+        return ([display_line] if display_line is not None else []), events
@@ -0,0 +1,452 @@
+#!/usr/bin/python3.10
+########################################################################################
+# sweep.py - The parameter-sweep module for CLOVER-GUI application.                    #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import json
+import math
+import os
+import tkinter as tk
+
+from dataclasses import dataclass
+
+import ttkbootstrap as ttk
+
+from clover.optimisation.__utils__ import Criterion
+from ttkbootstrap.constants import *
+
+from .__utils__ import format_value, LOAD_LOCATION_GEOMETRY
+from .run_queue import JobStatus, RunJob
+
+__all__ = (
+    "read_sweep_results",
+    "SWEEP_CRITERIA",
+    "sweep_values",
+    "SweepPoint",
+    "SweepResultsWindow",
+)
+
+# Heatmap margin:
+#   The margin, in pixels, left around the heatmap for the axis labels.
+HEATMAP_MARGIN: int = 80
+
+# Info file name:
+#   The name of the file in which CLOVER saves the results of a simulation.
+INFO_FILE_NAME: str = "info_file.json"
+
+# Maximised criteria:
+#   Criteria for which a higher value is better and which are coloured accordingly.
+MAXIMISED_CRITERIA: set[Criterion] = {Criterion.RENEWABLES_ELECTRICITY_FRACTION}
+
+# Sweep criteria:
+#   The criteria gathered from each run of a sweep, along with their display names.
+SWEEP_CRITERIA: dict[Criterion, str] = {
+    Criterion.LCUE: "LCUE / currency/kWh",
+    Criterion.BLACKOUTS: "Blackouts fraction",
+    Criterion.RENEWABLES_ELECTRICITY_FRACTION: "Renewables fraction",
+    Criterion.TOTAL_COST: "Total cost / $",
+    Criterion.TOTAL_GHGS: "Total ghgs / kgCO2eq",
+}
+
+# Sweep poll interval:
+#   The interval, in milliseconds, at which the runs of a sweep are checked for results.
+SWEEP_POLL_INTERVAL: int = 1000
+
+# Sweep size columns:
+#   The columns of the results table which hold the component sizes of each run.
+SWEEP_SIZE_COLUMNS: tuple[str, str] = ("PV size / kWp", "Storage size / kWh")
+
+# Sweep status column:
+#   The column of the results table which holds the status of each run.
+SWEEP_STATUS_COLUMN: str = "Status"
+
+
+def read_sweep_results(output_directory: str) -> dict[Criterion, float | None] | None:
+    """
+    Read the key results of a simulation from its output directory.
+
+    :param: output_directory
+        The directory into which CLOVER saved the outputs from the run.
+
+    :returns:
+        A mapping between each of the :data:`SWEEP_CRITERIA` and its value, or `None`
+        if the results could not be read.
+
+    """
+
+    try:
+        with open(
+            os.path.join(output_directory, INFO_FILE_NAME), "r", encoding="utf-8"
+        ) as info_file:
+            info: dict = json.load(info_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    criteria = info.get("simulation_1", {}).get("system_appraisal", {}).get("criteria")
+    if not isinstance(criteria, dict):
+        return None
+
+    return {criterion: criteria.get(criterion.value) for criterion in SWEEP_CRITERIA}
+
+
+def sweep_values(minimum: float, maximum: float, step: float) -> list[float]:
+    """
+    Compute the values covered by a range.
+
+    :param: minimum
+        The first value in the range.
+
+    :param: maximum
+        The last value in the range, included if it is reached by a whole step.
+
+    :param: step
+        The step between successive values.
+
+    :returns:
+        The values in the range. Only the minimum is returned if the range is empty.
+
+    """
+
+    if step <= 0 or maximum <= minimum:
+        return [minimum]
+
+    return [
+        round(minimum + index * step, 6)
+        for index in range(math.floor((maximum - minimum) / step + 1e-9) + 1)
+    ]
+
+
+@dataclass
+class SweepPoint:
+    """
+    Represents a single run within a sweep.
+
+    .. attribute:: job
+        The :class:`RunJob` carrying out the run.
+
+    .. attribute:: pv_size
+        The PV size of the run, in kWp.
+
+    .. attribute:: storage_size
+        The storage size of the run, in kWh.
+
+    .. attribute:: results
+        The key results of the run, once available.
+
+    """
+
+    job: RunJob
+    pv_size: float
+    storage_size: float
+    results: dict[Criterion, float | None] | None = None
+
+
+def _interpolate_colour(start: str, end: str, fraction: float) -> str:
+    """
+    Linearly interpolate between two colours.
+
+    :param: start
+        The hex colour at a fraction of 0.
+
+    :param: end
+        The hex colour at a fraction of 1.
+
+    :param: fraction
+        The fraction of the way between the two colours.
+
+    :returns:
+        The interpolated hex colour.
+
+    """
+
+    start_rgb = [int(start[index : index + 2], 16) for index in (1, 3, 5)]
+    end_rgb = [int(end[index : index + 2], 16) for index in (1, 3, 5)]
+
+    return "#" + "".join(
+        f"{round(first + (second - first) * fraction):02x}"
+        for first, second in zip(start_rgb, end_rgb)
+    )
+
+
+class SweepResultsWindow(tk.Toplevel):
+    """
+    Represents the results of a PV and storage sweep.
+
+    The results of each run are gathered, as the runs complete, into a table which can
+    be sorted by clicking on its headings, and into a heatmap of a chosen criterion.
+
+    .. attribute:: points
+        The runs which make up the sweep.
+
+    """
+
+    def __init__(self, points: list[SweepPoint], title: str) -> None:
+        """
+        Instantiate a :class:`SweepResultsWindow` instance.
+
+        :param: points
+            The runs which make up the sweep.
+
+        :param: title
+            The title of the sweep.
+
+        """
+
+        super().__init__()
+
+        self.title(f"CLOVER-GUI Sweep: {title}")
+        self.geometry(LOAD_LOCATION_GEOMETRY)
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+        self.points: list[SweepPoint] = points
+        self.pv_sizes: list[float] = sorted({point.pv_size for point in points})
+        self.storage_sizes: list[float] = sorted(
+            {point.storage_size for point in points}
+        )
+
+        self._sort_column: str | None = None
+        self._sort_reverse: bool = False
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.results_notebook = ttk.Notebook(self, bootstyle=INFO)
+        self.results_notebook.grid(row=0, column=0, sticky="news", padx=20, pady=20)
+
+        # Results table
+        self.table_frame = ttk.Frame(self.results_notebook)
+        self.table_frame.columnconfigure(0, weight=1)
+        self.table_frame.rowconfigure(0, weight=1)
+        self.results_notebook.add(self.table_frame, text="Table")
+
+        self.columns: list[str] = [
+            *SWEEP_SIZE_COLUMNS,
+            SWEEP_STATUS_COLUMN,
+            *SWEEP_CRITERIA.values(),
+        ]
+        self.results_treeview = ttk.Treeview(
+            self.table_frame,
+            bootstyle=INFO,
+            columns=self.columns,
+            selectmode=BROWSE,
+            show="headings",
+        )
+        for column in self.columns:
+            self.results_treeview.heading(
+                column,
+                text=column,
+                anchor=W,
+                command=lambda column=column: self._sort_by(column),
+            )
+            self.results_treeview.column(column, width=110, minwidth=80, stretch=True)
+        self.results_treeview.grid(row=0, column=0, sticky="news")
+
+        self.results_scrollbar = ttk.Scrollbar(
+            self.table_frame, orient=VERTICAL, command=self.results_treeview.yview
+        )
+        self.results_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.results_treeview.configure(yscrollcommand=self.results_scrollbar.set)
+
+        for index, point in enumerate(self.points):
+            self.results_treeview.insert("", END, iid=str(index))
+
+        # Heatmap
+        self.heatmap_frame = ttk.Frame(self.results_notebook)
+        self.heatmap_frame.columnconfigure(0, weight=1)
+        self.heatmap_frame.rowconfigure(1, weight=1)
+        self.results_notebook.add(self.heatmap_frame, text="Heatmap")
+
+        self.heatmap_criterion = ttk.StringVar(
+            self, list(SWEEP_CRITERIA.values())[0], "heatmap_criterion"
+        )
+        self.heatmap_criterion_combobox = ttk.Combobox(
+            self.heatmap_frame,
+            bootstyle=INFO,
+            state=READONLY,
+            textvariable=self.heatmap_criterion,
+            values=list(SWEEP_CRITERIA.values()),
+        )
+        self.heatmap_criterion_combobox.grid(row=0, column=0, sticky="w", pady=10)
+        self.heatmap_criterion_combobox.bind(
+            "<<ComboboxSelected>>", lambda _: self.draw_heatmap()
+        )
+
+        self.heatmap_canvas = tk.Canvas(self.heatmap_frame, highlightthickness=0)
+        self.heatmap_canvas.grid(row=1, column=0, sticky="news")
+        self.heatmap_canvas.bind("<Configure>", lambda _: self.draw_heatmap())
+
+        self._poll()
+
+    def _poll(self) -> None:
+        """Gather the results of any newly-completed runs and refresh the display."""
+
+        for point in self.points:
+            if point.results is None and point.job.status == JobStatus.COMPLETED:
+                point.results = read_sweep_results(point.job.output_directory)
+
+        self.refresh()
+
+        if not all(point.job.finished for point in self.points):
+            self.after(SWEEP_POLL_INTERVAL, self._poll)
+
+    def _sort_by(self, column: str) -> None:
+        """
+        Sort the results table by a column, reversing the order if already sorted by it.
+
+        :param: column
+            The column to sort by.
+
+        """
+
+        self._sort_reverse = column == self._sort_column and not self._sort_reverse
+        self._sort_column = column
+        self.refresh()
+
+    def _sort_key(self, point: SweepPoint) -> tuple:
+        """
+        Return the key by which to sort a run within the results table.
+
+        Runs without a value for the sorted column are always placed last.
+
+        :param: point
+            The run to sort.
+
+        """
+
+        if (column := self._sort_column) is None:
+            return (0, 0)
+        if column == SWEEP_SIZE_COLUMNS[0]:
+            return (0, point.pv_size)
+        if column == SWEEP_SIZE_COLUMNS[1]:
+            return (0, point.storage_size)
+        if column == SWEEP_STATUS_COLUMN:
+            return (0, point.job.status.value)
+
+        criterion = list(SWEEP_CRITERIA)[list(SWEEP_CRITERIA.values()).index(column)]
+        if point.results is None or (value := point.results[criterion]) is None:
+            return (-1, 0) if self._sort_reverse else (1, 0)
+
+        return (0, value)
+
+    def draw_heatmap(self) -> None:
+        """Draw the heatmap of the selected criterion."""
+
+        self.heatmap_canvas.delete(ALL)
+
+        criterion = list(SWEEP_CRITERIA)[
+            list(SWEEP_CRITERIA.values()).index(self.heatmap_criterion.get())
+        ]
+        values: dict[tuple[float, float], float] = {
+            (point.pv_size, point.storage_size): value
+            for point in self.points
+            if point.results is not None
+            and (value := point.results[criterion]) is not None
+        }
+
+        width = self.heatmap_canvas.winfo_width() - HEATMAP_MARGIN
+        height = self.heatmap_canvas.winfo_height() - HEATMAP_MARGIN
+        if width <= 0 or height <= 0:
+            return
+
+        cell_width = width / len(self.pv_sizes)
+        cell_height = height / len(self.storage_sizes)
+        minimum = min(values.values(), default=0)
+        spread = max(values.values(), default=0) - minimum
+
+        colors = ttk.Style().colors
+        best, worst = (
+            (colors.danger, colors.success)
+            if criterion in MAXIMISED_CRITERIA
+            else (colors.success, colors.danger)
+        )
+
+        for row, storage_size in enumerate(reversed(self.storage_sizes)):
+            for column, pv_size in enumerate(self.pv_sizes):
+                x_0 = HEATMAP_MARGIN + column * cell_width
+                y_0 = row * cell_height
+                value = values.get((pv_size, storage_size))
+                self.heatmap_canvas.create_rectangle(
+                    x_0,
+                    y_0,
+                    x_0 + cell_width,
+                    y_0 + cell_height,
+                    fill=(
+                        colors.secondary
+                        if value is None
+                        else _interpolate_colour(
+                            best,
+                            worst,
+                            (value - minimum) / spread if spread > 0 else 0,
+                        )
+                    ),
+                    outline=colors.bg,
+                )
+                self.heatmap_canvas.create_text(
+                    x_0 + cell_width / 2,
+                    y_0 + cell_height / 2,
+                    fill=colors.selectfg,
+                    text=format_value(value),
+                )
+
+        # Axis labels
+        for column, pv_size in enumerate(self.pv_sizes):
+            self.heatmap_canvas.create_text(
+                HEATMAP_MARGIN + (column + 0.5) * cell_width,
+                height + HEATMAP_MARGIN / 4,
+                fill=colors.fg,
+                text=format_value(pv_size),
+            )
+        for row, storage_size in enumerate(reversed(self.storage_sizes)):
+            self.heatmap_canvas.create_text(
+                HEATMAP_MARGIN / 2,
+                (row + 0.5) * cell_height,
+                fill=colors.fg,
+                text=format_value(storage_size),
+            )
+        self.heatmap_canvas.create_text(
+            HEATMAP_MARGIN + width / 2,
+            height + HEATMAP_MARGIN * 3 / 4,
+            fill=colors.fg,
+            text=SWEEP_SIZE_COLUMNS[0],
+        )
+        self.heatmap_canvas.create_text(
+            HEATMAP_MARGIN / 4,
+            height / 2,
+            angle=90,
+            fill=colors.fg,
+            text=SWEEP_SIZE_COLUMNS[1],
+        )
+
+    def refresh(self) -> None:
+        """Refresh the results table and heatmap."""
+
+        for index, point in sorted(
+            enumerate(self.points),
+            key=lambda entry: self._sort_key(entry[1]),
+            reverse=self._sort_reverse,
+        ):
+            self.results_treeview.item(
+                str(index),
+                values=(
+                    format_value(point.pv_size),
+                    format_value(point.storage_size),
+                    point.job.status.value.capitalize(),
+                    *(
+                        format_value(
+                            point.results[criterion]
+                            if point.results is not None
+                            else None
+                        )
+                        for criterion in SWEEP_CRITERIA
+                    ),
+                ),
+            )
+            self.results_treeview.move(str(index), "", END)
+
+        self.draw_heatmap()
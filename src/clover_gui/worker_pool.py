@@ -0,0 +1,433 @@
+#!/usr/bin/python3.10
+########################################################################################
+# worker_pool.py - The CLOVER worker-pool module for CLOVER-GUI application.           #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import io
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import traceback
+
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from clover.scripts.clover import clover_main
+
+__all__ = (
+    "CloverWorkerPool",
+    "CloverWorkerRun",
+    "get_worker_pool",
+    "shutdown_worker_pool",
+)
+
+# Exit:
+#   Keyword used for messages sent by a worker once a run has finished.
+_EXIT: str = "exit"
+
+# Output:
+#   Keyword used for messages containing the output of a run.
+_OUTPUT: str = "output"
+
+# Warm workers:
+#   The number of idle workers which are kept ready to start a run.
+WARM_WORKERS: int = 2
+
+# Worker max runs:
+#   The number of runs after which a worker is retired and replaced, so that any state
+#   which builds up within CLOVER between runs is cleared.
+WORKER_MAX_RUNS: int = 20
+
+# Worker pool:
+#   The worker pool used by the application, created when first needed.
+_WORKER_POOL: "CloverWorkerPool | None" = None
+
+
+class _ConnectionWriter(io.RawIOBase):
+    """
+    A raw stream which sends everything written to it over a connection.
+
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Instantiate a :class:`_ConnectionWriter` instance.
+
+        :param: connection
+            The connection over which to send output.
+
+        """
+
+        super().__init__()
+        self._connection = connection
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._connection.send((_OUTPUT, bytes(data)))
+        return len(data)
+
+
+def _reset_logging() -> None:
+    """
+    Remove the handlers which CLOVER attaches to its loggers during a run.
+
+    CLOVER adds new handlers to its loggers each time that it runs. These are removed
+    between runs so that each run only logs once and so that log files are closed.
+
+    """
+
+    for logger in logging.Logger.manager.loggerDict.values():
+        if not isinstance(logger, logging.Logger):
+            continue
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def _worker_main(connection: Connection) -> None:
+    """
+    The main loop of a worker process.
+
+    CLOVER is imported once, when the worker starts, after which the worker carries out
+    runs as it receives them, sending the stdout and stderr of each back over the
+    connection followed by an exit code.
+
+    :param: connection
+        The worker's end of the connection to the GUI.
+
+    """
+
+    # CLOVER prompts for input in some cases, which should fail rather than hang.
+    sys.stdin = open(os.devnull, "r", encoding="utf-8")
+
+    while True:
+        try:
+            clover_args: list[str] | None = connection.recv()
+        except EOFError:
+            return
+
+        if clover_args is None:
+            return
+
+        sys.stdout = sys.stderr = io.TextIOWrapper(
+            io.BufferedWriter(_ConnectionWriter(connection)),
+            encoding="utf-8",
+            errors="replace",
+            line_buffering=True,
+        )
+
+        try:
+            clover_main(clover_args)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except BaseException:  # pylint: disable=broad-except
+            traceback.print_exc()
+            exit_code = 1
+        else:
+            exit_code = 0
+        finally:
+            sys.stdout.flush()
+            sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+            _reset_logging()
+
+        connection.send((_EXIT, exit_code))
+
+
+class _Worker:
+    """
+    Represents a long-lived worker process which carries out CLOVER runs.
+
+    .. attribute:: connection
+        The GUI's end of the connection to the worker.
+
+    .. attribute:: process
+        The worker process.
+
+    .. attribute:: runs
+        The number of runs which the worker has started.
+
+    """
+
+    def __init__(self, context: multiprocessing.context.BaseContext) -> None:
+        """
+        Instantiate a :class:`_Worker` instance, starting its process.
+
+        :param: context
+            The multiprocessing context with which to start the process.
+
+        """
+
+        self.connection, worker_connection = context.Pipe()
+        self.process: BaseProcess = context.Process(
+            target=_worker_main, args=(worker_connection,), daemon=True
+        )
+        self.process.start()
+        worker_connection.close()
+
+        self.runs: int = 0
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is still running."""
+
+        return self.process.is_alive()
+
+    def shutdown(self) -> None:
+        """Ask the worker to exit once it is idle."""
+
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+        self.connection.close()
+
+
+class CloverWorkerRun:
+    """
+    Represents a CLOVER run taking place in a worker process.
+
+    The run exposes the parts of the :class:`subprocess.Popen` interface which are used
+    for CLOVER runs, so that it can be used in place of a CLOVER subprocess.
+
+    .. attribute:: returncode
+        The exit code of the run, or `None` if the run is still in progress.
+
+    .. attribute:: stdout
+        A binary stream from which the combined stdout and stderr of the run is read.
+
+    """
+
+    def __init__(
+        self, worker: _Worker, clover_args: list[str], release_worker
+    ) -> None:
+        """
+        Instantiate a :class:`CloverWorkerRun` instance, starting the run.
+
+        :param: worker
+            The worker in which to carry out the run.
+
+        :param: clover_args
+            The arguments to pass to CLOVER.
+
+        :param: release_worker
+            A callable function which returns the worker to the pool once the run has
+            finished successfully.
+
+        """
+
+        self.returncode: int | None = None
+
+        self._lock = threading.Lock()
+        self._release_worker = release_worker
+        self._worker = worker
+
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "rb", buffering=0)
+
+        worker.runs += 1
+        worker.connection.send(clover_args)
+
+        self._forwarding_thread = threading.Thread(
+            target=self._forward_output, daemon=True
+        )
+        self._forwarding_thread.start()
+
+    def _forward_output(self) -> None:
+        """
+        Forward the output of the worker into the stdout pipe until the run finishes.
+
+        """
+
+        worker_idle: bool = False
+        try:
+            while True:
+                message_type, content = self._worker.connection.recv()
+                if message_type == _OUTPUT:
+                    os.write(self._write_fd, content)
+                    continue
+
+                returncode: int = content
+                worker_idle = True
+                break
+
+        # The worker process exited, or was killed, part-way through the run.
+        except (EOFError, OSError):
+            self._worker.process.join(timeout=1)
+            returncode = (
+                self._worker.process.exitcode
+                if self._worker.process.exitcode is not None
+                else -signal.SIGKILL
+            )
+
+        os.close(self._write_fd)
+        with self._lock:
+            self.returncode = returncode
+
+        # The worker is only returned to the pool once the run can no longer kill it.
+        if worker_idle:
+            self._release_worker(self._worker)
+
+    def kill(self) -> None:
+        """Stop the run by killing the worker process in which it is running."""
+
+        with self._lock:
+            if self.returncode is None:
+                self._worker.process.kill()
+
+    def poll(self) -> int | None:
+        """
+        Check whether the run has finished.
+
+        :returns:
+            The exit code of the run, or `None` if the run is still in progress.
+
+        """
+
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        """
+        Wait for the run to finish.
+
+        :param: timeout
+            The maximum time to wait, in seconds.
+
+        :returns:
+            The exit code of the run, or `None` if the run is still in progress.
+
+        """
+
+        self._forwarding_thread.join(timeout)
+        return self.returncode
+
+
+class CloverWorkerPool:
+    """
+    Maintains a pool of warm worker processes in which CLOVER runs are carried out.
+
+    Each worker imports CLOVER once and then carries out runs on request, so that runs
+    start without waiting for a new interpreter to start and import CLOVER. Runs remain
+    isolated from the GUI process, so that a crash or a cancelled run only affects the
+    worker in which it was running.
+
+    .. attribute:: warm_workers
+        The number of idle workers to keep ready.
+
+    """
+
+    def __init__(self, warm_workers: int = WARM_WORKERS) -> None:
+        """
+        Instantiate a :class:`CloverWorkerPool` instance, starting its workers.
+
+        :param: warm_workers
+            The number of idle workers to keep ready.
+
+        """
+
+        # Forking a process which is running tkinter is unsafe, so workers are spawned.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: list[_Worker] = []
+        self._lock = threading.Lock()
+
+        self.warm_workers: int = warm_workers
+
+        self._replenish()
+
+    def _release(self, worker: _Worker) -> None:
+        """
+        Return a worker to the pool once it has finished a run.
+
+        :param: worker
+            The worker to return.
+
+        """
+
+        with self._lock:
+            if (
+                worker.runs < WORKER_MAX_RUNS
+                and len(self._idle_workers) < self.warm_workers
+            ):
+                self._idle_workers.append(worker)
+                return
+
+        worker.shutdown()
+
+    def _replenish(self) -> None:
+        """Start new workers until the number of idle workers is reached."""
+
+        with self._lock:
+            self._idle_workers = [
+                worker for worker in self._idle_workers if worker.alive
+            ]
+            for _ in range(self.warm_workers - len(self._idle_workers)):
+                self._idle_workers.append(_Worker(self._context))
+
+    def run(self, clover_args: list[str]) -> CloverWorkerRun:
+        """
+        Carry out a CLOVER run in a worker process.
+
+        :param: clover_args
+            The arguments to pass to CLOVER.
+
+        :returns:
+            The :class:`CloverWorkerRun` representing the run.
+
+        """
+
+        with self._lock:
+            while len(self._idle_workers) > 0:
+                if (worker := self._idle_workers.pop(0)).alive:
+                    break
+            else:
+                worker = _Worker(self._context)
+
+        clover_run = CloverWorkerRun(worker, clover_args, self._release)
+        self._replenish()
+
+        return clover_run
+
+    def shutdown(self) -> None:
+        """Shut down all idle workers."""
+
+        with self._lock:
+            for worker in self._idle_workers:
+                worker.shutdown()
+            self._idle_workers = []
+
+
+def get_worker_pool() -> CloverWorkerPool:
+    """
+    Return the worker pool, starting it if it has not yet been started.
+
+    :returns:
+        The :class:`CloverWorkerPool` used for CLOVER runs.
+
+    """
+
+    global _WORKER_POOL
+
+    if _WORKER_POOL is None:
+        _WORKER_POOL = CloverWorkerPool()
+
+    return _WORKER_POOL
+
+
+def shutdown_worker_pool() -> None:
+    """Shut down the worker pool if it has been started."""
+
+    global _WORKER_POOL
+
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.shutdown()
+        _WORKER_POOL = None
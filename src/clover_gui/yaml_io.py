@@ -0,0 +1,139 @@
+#!/usr/bin/python3.10
+########################################################################################
+# yaml_io.py - The YAML input/output module for CLOVER-GUI application.                #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import collections
+import enum
+
+from logging import Logger
+from typing import Any, IO
+
+import numpy as np
+import yaml
+
+from yaml.representer import SafeRepresenter
+
+# Use the libyaml-backed loader and dumper where PyYAML has been built against libyaml.
+try:
+    from yaml import CSafeDumper as _BaseDumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper, SafeLoader as _Loader  # type: ignore
+
+__all__ = (
+    "dump_yaml",
+    "LIBYAML_AVAILABLE",
+    "load_yaml",
+    "read_yaml",
+    "write_yaml",
+)
+
+# libyaml available:
+#   Whether the libyaml-backed loader and dumper are being used.
+LIBYAML_AVAILABLE: bool = _Loader is not yaml.SafeLoader
+
+
+class _Dumper(_BaseDumper):  # pylint: disable=too-many-ancestors
+    """
+    Dumps YAML with safe tags only.
+
+    Mappings and sequences built by the GUI, such as `defaultdict`s and `tuple`s, are
+    written as plain YAML mappings and sequences so that CLOVER can read them. Values
+    held in the frames as :mod:`numpy` scalars or arrays, or as enums, are written as
+    the native values which they hold.
+
+    """
+
+
+_Dumper.add_representer(collections.defaultdict, SafeRepresenter.represent_dict)
+_Dumper.add_representer(collections.OrderedDict, SafeRepresenter.represent_dict)
+_Dumper.add_representer(tuple, SafeRepresenter.represent_list)
+_Dumper.add_multi_representer(
+    enum.Enum, lambda dumper, data: dumper.represent_data(data.value)
+)
+_Dumper.add_multi_representer(
+    np.generic, lambda dumper, data: dumper.represent_data(data.item())
+)
+_Dumper.add_representer(
+    np.ndarray, lambda dumper, data: dumper.represent_list(data.tolist())
+)
+
+
+def dump_yaml(data: Any, stream: IO[str] | None = None) -> str | None:
+    """
+    Serialise data as YAML.
+
+    The output is identical whether or not libyaml is available.
+
+    :param: data
+        The data to serialise.
+
+    :param: stream
+        The stream to write to, if any.
+
+    :returns:
+        The YAML text if no stream was given, or `None` otherwise.
+
+    """
+
+    return yaml.dump(data, stream, Dumper=_Dumper)
+
+
+def load_yaml(stream: str | IO[str]) -> Any:
+    """
+    Parse YAML, resolving only the standard YAML tags.
+
+    :param: stream
+        The YAML text, or a stream from which to read it.
+
+    :returns:
+        The parsed data.
+
+    """
+
+    return yaml.load(stream, Loader=_Loader)
+
+
+def read_yaml(filepath: str, logger: Logger) -> Any:
+    """
+    Read a YAML file and return its contents.
+
+    :param: filepath
+        The path to the file.
+
+    :param: logger
+        The :class:`logging.Logger` to use.
+
+    :returns:
+        The contents of the file.
+
+    """
+
+    try:
+        with open(filepath, "r", encoding="utf-8") as yaml_file:
+            return load_yaml(yaml_file)
+    except FileNotFoundError:
+        logger.error("The file specified, %s, could not be found.", filepath)
+        raise
+
+
+def write_yaml(data: Any, filepath: str) -> None:
+    """
+    Write data to a YAML file.
+
+    :param: data
+        The data to write.
+
+    :param: filepath
+        The path to the file.
+
+    """
+
+    with open(filepath, "w", encoding="utf-8") as yaml_file:
+        dump_yaml(data, yaml_file)
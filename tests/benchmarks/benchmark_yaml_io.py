@@ -0,0 +1,151 @@
+#!/usr/bin/python3.10
+########################################################################################
+# benchmark_yaml_io.py - Benchmarks the YAML input/output of the CLOVER-GUI app.       #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+"""
+Compares the libyaml-backed and pure-Python YAML paths of :mod:`clover_gui.yaml_io`.
+
+Run with `python tests/benchmarks/benchmark_yaml_io.py`.
+
+"""
+
+import collections
+import timeit
+
+from typing import Any
+
+import yaml
+
+from yaml.representer import SafeRepresenter
+
+from clover_gui.yaml_io import dump_yaml, LIBYAML_AVAILABLE, load_yaml
+
+# Benchmark repeats:
+#   The number of times each benchmark is repeated, the fastest time being reported.
+BENCHMARK_REPEATS: int = 3
+
+
+def _synthetic_location(size: int) -> dict[str, Any]:
+    """
+    Generate the inputs of a large synthetic location for benchmarking.
+
+    :param: size
+        The number of devices, panels and batteries to generate.
+
+    :returns:
+        The synthetic inputs.
+
+    """
+
+    return {
+        "batteries": [
+            {
+                "name": f"battery_{index}",
+                "maximum_charge": 0.9,
+                "minimum_charge": 0.4,
+                "leakage": 0.004,
+                "conversion_in": 0.95,
+                "conversion_out": 0.95,
+                "cycle_lifetime": 1500 + index,
+                "lifetime_loss": 0.2,
+                "c_rate_charging": 0.33,
+                "c_rate_discharging": 0.33,
+                "costs": {"cost": 400.0 + index, "cost_decrease": 5, "o&m": 10},
+                "emissions": {"ghgs": 110.0, "ghg_decrease": 5, "o&m": 5},
+            }
+            for index in range(size)
+        ],
+        "devices": [
+            {
+                "device": f"device_{index}",
+                "available": index % 2 == 0,
+                "electric_power": 10 * index,
+                "initial_ownership": 0.5,
+                "final_ownership": 0.9,
+                "innovation": 0.03,
+                "imitation": 0.5,
+                "type": "domestic",
+            }
+            for index in range(size)
+        ],
+        "panels": [
+            {
+                "name": f"pv_{index}",
+                "type": "pv",
+                "azimuthal_orientation": 180,
+                "lifetime": 20,
+                "reference_efficiency": 0.15,
+                "reference_temperature": 25,
+                "thermal_coefficient": 0.0053,
+                "tilt": 29,
+                "costs": {"cost": 500.0, "cost_decrease": 5, "o&m": 5},
+                "emissions": {"ghgs": 3000.0, "ghg_decrease": 5, "o&m": 5},
+            }
+            for index in range(size)
+        ],
+    }
+
+
+def benchmark(size: int = 2000) -> None:
+    """
+    Compare the speed of the libyaml-backed and pure-Python YAML paths.
+
+    The benchmark serialises and parses a large synthetic location with each path and
+    checks that both produce the same output.
+
+    :param: size
+        The number of devices, panels and batteries in the synthetic location.
+
+    """
+
+    class _PythonDumper(yaml.SafeDumper):  # pylint: disable=too-many-ancestors
+        """The pure-Python equivalent of the dumper used by :func:`dump_yaml`."""
+
+    _PythonDumper.add_representer(
+        collections.defaultdict, SafeRepresenter.represent_dict
+    )
+    _PythonDumper.add_representer(
+        collections.OrderedDict, SafeRepresenter.represent_dict
+    )
+    _PythonDumper.add_representer(tuple, SafeRepresenter.represent_list)
+
+    data = _synthetic_location(size)
+    text = dump_yaml(data)
+    python_text = yaml.dump(data, Dumper=_PythonDumper)
+
+    print(f"libyaml available: {LIBYAML_AVAILABLE}")
+    print(f"Synthetic location: {size} entries each, {len(text) / 1e6:.1f} MB")
+    print(f"Identical output: {text == python_text}")
+    print(f"Round-trips byte-identically: {dump_yaml(load_yaml(text)) == text}")
+
+    for label, function, python_function in (
+        (
+            "dump",
+            lambda: dump_yaml(data),
+            lambda: yaml.dump(data, Dumper=_PythonDumper),
+        ),
+        (
+            "load",
+            lambda: load_yaml(text),
+            lambda: yaml.load(text, Loader=yaml.SafeLoader),
+        ),
+    ):
+        time = min(timeit.repeat(function, number=1, repeat=BENCHMARK_REPEATS))
+        python_time = min(
+            timeit.repeat(python_function, number=1, repeat=BENCHMARK_REPEATS)
+        )
+        print(
+            f"{label}: {time:.3f} s, pure Python {python_time:.3f} s, "
+            f"speedup {python_time / time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
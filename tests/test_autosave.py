@@ -0,0 +1,154 @@
+#!/usr/bin/python3.10
+########################################################################################
+# test_autosave.py - Tests for the autosave module of the CLOVER-GUI application.      #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import logging
+import threading
+import unittest
+
+from typing import Callable
+
+from clover_gui.autosave import Autosaver
+
+# Sources:
+#   The names of the input files edited by the frames watched.
+SOURCES: tuple[str, ...] = ("finance", "ghg", "solar")
+
+
+class _FakeEvent:
+    """Represents an event raised within a widget."""
+
+    def __init__(self, widget: str) -> None:
+        self.widget = widget
+
+
+class _FakeWidget:
+    """Represents a toplevel widget whose callbacks are run by the test."""
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, Callable] = {}
+        self._next_id: int = 0
+
+    def __str__(self) -> str:
+        return "."
+
+    def after(self, _: int, callback: Callable) -> str:
+        self._next_id += 1
+        self._callbacks[(after_id := f"after#{self._next_id}")] = callback
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self._callbacks.pop(after_id, None)
+
+    def bind(self, *_, **__) -> None:
+        pass
+
+    def run_callbacks(self) -> None:
+        callbacks, self._callbacks = self._callbacks, {}
+        for callback in callbacks.values():
+            callback()
+
+    def winfo_toplevel(self) -> "_FakeWidget":
+        return self
+
+
+class _WatchedFrame:
+    """Represents a frame, within the fake toplevel, which is watched."""
+
+    def __init__(self, toplevel: _FakeWidget, name: str) -> None:
+        self._path = f".{name}"
+        self._toplevel = toplevel
+
+    def __str__(self) -> str:
+        return self._path
+
+    def winfo_toplevel(self) -> _FakeWidget:
+        return self._toplevel
+
+
+class _SlowInputFileWriter:
+    """Records the files written, blocking the first write until released."""
+
+    def __init__(self) -> None:
+        self.first_write_started = threading.Event()
+        self.release_first_write = threading.Event()
+        self.written: dict[str, str] = {}
+
+    def write(self, filepath: str, contents: str) -> bool:
+        if not self.first_write_started.is_set():
+            self.first_write_started.set()
+            self.release_first_write.wait(5)
+        self.written[filepath] = contents
+        return True
+
+
+class TestAutosaver(unittest.TestCase):
+    """Tests the :class:`Autosaver` instance."""
+
+    def setUp(self) -> None:
+        """Set up an autosaver watching three frames, each editing one file."""
+
+        super().setUp()
+        self.toplevel = _FakeWidget()
+        self.writer = _SlowInputFileWriter()
+        self.autosaver = Autosaver(
+            self.toplevel,
+            lambda dirty: {
+                f"{source}.yaml": {"source": source}
+                for source in (SOURCES if dirty is None else dirty)
+            },
+            self.writer,
+            logging.getLogger(__name__),
+        )
+        for source in SOURCES:
+            self.autosaver.watch(_WatchedFrame(self.toplevel, source), {source})
+
+    def test_edits_during_slow_write_are_saved(self) -> None:
+        """Tests that edits made whilst a slow write is in progress are all saved."""
+
+        # Edit the solar inputs and start saving them, which blocks.
+        self.autosaver._edited(_FakeEvent(".solar.entry"))
+        self.toplevel.run_callbacks()
+        self.assertTrue(self.writer.first_write_started.wait(5))
+
+        # Edit the finance inputs and pass them to the background thread to save.
+        self.autosaver._edited(_FakeEvent(".finance.entry"))
+        self.toplevel.run_callbacks()
+
+        # Edit the GHG inputs and save immediately, once the first write finishes.
+        self.autosaver._edited(_FakeEvent(".ghg.entry"))
+        threading.Timer(0.1, self.writer.release_first_write.set).start()
+        self.autosaver.save_now()
+
+        self.assertEqual(
+            set(self.writer.written), {"finance.yaml", "ghg.yaml", "solar.yaml"}
+        )
+        self.autosaver.stop()
+
+    def test_only_edited_files_are_saved(self) -> None:
+        """Tests that only the files of the frames edited are saved."""
+
+        self.writer.first_write_started.set()
+        self.autosaver._edited(_FakeEvent(".ghg.entry"))
+        self.autosaver.save_now()
+
+        self.assertEqual(set(self.writer.written), {"ghg.yaml"})
+        self.autosaver.stop()
+
+    def test_explicit_save_includes_files_not_edited(self) -> None:
+        """Tests that saving all sources includes files changed other than by edits."""
+
+        self.writer.first_write_started.set()
+        self.autosaver.save_now(all_sources=True)
+
+        self.assertEqual(
+            set(self.writer.written), {"finance.yaml", "ghg.yaml", "solar.yaml"}
+        )
+        self.autosaver.stop()
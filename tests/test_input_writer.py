@@ -0,0 +1,85 @@
+#!/usr/bin/python3.10
+########################################################################################
+# test_input_writer.py - Tests for the input-writer module of the CLOVER-GUI app.      #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import os
+import stat
+import tempfile
+import unittest
+
+from clover_gui.input_writer import (
+    atomic_write,
+    digest_input_files,
+    InputFileWriter,
+    NEW_FILE_MODE,
+)
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests the :func:`atomic_write` function."""
+
+    def setUp(self) -> None:
+        """Create a directory in which to write files."""
+
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "inputs.yaml")
+
+    def tearDown(self) -> None:
+        """Remove the directory."""
+
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_existing_mode_is_kept(self) -> None:
+        """Tests that rewriting a file keeps its mode."""
+
+        atomic_write(self.filepath, "old")
+        os.chmod(self.filepath, 0o644)
+        atomic_write(self.filepath, "new")
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.filepath).st_mode), 0o644)
+        with open(self.filepath, "r", encoding="utf-8") as written_file:
+            self.assertEqual(written_file.read(), "new")
+
+    def test_new_file_follows_umask(self) -> None:
+        """Tests that a new file is given the mode which `open` would give it."""
+
+        atomic_write(self.filepath, "new")
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.filepath).st_mode), NEW_FILE_MODE)
+
+
+class TestInputFileWriter(unittest.TestCase):
+    """Tests the :class:`InputFileWriter` instance."""
+
+    def setUp(self) -> None:
+        """Create a directory holding an input file."""
+
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "inputs.yaml")
+        with open(self.filepath, "w", encoding="utf-8") as input_file:
+            input_file.write("key: value\n")
+
+    def tearDown(self) -> None:
+        """Remove the directory."""
+
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_files_digested_on_disk_are_clean(self) -> None:
+        """Tests that only contents differing from those on disk are written."""
+
+        writer = InputFileWriter()
+        writer.mark_files_clean(digest_input_files([self.filepath]))
+
+        self.assertFalse(writer.write(self.filepath, "key: value\n"))
+        self.assertTrue(writer.write(self.filepath, "key: other\n"))
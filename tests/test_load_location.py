@@ -0,0 +1,77 @@
+#!/usr/bin/python3.10
+########################################################################################
+# test_load_location.py - Tests for the load-location module of the CLOVER-GUI app.    #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import logging
+import unittest
+
+from unittest import mock
+
+from clover_gui import load_location
+
+
+class TestPrivateParserResult(unittest.TestCase):
+    """Tests the :func:`_private_parser_result` helper."""
+
+    def test_expected_values_are_returned(self) -> None:
+        """Tests that the values of a parser are returned when as expected."""
+
+        self.assertEqual(
+            load_location._private_parser_result(lambda *args: args, 2, "a", "b"),
+            ("a", "b"),
+        )
+
+    def test_missing_parser_is_unsupported(self) -> None:
+        """Tests that a parser which CLOVER does not provide is unsupported."""
+
+        with self.assertRaises(load_location._UnsupportedCloverError):
+            load_location._private_parser_result(None, 2)
+
+    def test_changed_parser_is_unsupported(self) -> None:
+        """Tests that a parser returning too many or too few values is unsupported."""
+
+        def _parser() -> tuple:
+            return ("filepath", [], "extra")
+
+        with self.assertRaises(load_location._UnsupportedCloverError):
+            load_location._private_parser_result(_parser, 2)
+
+
+class TestParseLocationInputs(unittest.TestCase):
+    """Tests the :func:`parse_location_inputs` function."""
+
+    def test_falls_back_to_full_parse(self) -> None:
+        """Tests that all inputs are parsed if the private parsers are unsupported."""
+
+        logger = logging.getLogger(__name__)
+        with mock.patch.object(
+            load_location,
+            "_parse_displayed_inputs",
+            side_effect=load_location._UnsupportedCloverError("changed"),
+        ), mock.patch.object(
+            load_location, "_parse_all_inputs", return_value=mock.sentinel.inputs
+        ) as parse_all_inputs:
+            inputs = load_location.parse_location_inputs("location", logger)
+
+        self.assertIs(inputs, mock.sentinel.inputs)
+        parse_all_inputs.assert_called_once_with("location", logger)
+
+    def test_input_errors_are_not_hidden(self) -> None:
+        """Tests that errors in the inputs themselves are raised, not parsed again."""
+
+        with mock.patch.object(
+            load_location, "_parse_displayed_inputs", side_effect=ValueError("bad")
+        ), mock.patch.object(load_location, "_parse_all_inputs") as parse_all_inputs:
+            with self.assertRaises(ValueError):
+                load_location.parse_location_inputs(
+                    "location", logging.getLogger(__name__)
+                )
+
+        parse_all_inputs.assert_not_called()
@@ -0,0 +1,60 @@
+#!/usr/bin/python3.10
+########################################################################################
+# test_yaml_io.py - Tests for the YAML input/output module of the CLOVER-GUI app.      #
+#                                                                                      #
+# Author: Ben Winchester, Hamish Beath                                                 #
+# Copyright: Ben Winchester, 2022                                                      #
+# Date created: 16/10/2026                                                             #
+# License: MIT, Open-source                                                            #
+# For more information, contact: benedict.winchester@gmail.com                         #
+########################################################################################
+
+import collections
+import enum
+import unittest
+
+import numpy as np
+
+from clover_gui.yaml_io import dump_yaml, load_yaml
+
+
+class _Colour(enum.Enum):
+    """An enum, such as those whose values the frames hold."""
+
+    RED = "red"
+
+
+class TestDumpYaml(unittest.TestCase):
+    """Tests the :func:`dump_yaml` function."""
+
+    def test_containers_are_plain(self) -> None:
+        """Tests that `defaultdict`s and `tuple`s are written as plain YAML."""
+
+        data = collections.defaultdict(float, {"costs": (1.0, 2.0)})
+
+        self.assertEqual(dump_yaml(data), "costs:\n- 1.0\n- 2.0\n")
+
+    def test_enums_are_native(self) -> None:
+        """Tests that enums are written as their values."""
+
+        self.assertEqual(
+            load_yaml(dump_yaml({"colour": _Colour.RED})), {"colour": "red"}
+        )
+
+    def test_numpy_values_are_native(self) -> None:
+        """Tests that numpy scalars and arrays are written as native values."""
+
+        data = {
+            "available": np.bool_(True),
+            "capacity": np.int64(3),
+            "cost": np.float64(400.5),
+            "profile": np.array([0.5, 1.0]),
+        }
+
+        text = dump_yaml(data)
+
+        self.assertNotIn("!!", text)
+        self.assertEqual(
+            load_yaml(text),
+            {"available": True, "capacity": 3, "cost": 400.5, "profile": [0.5, 1.0]},
+        )